@@ -4,15 +4,35 @@ Flask API for Tsunami Detection Model
 REST API endpoint for real-time tsunami prediction
 """
 
-from flask import Flask, request, jsonify, send_file, make_response
+from flask import Flask, request, jsonify, send_file, make_response, Response, stream_with_context
 from flask_cors import CORS
-import tensorflow as tf
 import numpy as np
 import json
+import os
+import time
 from pathlib import Path
 import logging
 from datetime import datetime, timedelta
-import requests as http_requests
+import yaml
+
+from src.serving import (
+    MicroBatcher, DEFAULT_BUCKETS, BackgroundModelLoader, ModelNotReady, ModelLoadError, PredictionCache,
+    ContentAddressedCache, content_key, init_http_caching, make_etag, etag_matches, not_modified,
+    resolve_worker_settings, FORK_SAFE_BACKENDS, ModelRegistry
+)
+from src.serving.backends import load_backend, backend_model_path
+from src.data_collection.http_client import get_shared_client
+from src.data_collection.usgs_poller import get_shared_poller
+from src.data_collection.wave_stations import collect_wave_data, WaveStationCache
+from src.serving.seismic_patterns import complete_mask, create_seismic_patterns
+from src.serving.payloads import (
+    PayloadError, JSON_CONTENT_TYPE, RESPONSE_CONTENT_TYPES,
+    canonical_content_type, decode_tensor_request, encode_prediction_response
+)
+from src.serving.streaming import (
+    NDJSON_CONTENT_TYPE, FRAMES_CONTENT_TYPE, END_OF_STREAM_FRAME, canonical_stream_type,
+    iter_ndjson_samples, iter_frame_samples, iter_chunks, encode_ndjson_line, encode_frame
+)
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -24,36 +44,396 @@ CORS(app)
 
 # Load model
 MODEL_PATH = Path('./models/tsunami_detection_binary_focal.keras')
-METADATA_PATH = Path('./models/model_metadata.json')
+CONFIG_PATH = Path('./config/config.yaml')
 
+# Load configuration
 try:
-    # Load model weights only (without custom loss function)
-    # This bypasses the custom loss deserialization issue
-    model = tf.keras.models.load_model(str(MODEL_PATH), compile=False)
-    # Compile with standard binary crossentropy for inference
-    model.compile(optimizer='adam', loss='binary_crossentropy', metrics=['accuracy'])
-    logger.info(f"✓ Model loaded from {MODEL_PATH} (weights only, compiled with binary_crossentropy)")
+    with open(CONFIG_PATH, 'r') as f:
+        config = yaml.safe_load(f) or {}
 except Exception as e:
-    logger.error(f"✗ Failed to load model: {e}")
-    model = None
+    logger.warning(f"Could not load config from {CONFIG_PATH}: {e}")
+    config = {}
+serving_config = config.get('serving', {})
 
-# Load metadata
-try:
-    with open(METADATA_PATH, 'r') as f:
-        metadata = json.load(f)
-    logger.info(f"✓ Metadata loaded from {METADATA_PATH}")
-except Exception as e:
-    logger.error(f"✗ Failed to load metadata: {e}")
-    metadata = None
+# gzip/brotli compression, strong ETags and 304s for every GET (serving.http_caching)
+init_http_caching(app, serving_config.get('http_caching', {}))
+
+# Pooled keep-alive HTTP client shared by every upstream fetch (system.http)
+http_client = get_shared_client(config)
+# Non-blocking client for the native async routes; set by asgi.py when served over ASGI
+async_http_client = None
+
+# Inference backend: keras (default), onnx or tflite. ONNX/TFLite serve the
+# exported artifacts next to MODEL_PATH and never import TensorFlow.
+INFERENCE_BACKEND = os.environ.get('INFERENCE_BACKEND') or serving_config.get('backend', 'keras')
+# Optional artifact variant, e.g. 'int8' for the quantized TFLite model
+MODEL_VARIANT = os.environ.get('MODEL_VARIANT') or serving_config.get('model_variant')
+
+# Lazy loading: bind immediately and load the model on a background thread
+lazy_loading_config = serving_config.get('lazy_loading', {})
+LAZY_MODEL_LOADING = (
+    os.environ['LAZY_MODEL_LOADING'].lower() in ('1', 'true', 'yes')
+    if 'LAZY_MODEL_LOADING' in os.environ
+    else bool(lazy_loading_config.get('enabled', False))
+)
+MODEL_WAIT_TIMEOUT = float(lazy_loading_config.get('wait_timeout_seconds', 30))
+
+# Pre-fork serving: gunicorn.conf.py sets PREFORK_SERVER, model thread pools
+# are sized for the worker count (serving.workers)
+PREFORK_SERVER = os.environ.get('PREFORK_SERVER', '').lower() in ('1', 'true', 'yes')
+worker_settings = resolve_worker_settings(serving_config.get('workers', {}),
+                                          workers=None if PREFORK_SERVER else 1)
+# With preload the master imports this module once before forking the workers
+# (see prepare_fork/after_fork). ONNX/TFLite weights are loaded there and shared
+# copy-on-write; TensorFlow does not survive fork, so a Keras model loads per worker.
+PRELOADED = PREFORK_SERVER and worker_settings['preload']
+LOAD_MODEL_AFTER_FORK = PRELOADED and INFERENCE_BACKEND.lower() not in FORK_SAFE_BACKENDS
+
+# Seed each /live-data pattern from its USGS event id so scores are stable across refreshes
+SEEDED_PATTERNS = bool(serving_config.get('seeded_patterns', True))
+
+# /wave-data deadlines: per station and for the whole fan-out
+wave_data_config = serving_config.get('wave_data', {})
+WAVE_STATION_TIMEOUT = float(wave_data_config.get('station_timeout_seconds', 6))
+WAVE_TOTAL_TIMEOUT = float(wave_data_config.get('total_timeout_seconds', 8))
+
+# Stale-while-revalidate station cache: viewers get the last good reading at once
+wave_cache = None
+wave_cache_config = wave_data_config.get('cache', {})
+if wave_cache_config.get('enabled', True):
+    wave_cache = WaveStationCache(
+        ttl_seconds=wave_cache_config.get('ttl_seconds', 60),
+        max_stale_seconds=wave_cache_config.get('max_stale_seconds', 1800),
+        station_timeout=WAVE_STATION_TIMEOUT,
+        total_timeout=WAVE_TOTAL_TIMEOUT,
+        http_client=http_client
+    )
+
+# Content-addressed /predict cache: hash of the input bytes + model version
+input_cache = None
+input_cache_config = serving_config.get('input_cache', {})
+if input_cache_config.get('enabled', True):
+    input_cache = ContentAddressedCache(
+        max_entries=input_cache_config.get('max_entries', 50000),
+        max_memory_mb=input_cache_config.get('max_memory_mb', 64),
+        disk_dir=input_cache_config.get('disk_dir'),
+        max_disk_entries=input_cache_config.get('max_disk_entries', 200000),
+        name='predict'
+    )
+
+
+# Per-event prediction cache for /live-data, keyed by USGS id + 'updated' + model version
+prediction_cache = None
+prediction_cache_config = serving_config.get('prediction_cache', {})
+if prediction_cache_config.get('enabled', True):
+    prediction_cache = PredictionCache(
+        max_entries=prediction_cache_config.get('max_entries', 10000),
+        ttl_seconds=prediction_cache_config.get('ttl_seconds', 3600),
+        name='live_data'
+    )
+
+
+def load_model(version_dir):
+    """Load the configured inference backend from a registry version (not warmed up)"""
+    loaded = load_backend(
+        INFERENCE_BACKEND,
+        Path(version_dir) / MODEL_PATH.name,
+        variant=MODEL_VARIANT,
+        warmup=False,
+        buckets=serving_config.get('inference_runner', {}).get('buckets', DEFAULT_BUCKETS),
+        intra_op_threads=worker_settings['intra_op_threads'] if PREFORK_SERVER else None,
+        inter_op_threads=worker_settings['inter_op_threads'] if PREFORK_SERVER else None,
+        num_threads=worker_settings['intra_op_threads'] if PREFORK_SERVER else None
+    )
+    logger.info(f"✓ Model loaded from {version_dir} ({INFERENCE_BACKEND} backend"
+                f"{', ' + MODEL_VARIANT if MODEL_VARIANT else ''})")
+    return loaded
+
+
+def create_batcher(served):
+    """Micro-batching queue in front of one model version for concurrent /predict calls"""
+    batching_config = serving_config.get('micro_batching', {})
+    if not batching_config.get('enabled', True):
+        return None
+    return MicroBatcher(
+        served.predict,
+        max_batch_size=batching_config.get('max_batch_size', 32),
+        max_wait_ms=batching_config.get('max_wait_ms', 3),
+        name=f'binary_focal@{served.version}',
+        result_timeout_ms=batching_config.get('result_timeout_ms', 2000)
+    )
+
+
+def warm_up(served):
+    """Trace the backend, then send one request through the full serving path"""
+    served.model.warmup()
+    probabilities = np.asarray(served.run(np.zeros((1, 24, 32), dtype=np.float32)))
+    if not np.all(np.isfinite(probabilities)):
+        raise ValueError(f"model version {served.version} returned non-finite probabilities")
+
+
+def on_model_swap(served, previous):
+    """Drop cached outputs of the replaced version (their keys carry the old version)"""
+    if previous is None:
+        return
+    if prediction_cache is not None:
+        prediction_cache.invalidate(f'model {previous.version} -> {served.version}')
+    if input_cache is not None:
+        input_cache.clear()
+
+
+# Versioned models (serving.model_registry): the newest version in the registry,
+# else the flat MODEL_PATH artifact. New versions are loaded and warmed in the
+# background and swapped in between micro-batches; the replaced one is kept for rollback.
+registry_config = serving_config.get('model_registry', {})
+model_registry = ModelRegistry(
+    registry_config.get('path') or 'models/registry',
+    artifact=backend_model_path(MODEL_PATH, INFERENCE_BACKEND, MODEL_VARIANT).name,
+    load_fn=load_model,
+    warmup_fn=warm_up,
+    batcher_fn=create_batcher,
+    on_swap=on_model_swap,
+    fallback_dir=MODEL_PATH.parent,
+    poll_interval_seconds=registry_config.get('poll_interval_seconds', 10),
+    settle_seconds=registry_config.get('settle_seconds', 5),
+    name='binary_focal'
+)
+WATCH_MODEL_REGISTRY = bool(registry_config.get('watch', True))
+model_loader = None
+# Version loaded by the pre-fork master, shared copy-on-write until a worker swaps
+forked_model = None
+
+
+def active_model():
+    """The model version currently served (None until loaded)"""
+    return model_registry.active
+
+
+def predict_direct(input_data, served=None):
+    """Run the binary model on a batch without going through the micro-batcher"""
+    return (served or model_registry.active).predict(input_data)
+
+
+def run_model(input_data, served=None):
+    """Run the binary model, going through the version's micro-batcher when enabled"""
+    return (served or model_registry.active).run(input_data)
+
+
+def _load_in_background():
+    """Loader thread: the target version without warm-up"""
+    return model_registry.load()
+
+
+def _warm_up(served):
+    """Loader thread: warm up the version, then publish it to the request handlers"""
+    model_registry.publish(served)
+
+
+def start_model_loading(lazy):
+    """Load the model now, or start the background loader when lazy"""
+    global model_loader
+    if lazy:
+        model_loader = BackgroundModelLoader(_load_in_background, _warm_up, name='binary_focal').start()
+        logger.info("Model loading in the background (lazy loading enabled)")
+        return
+
+    try:
+        model_registry.publish(model_registry.load())
+    except Exception as e:
+        logger.error(f"✗ Failed to load model: {e}")
+
+
+def watch_model_registry():
+    """Start watching the registry for new versions (per process)"""
+    if WATCH_MODEL_REGISTRY:
+        model_registry.start()
+
+
+if LOAD_MODEL_AFTER_FORK:
+    logger.info(f"{INFERENCE_BACKEND} model will load in each worker (TensorFlow is not fork-safe)")
+elif PRELOADED:
+    # Load in the master, before any worker exists, so all of them share the weights
+    start_model_loading(lazy=False)
+else:
+    start_model_loading(lazy=LAZY_MODEL_LOADING)
+    watch_model_registry()
+
+
+# /live-data region: -40..30 lat, 40..120 lon
+LIVE_DATA_REGION = {'min_latitude': -40, 'max_latitude': 30, 'min_longitude': 40, 'max_longitude': 120}
+
+
+# One background USGS poll per process, shared by every /live-data viewer
+usgs_poller = get_shared_poller(config, http_client) if 'apis' in config else None
+
+
+def prepare_fork():
+    """
+    Quiesce background threads in the pre-fork master
+
+    Only the forking thread survives fork(), so a thread holding a lock
+    (poller, micro-batcher, registry watcher) would leave it locked forever
+    in every worker. Called by gunicorn.conf.py once the model is loaded,
+    before the first fork.
+    """
+    global forked_model
+    if usgs_poller is not None:
+        usgs_poller.stop()
+    model_registry.stop()
+    forked_model = model_registry.active
+    # Workers must not share the master's keep-alive sockets
+    http_client.close()
+
+
+def after_fork():
+    """
+    Restart per-process state in a freshly forked worker
+
+    Called by gunicorn.conf.py in each worker. Inherited ONNX/TFLite models
+    are reused as is; a Keras model is loaded here. Every worker watches the
+    registry on its own.
+    """
+    http_client.reset_after_fork()
+    # prepare_fork() closed the inherited version's batchers, and
+    # watch_model_registry() does not restart them when watching is off
+    model_registry.resume_batchers()
+    if LOAD_MODEL_AFTER_FORK:
+        start_model_loading(lazy=LAZY_MODEL_LOADING)
+    watch_model_registry()
+    if usgs_poller is not None and config['apis']['usgs_earthquake'].get('poller', {}).get('enabled', True):
+        usgs_poller.start()
+
+
+def model_unavailable():
+    """
+    Wait for a lazily loaded model
+    
+    Requests that arrive while the model is loading or warming up are held
+    for up to MODEL_WAIT_TIMEOUT seconds.
+    
+    Returns:
+        None when the model can be used, otherwise an error response
+    """
+    if model_loader is not None and not model_loader.is_ready:
+        try:
+            model_loader.wait(MODEL_WAIT_TIMEOUT)
+        except ModelNotReady as e:
+            response = jsonify({'error': str(e), 'model_state': e.state})
+            response.headers['Retry-After'] = '5'
+            return response, 503
+        except ModelLoadError as e:
+            return jsonify({'error': f'Model failed to load: {e}'}), 500
+    
+    if model_registry.active is None:
+        return jsonify({'error': 'Model not loaded'}), 500
+    return None
+
+
+def model_state():
+    """
+    Loader state of the served model, without waiting for a lazy load
+    
+    Only /predict and /batch_predict* hold requests while the model loads
+    (model_unavailable()); /live-data reports this state instead. Needs no
+    request context, so it can run on any thread.
+    
+    Returns:
+        'loading', 'warming', 'ready' or 'failed'
+    """
+    if model_loader is not None and not model_loader.is_ready:
+        return model_loader.state
+    return 'ready' if model_registry.active is not None else 'failed'
+
+
+def decode_tensor_body(field, body=None):
+    """
+    Decode the input tensor from a JSON or binary request body
+    
+    Binary bodies (raw float32, .npy, msgpack-numpy) are selected by
+    Content-Type and decoded in place with np.frombuffer.
+    
+    Returns:
+        Tuple of (tensor, threshold carried in the body or None)
+    """
+    binary_type = canonical_content_type(request.mimetype)
+    
+    if binary_type is not None:
+        body = request.get_data(cache=False) if body is None else body
+        tensor, options = decode_tensor_request(body, binary_type, field=field)
+        threshold = options.get('threshold')
+        return tensor, (float(threshold) if threshold is not None else None)
+    
+    request_data = request.get_json()
+    if field not in request_data:
+        raise PayloadError(f'Missing "{field}" field')
+    
+    return np.array(request_data[field], dtype=np.float32), request_data.get('threshold', 0.1)
+
+
+def resolve_threshold(body_threshold):
+    """Threshold from the body, else the ?threshold= query parameter (default 0.1)"""
+    if body_threshold is not None:
+        return body_threshold
+    return request.args.get('threshold', 0.1, type=float)
+
+
+def parse_tensor_request(field):
+    """
+    Read the input tensor and threshold from a JSON or binary request body
+    
+    For binary bodies the threshold comes from the msgpack map or the
+    ?threshold= query parameter.
+    """
+    tensor, body_threshold = decode_tensor_body(field)
+    return tensor, resolve_threshold(body_threshold)
+
+
+def binary_response(probabilities, alerts, threshold, version):
+    """Encode a prediction result according to the Accept header (None means JSON)"""
+    best_match = request.accept_mimetypes.best_match(RESPONSE_CONTENT_TYPES, default=JSON_CONTENT_TYPE)
+    response_type = canonical_content_type(best_match)
+    
+    if response_type is None:
+        return None
+    
+    response = make_response(encode_prediction_response(probabilities, alerts, threshold, response_type))
+    response.headers['Content-Type'] = response_type
+    response.headers['X-Alert-Threshold'] = str(threshold)
+    response.headers['X-Alert-Count'] = str(int(np.sum(alerts)))
+    response.headers['X-Model-Version'] = version
+    return response
 
 
 @app.route('/health', methods=['GET'])
 def health():
-    """Health check endpoint"""
+    """Health check endpoint (answers immediately, even while the model loads)"""
+    served = model_registry.active
+    if model_loader is not None:
+        model_status = model_loader.status()
+    else:
+        model_status = {'state': 'ready' if served is not None else 'failed'}
+    
     return jsonify({
         'status': 'healthy',
-        'model_loaded': model is not None,
-        'model_type': metadata.get('model_type') if metadata else None
+        'model_loaded': served is not None,
+        'model_state': model_status,
+        'model_version': served.version if served is not None else None,
+        'model_type': served.metadata.get('model_type') if served is not None and served.metadata else None,
+        'inference_backend': served.model.get_stats() if served is not None else None,
+        'micro_batching': served.batcher.get_stats() if served is not None and served.batcher is not None else None,
+        'model_registry': model_registry.get_stats(),
+        'prediction_cache': prediction_cache.get_stats() if prediction_cache is not None else None,
+        'input_cache': input_cache.get_stats() if input_cache is not None else None,
+        'usgs_poller': usgs_poller.get_stats() if usgs_poller is not None else None,
+        'wave_cache': wave_cache.get_stats() if wave_cache is not None else None,
+        'http_client': http_client.get_stats(),
+        'async_http_client': async_http_client.get_stats() if async_http_client is not None else None,
+        'worker': {
+            'pid': os.getpid(),
+            'prefork': PREFORK_SERVER,
+            'model_shared': served is not None and served is forked_model,
+            'intra_op_threads': worker_settings['intra_op_threads'] if PREFORK_SERVER else None
+        }
     }), 200
 
 
@@ -62,10 +442,9 @@ def health():
 def serve_dashboard():
     """Serve the live dashboard with Indian Ocean data"""
     try:
-        response = make_response(send_file('static/index_live.html'))
-        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-        response.headers['Pragma'] = 'no-cache'
-        response.headers['Expires'] = '0'
+        # Browsers keep the page but revalidate it (ETag / Last-Modified) on every load
+        response = make_response(send_file('static/index_live.html', conditional=True))
+        response.headers['Cache-Control'] = 'no-cache'
         return response
     except Exception as e:
         logger.error(f"Error serving dashboard: {e}")
@@ -127,102 +506,182 @@ def get_test_data():
     }), 200
 
 
+def parse_paging(args):
+    """
+    /live-data page and page size from query parameters
+    
+    Args:
+        args: Query parameter mapping (Flask or Starlette)
+    
+    Returns:
+        (page, page_size), invalid values falling back to the defaults
+    """
+    live_data_config = serving_config.get('live_data', {})
+    
+    def as_int(name, default):
+        try:
+            return int(args.get(name, default))
+        except (TypeError, ValueError):
+            return default
+    
+    page = max(1, as_int('page', 1))
+    page_size = as_int('page_size', live_data_config.get('page_size', 100))
+    page_size = max(1, min(page_size, live_data_config.get('max_page_size', 1000)))
+    return page, page_size
+
+
+def live_data_etag(snapshot, page, page_size, served, state='ready'):
+    """
+    /live-data ETag: the page only changes with the snapshot, the paging and the model version or state
+    """
+    return make_etag('live-data', snapshot.fetched_at.isoformat(), page, page_size,
+                     served.version if served is not None else state)
+
+
+def live_data_payload(snapshot, page, page_size, served, state='ready'):
+    """
+    /live-data body for one page of a USGS snapshot
+    
+    Every event in the window is scored in one batched model call (cached
+    events are not re-scored), so window-wide counts are exact and paging
+    costs no extra inference.
+    
+    Args:
+        snapshot: USGS snapshot
+        page: 1-based page number
+        page_size: Events per page
+        served: Model version to score with (None: return events without scores)
+        state: Model loader state reported while served is None
+    
+    Returns:
+        JSON-serializable response dictionary
+    """
+    # Indian Ocean region (approximate bounding box), filtered locally from
+    # the shared USGS snapshot instead of querying USGS per request
+    region = serving_config.get('live_data', {}).get('region', LIVE_DATA_REGION)
+    
+    # Earthquakes from the last 24 hours (most recent first)
+    end_time = snapshot.end_time
+    start_time = end_time - timedelta(hours=24)
+    features = snapshot.filter(region=region, min_magnitude=4.0, hours=24)
+    total = len(features)
+    
+    probabilities = score_events(features, served) if served is not None and total else None
+    
+    # Events missing a pattern parameter are listed but not scored (NaN probability)
+    risk_levels = []
+    if probabilities is not None:
+        risk_levels = ['UNKNOWN' if np.isnan(p) else 'HIGH' if p > 0.5 else 'MODERATE' if p > 0.2 else 'LOW'
+                       for p in probabilities]
+    
+    # Pagination (most recent events first)
+    page_count = max(1, -(-total // page_size))
+    first = (page - 1) * page_size
+    
+    earthquakes = []
+    predictions = []
+    
+    for index in range(first, min(first + page_size, total)):
+        feature = features[index]
+        props = feature['properties']
+        coords = feature['geometry']['coordinates']
+        
+        # Extract earthquake info
+        eq_info = {
+            'id': feature.get('id'),
+            'magnitude': props.get('mag'),
+            'location': props.get('place'),
+            'time': props.get('time'),
+            'latitude': coords[1],
+            'longitude': coords[0],
+            'depth': coords[2],
+            'url': props.get('url')
+        }
+        
+        # Fan the batched prediction back out to the event
+        if probabilities is not None and risk_levels[index] == 'UNKNOWN':
+            eq_info['tsunami_probability'] = None
+            eq_info['tsunami_risk'] = 'UNKNOWN'
+            eq_info['alert'] = False
+        elif probabilities is not None:
+            probability = float(probabilities[index])
+            
+            eq_info['tsunami_probability'] = probability
+            eq_info['tsunami_risk'] = risk_levels[index]
+            eq_info['alert'] = probability > 0.1
+            
+            predictions.append({
+                'earthquake': eq_info,
+                'prediction': {
+                    'probability': probability,
+                    'risk_level': eq_info['tsunami_risk'],
+                    'alert': eq_info['alert']
+                }
+            })
+        
+        earthquakes.append(eq_info)
+    
+    return {
+        'success': True,
+        'region': 'Indian Ocean',
+        'time_range': {
+            'start': start_time.isoformat(),
+            'end': end_time.isoformat()
+        },
+        'total_earthquakes': total,
+        'model_version': served.version if served is not None else None,
+        'model_state': 'ready' if served is not None else state,
+        'fetched_at': snapshot.fetched_at.isoformat(),
+        'data_age_seconds': round(snapshot.age_seconds, 1),
+        'earthquakes': earthquakes,
+        'predictions': predictions,
+        'pagination': {
+            'page': page,
+            'page_size': page_size,
+            'pages': page_count,
+            'returned': len(earthquakes),
+            'has_next': page < page_count
+        },
+        # Counts cover the whole window, not just this page
+        'high_risk_count': sum(1 for level in risk_levels if level == 'HIGH'),
+        'alerts_triggered': int(np.sum(probabilities > 0.1)) if probabilities is not None else 0
+    }
+
+
 @app.route('/live-data', methods=['GET'])
 def get_live_data():
     """
     Fetch live seismic data from Indian Ocean region and predict tsunami risk
     Data source: USGS Earthquake API
+    
+    Every event in the window is scored in one batched model call; the
+    response is paginated, most recent events first.
+    
+    Query parameters:
+        page: 1-based page number (default 1)
+        page_size: Events per page (default from config)
     """
     try:
-        # Indian Ocean region coordinates (approximate bounding box)
-        # Latitude: -40 to 30, Longitude: 40 to 120
-        min_lat, max_lat = -40, 30
-        min_lon, max_lon = 40, 120
-        
-        # Get earthquakes from last 24 hours
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(hours=24)
+        page, page_size = parse_paging(request.args)
         
-        # USGS Earthquake API
-        usgs_url = "https://earthquake.usgs.gov/fdsnws/event/1/query"
-        params = {
-            'format': 'geojson',
-            'starttime': start_time.strftime('%Y-%m-%dT%H:%M:%S'),
-            'endtime': end_time.strftime('%Y-%m-%dT%H:%M:%S'),
-            'minlatitude': min_lat,
-            'maxlatitude': max_lat,
-            'minlongitude': min_lon,
-            'maxlongitude': max_lon,
-            'minmagnitude': 4.0,  # Only significant earthquakes
-            'orderby': 'time-asc'
-        }
+        # Scores are attached only once the model is ready (never waits while it
+        # loads: the loader state is reported instead); the page is scored by the
+        # version taken here even if a new one is swapped in
+        state = model_state()
+        served = model_registry.active if state == 'ready' else None
         
-        response = http_requests.get(usgs_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        if usgs_poller is None:
+            raise RuntimeError(f'USGS settings missing from {CONFIG_PATH}')
+        snapshot = usgs_poller.get_snapshot()
         
-        earthquakes = []
-        predictions = []
+        # Repeat polls are answered 304 before any filtering or scoring
+        etag = live_data_etag(snapshot, page, page_size, served, state)
+        if etag_matches(etag):
+            return not_modified(etag)
         
-        for feature in data.get('features', [])[:10]:  # Limit to 10 most recent
-            props = feature['properties']
-            coords = feature['geometry']['coordinates']
-            
-            # Extract earthquake info
-            eq_info = {
-                'id': feature.get('id'),
-                'magnitude': props.get('mag'),
-                'location': props.get('place'),
-                'time': props.get('time'),
-                'latitude': coords[1],
-                'longitude': coords[0],
-                'depth': coords[2],
-                'url': props.get('url')
-            }
-            
-            # Convert earthquake data to model input format
-            # Create synthetic seismic pattern based on earthquake parameters
-            seismic_data = create_seismic_pattern(
-                magnitude=eq_info['magnitude'],
-                depth=eq_info['depth'],
-                latitude=eq_info['latitude'],
-                longitude=eq_info['longitude']
-            )
-            
-            # Make prediction
-            if model is not None:
-                input_data = np.expand_dims(seismic_data, axis=0)
-                prediction = model.predict(input_data, verbose=0)
-                probability = float(prediction[0][0])
-                
-                eq_info['tsunami_probability'] = probability
-                eq_info['tsunami_risk'] = 'HIGH' if probability > 0.5 else 'MODERATE' if probability > 0.2 else 'LOW'
-                eq_info['alert'] = probability > 0.1
-                
-                predictions.append({
-                    'earthquake': eq_info,
-                    'prediction': {
-                        'probability': probability,
-                        'risk_level': eq_info['tsunami_risk'],
-                        'alert': eq_info['alert']
-                    }
-                })
-            
-            earthquakes.append(eq_info)
-        
-        return jsonify({
-            'success': True,
-            'region': 'Indian Ocean',
-            'time_range': {
-                'start': start_time.isoformat(),
-                'end': end_time.isoformat()
-            },
-            'total_earthquakes': len(earthquakes),
-            'earthquakes': earthquakes,
-            'predictions': predictions,
-            'high_risk_count': sum(1 for p in predictions if p['prediction']['risk_level'] == 'HIGH'),
-            'alerts_triggered': sum(1 for p in predictions if p['prediction']['alert'])
-        }), 200
+        response = jsonify(live_data_payload(snapshot, page, page_size, served, state))
+        response.set_etag(etag)
+        return response
         
     except Exception as e:
         logger.error(f"Error fetching live data: {e}")
@@ -233,217 +692,67 @@ def get_live_data():
         }), 500
 
 
+def wave_data_etag(result):
+    """/wave-data ETag: cached readings only change when a station is refreshed"""
+    return make_etag('wave-data', sorted(
+        (station['station_id'], station['fetched_at'])
+        for region in result['wave_data'].values() for station in region['stations']
+    ))
+
+
+def wave_data_payload(result, start):
+    """
+    /wave-data body from a station cache or collection result
+    
+    Args:
+        result: WaveStationCache.get() or collect_wave_data() result
+        start: perf_counter() value when the request arrived
+    """
+    return {
+        'success': True,
+        'wave_data': result['wave_data'],
+        'data_age_seconds': result.get('data_age_seconds', 0.0),
+        'refreshing': result.get('refreshing', []),
+        'timed_out': result['timed_out'],
+        'elapsed_ms': round((time.perf_counter() - start) * 1000.0, 1),
+        'timestamp': datetime.utcnow().isoformat(),
+        'note': 'Real-time data from IOC sea level stations and NOAA DART buoys'
+    }
+
+
 @app.route('/wave-data', methods=['GET'])
 def get_wave_data():
     """
     Fetch real-time ocean wave and water level data from monitoring stations
     Data sources: IOC Sea Level stations, NOAA DART buoys
+
+    Readings come from the station cache: every station's last good reading
+    is returned immediately (with its age) and stale stations are refreshed
+    in the background. Without the cache all stations are fetched
+    concurrently; a station that misses its deadline falls back to
+    simulated readings and is listed in 'timed_out'.
     """
     try:
-        # Define monitoring stations with IOC codes
-        stations = {
-            'arabian': {
-                'name': 'Arabian Sea',
-                'stations': [
-                    {'id': 'okha', 'ioc_code': 'okha', 'lat': 22.47, 'lon': 69.07, 'name': 'Okha, India'},
-                    {'id': 'mumbai', 'ioc_code': 'bomb', 'lat': 18.95, 'lon': 72.82, 'name': 'Mumbai, India'},
-                ]
-            },
-            'bengal': {
-                'name': 'Bay of Bengal',
-                'stations': [
-                    {'id': 'chennai', 'ioc_code': 'ched', 'lat': 13.10, 'lon': 80.30, 'name': 'Chennai, India'},
-                    {'id': 'vizag', 'ioc_code': 'visa', 'lat': 17.68, 'lon': 83.28, 'name': 'Visakhapatnam, India'},
-                ]
-            },
-            'andaman': {
-                'name': 'Andaman Sea',
-                'stations': [
-                    {'id': 'portblair', 'ioc_code': 'port', 'lat': 11.66, 'lon': 92.73, 'name': 'Port Blair, India'},
-                    {'id': 'phuket', 'ioc_code': 'phuk', 'lat': 7.89, 'lon': 98.39, 'name': 'Phuket, Thailand'},
-                ]
-            }
-        }
-        
-        wave_data = {}
-        
-        for region_key, region_info in stations.items():
-            region_readings = []
-            
-            for station in region_info['stations']:
-                try:
-                    # Try IOC Sea Level Monitoring API
-                    ioc_code = station.get('ioc_code', '').upper()
-                    
-                    # IOC API endpoint - last 1 hour of data
-                    ioc_url = f"http://www.ioc-sealevelmonitoring.org/service.php"
-                    params = {
-                        'code': ioc_code,
-                        'period': 0.04  # Last ~1 hour (0.04 days)
-                    }
-                    
-                    response = http_requests.get(ioc_url, params=params, timeout=10)
-                    
-                    if response.status_code == 200 and len(response.text) > 100:
-                        # Parse IOC CSV data
-                        lines = response.text.strip().split('\n')
-                        readings = []
-                        
-                        # Skip header lines and parse data
-                        data_started = False
-                        for line in lines:
-                            line = line.strip()
-                            if not line or line.startswith('#'):
-                                continue
-                            if 'slevel' in line.lower() or 'time' in line.lower():
-                                data_started = True
-                                continue
-                            if data_started:
-                                parts = line.split(',')
-                                if len(parts) >= 2:
-                                    try:
-                                        # Format: timestamp, water_level, ...
-                                        timestamp = parts[0].strip()
-                                        water_level = float(parts[1].strip())
-                                        
-                                        # Convert to meters and add offset for visualization
-                                        water_level_m = water_level / 100.0  # cm to meters
-                                        water_level_m += 5.0  # Add baseline for positive display
-                                        
-                                        readings.append({
-                                            'time': timestamp,
-                                            'value': round(water_level_m, 3),
-                                            'quality': 'verified'
-                                        })
-                                    except (ValueError, IndexError):
-                                        continue
-                        
-                        if len(readings) >= 5:  # Need at least 5 readings
-                            # Take last 10 readings
-                            readings = readings[-10:]
-                            
-                            region_readings.append({
-                                'station_id': station['id'],
-                                'station_name': station['name'],
-                                'location': {'lat': station['lat'], 'lon': station['lon']},
-                                'readings': readings,
-                                'source': 'IOC Sea Level Station',
-                                'data_type': 'sea_level',
-                                'unit': 'meters',
-                                'real_data': True
-                            })
-                            logger.info(f"✓ Real-time data from {station['name']} ({ioc_code}): {len(readings)} readings")
-                            continue
-                    
-                except Exception as e:
-                    logger.debug(f"IOC data unavailable for {station['name']}: {e}")
-                
-                # Try NDBC/DART buoys for backup
-                try:
-                    # Map regions to nearby DART buoys
-                    dart_buoys = {
-                        'bengal': '23401',  # Bay of Bengal DART
-                        'andaman': '23401'  # Also covers Andaman
-                    }
-                    
-                    if region_key in dart_buoys:
-                        buoy_id = dart_buoys[region_key]
-                        dart_url = f"https://www.ndbc.noaa.gov/data/realtime2/{buoy_id}.txt"
-                        
-                        response = http_requests.get(dart_url, timeout=8)
-                        
-                        if response.status_code == 200:
-                            lines = response.text.strip().split('\n')
-                            readings = []
-                            
-                            # Parse NDBC format (first 2 lines are headers)
-                            for line in lines[2:12]:  # Get 10 readings
-                                parts = line.split()
-                                if len(parts) >= 5:
-                                    try:
-                                        # NDBC format: YY MM DD hh mm WDIR WSPD GST WVHT ...
-                                        year, month, day, hour, minute = parts[0:5]
-                                        
-                                        # Construct timestamp
-                                        timestamp = f"20{year}-{month}-{day} {hour}:{minute}"
-                                        
-                                        # Get wave height if available (usually column 8)
-                                        wave_height = float(parts[8]) if len(parts) > 8 and parts[8] != 'MM' else 5.0
-                                        
-                                        readings.append({
-                                            'time': timestamp,
-                                            'value': round(wave_height, 2),
-                                            'quality': 'measured'
-                                        })
-                                    except (ValueError, IndexError):
-                                        continue
-                            
-                            if len(readings) >= 5:
-                                region_readings.append({
-                                    'station_id': f'dart_{buoy_id}',
-                                    'station_name': f'DART Buoy {buoy_id}',
-                                    'location': {'lat': station['lat'], 'lon': station['lon']},
-                                    'readings': readings[-10:],
-                                    'source': 'NOAA DART Buoy',
-                                    'data_type': 'wave_height',
-                                    'unit': 'meters',
-                                    'real_data': True
-                                })
-                                logger.info(f"✓ Real-time DART data from buoy {buoy_id}: {len(readings)} readings")
-                                continue
-                
-                except Exception as e:
-                    logger.debug(f"DART data unavailable: {e}")
-                
-                # If no real data available, generate realistic fallback
-                logger.info(f"Using simulated data for {station['name']}")
-                current_time = datetime.utcnow()
-                readings = []
-                
-                regional_params = {
-                    'arabian': {'baseline': 4.2, 'tide_amp': 1.8, 'wave_amp': 0.6},
-                    'bengal': {'baseline': 4.8, 'tide_amp': 2.2, 'wave_amp': 0.8},
-                    'andaman': {'baseline': 3.9, 'tide_amp': 1.6, 'wave_amp': 0.7}
-                }
-                
-                params = regional_params[region_key]
-                
-                for i in range(10):
-                    time_offset = current_time - timedelta(minutes=6 * (9 - i))
-                    tide = params['baseline'] + params['tide_amp'] * np.sin(2 * np.pi * time_offset.hour / 12)
-                    wave = params['wave_amp'] * np.sin(2 * np.pi * i / 3) * (0.8 + 0.2 * np.random.rand())
-                    noise = np.random.randn() * 0.1
-                    water_level = tide + wave + noise
-                    
-                    readings.append({
-                        'time': time_offset.strftime('%Y-%m-%d %H:%M'),
-                        'value': round(water_level, 2),
-                        'quality': 'estimated'
-                    })
-                
-                region_readings.append({
-                    'station_id': station['id'],
-                    'station_name': station['name'],
-                    'location': {'lat': station['lat'], 'lon': station['lon']},
-                    'readings': readings,
-                    'source': 'Simulated (No real-time station)',
-                    'data_type': 'water_level',
-                    'unit': 'meters',
-                    'real_data': False
-                })
-            
-            wave_data[region_key] = {
-                'region': region_info['name'],
-                'stations': region_readings,
-                'last_update': datetime.utcnow().isoformat()
-            }
-        
-        return jsonify({
-            'success': True,
-            'wave_data': wave_data,
-            'timestamp': datetime.utcnow().isoformat(),
-            'note': 'Real-time data from IOC sea level stations and NOAA DART buoys'
-        }), 200
+        start = time.perf_counter()
+        if wave_cache is not None:
+            result = wave_cache.get()
+        else:
+            result = collect_wave_data(
+                station_timeout=WAVE_STATION_TIMEOUT,
+                total_timeout=WAVE_TOTAL_TIMEOUT,
+                http_client=http_client
+            )
+
+        etag = None
+        if wave_cache is not None:
+            etag = wave_data_etag(result)
+            if etag_matches(etag):
+                return not_modified(etag)
+
+        response = jsonify(wave_data_payload(result, start))
+        if etag is not None:
+            response.set_etag(etag)
+        return response
         
     except Exception as e:
         logger.error(f"Error fetching wave data: {e}")
@@ -454,7 +763,7 @@ def get_wave_data():
         }), 500
 
 
-def create_seismic_pattern(magnitude, depth, latitude, longitude):
+def create_seismic_pattern(magnitude, depth, latitude, longitude, event_id=None):
     """
     Create synthetic seismic pattern for model input based on earthquake parameters
     Returns (24, 32) shaped array representing seismic features over time
@@ -464,37 +773,75 @@ def create_seismic_pattern(magnitude, depth, latitude, longitude):
     - depth: Earthquake depth (km)
     - latitude: Earthquake latitude
     - longitude: Earthquake longitude
+    - event_id: Optional event id; seeds the noise so the event always
+      yields the same pattern
+    
+    See src.serving.seismic_patterns.create_seismic_patterns for N events at once.
     """
-    # Initialize pattern
-    pattern = np.zeros((24, 32))
+    return create_seismic_patterns(
+        magnitude, depth, latitude, longitude,
+        event_ids=[event_id] if event_id is not None else None
+    )[0]
+
+
+def event_parameters(feature):
+    """Magnitude, depth, latitude and longitude of a USGS feature (None where USGS left one out)"""
+    longitude, latitude, depth = (list(feature['geometry']['coordinates'][:3]) + [None] * 3)[:3]
+    return feature['properties'].get('mag'), depth, latitude, longitude
+
+
+def score_events(features, served):
+    """
+    Tsunami probabilities for a list of USGS GeoJSON features
     
-    # Magnitude affects amplitude (higher magnitude = higher amplitude)
-    magnitude_factor = magnitude / 10.0
+    Cached predictions are reused for events whose id and 'updated'
+    timestamp are unchanged; only new or revised events are turned into
+    seismic patterns and scored, in one batched model call.
     
-    # Depth affects pattern (shallow = more surface impact)
-    depth_factor = max(0.1, 1.0 - (depth / 700.0))  # 700km max depth
+    Args:
+        features: USGS GeoJSON features
+        served: Model version to score with (part of every cache key)
     
-    # Create time-varying pattern
-    for t in range(24):
-        # Create frequency components (32 features)
-        for f in range(32):
-            # Base signal with magnitude influence
-            base = magnitude_factor * depth_factor
-            
-            # Add time evolution (tsunami waves build up)
-            time_evolution = np.sin(t * np.pi / 24) * (t / 24)
-            
-            # Add frequency components
-            freq_component = np.cos(2 * np.pi * f / 32)
-            
-            # Combine factors with some randomness
-            pattern[t, f] = base * (0.3 + 0.5 * time_evolution + 0.2 * freq_component)
-            pattern[t, f] += np.random.randn() * 0.05  # Small noise
+    Returns:
+        Float array of probabilities aligned with features; NaN for events
+        missing their magnitude, depth or coordinates, which are not scored
+    """
+    probabilities = np.full(len(features), np.nan, dtype=np.float64)
+    keys = [(feature.get('id'), feature['properties'].get('updated'), served.version) for feature in features]
+    
+    parameters = np.array([event_parameters(feature) for feature in features], dtype=np.float64).reshape(-1, 4)
+    complete = complete_mask(*parameters.T)
+    
+    cached = {}
+    if prediction_cache is not None:
+        cached, _ = prediction_cache.get_many(key for key in keys if key[0] is not None)
     
-    # Normalize to reasonable range
-    pattern = np.clip(pattern, 0, 1.0)
+    missing = []
+    for index, key in enumerate(keys):
+        if key in cached:
+            probabilities[index] = cached[key]
+        elif complete[index]:
+            missing.append(index)
     
-    return pattern
+    if missing:
+        # Synthetic seismic patterns for all new events in one vectorized call
+        magnitude, depth, latitude, longitude = parameters[missing].T
+        seismic_patterns = create_seismic_patterns(
+            magnitude=magnitude,
+            depth=depth,
+            latitude=latitude,
+            longitude=longitude,
+            event_ids=[keys[i][0] for i in missing] if SEEDED_PATTERNS else None
+        )
+        scores = np.asarray(predict_direct(seismic_patterns, served)).reshape(-1)
+        probabilities[missing] = scores
+        
+        if prediction_cache is not None:
+            prediction_cache.put_many({
+                keys[i]: float(score) for i, score in zip(missing, scores) if keys[i][0] is not None
+            })
+    
+    return probabilities
 
 
 @app.route('/predict', methods=['POST'])
@@ -509,44 +856,82 @@ def predict():
     }
     
     Input shape: (24, 32) - 24 timesteps, 32 features
+    
+    Binary bodies are also accepted (Content-Type application/octet-stream,
+    application/x-npy or application/x-msgpack) and returned when requested
+    via the Accept header.
     """
     try:
-        if model is None:
-            return jsonify({'error': 'Model not loaded'}), 500
+        unavailable = model_unavailable()
+        if unavailable is not None:
+            return unavailable
         
-        # Get request data
-        request_data = request.get_json()
+        # One version answers the whole request, even if a new one is swapped in meanwhile
+        served = model_registry.active
+        version = served.version
         
-        if 'data' not in request_data:
-            return jsonify({'error': 'Missing "data" field'}), 400
+        # Replayed request bodies are answered from the cache without decoding
+        body = request.get_data()
+        body_key = None
+        cached = None
+        if input_cache is not None:
+            body_key = content_key(request.mimetype.encode('utf-8') + b'\0' + body, version, kind='body')
+            cached = input_cache.get(body_key)
         
-        # Parse input
-        input_data = np.array(request_data['data'], dtype=np.float32)
-        threshold = request_data.get('threshold', 0.1)
+        if cached is not None:
+            probabilities, body_threshold = cached
+        else:
+            # Parse input (JSON or binary tensor)
+            try:
+                input_data, body_threshold = decode_tensor_body('data', body)
+            except PayloadError as e:
+                return jsonify({'error': str(e)}), 400
+            
+            # Validate input shape
+            if input_data.ndim == 2:
+                # Single sample: (24, 32)
+                input_data = np.expand_dims(input_data, axis=0)
+            elif input_data.ndim != 3:
+                return jsonify({'error': f'Invalid input shape. Expected (24, 32) or (batch, 24, 32), got {input_data.shape}'}), 400
+            
+            # Validate dimensions
+            if input_data.shape[1:] != (24, 32):
+                return jsonify({'error': f'Expected features (24, 32), got {input_data.shape[1:]}'}), 400
+            
+            # The same window sent in another encoding hits on its float32 bytes
+            tensor_key = content_key(input_data, version) if input_cache is not None else None
+            cached = input_cache.get(tensor_key) if input_cache is not None else None
+            
+            if cached is not None:
+                probabilities = cached[0]
+            else:
+                # Make prediction (coalesced with concurrent requests)
+                predictions = run_model(input_data, served)
+                probabilities = np.asarray(predictions).flatten()
+                if input_cache is not None:
+                    input_cache.put(tensor_key, probabilities)
+            
+            if input_cache is not None:
+                input_cache.put(body_key, probabilities, body_threshold)
         
-        # Validate input shape
-        if input_data.ndim == 2:
-            # Single sample: (24, 32)
-            input_data = np.expand_dims(input_data, axis=0)
-        elif input_data.ndim != 3:
-            return jsonify({'error': f'Invalid input shape. Expected (24, 32) or (batch, 24, 32), got {input_data.shape}'}), 400
+        threshold = resolve_threshold(body_threshold)
         
-        # Validate dimensions
-        if input_data.shape[1:] != (24, 32):
-            return jsonify({'error': f'Expected features (24, 32), got {input_data.shape[1:]}'}), 400
+        # Apply threshold
+        alerts = (probabilities > threshold).astype(np.float32)
         
-        # Make prediction
-        predictions = model.predict(input_data, verbose=0)
-        probabilities = predictions.flatten().tolist()
+        response = binary_response(probabilities, alerts, threshold, version)
+        if response is not None:
+            return response, 200
         
-        # Apply threshold
-        alerts = [float(p > threshold) for p in probabilities]
+        probabilities = probabilities.tolist()
+        alerts = alerts.tolist()
         
         return jsonify({
             'success': True,
             'probabilities': probabilities,
             'alerts': alerts,
             'threshold': threshold,
+            'model_version': version,
             'interpretation': [
                 'Tsunami detected' if alert else 'No tsunami'
                 for alert in alerts
@@ -561,11 +946,19 @@ def predict():
 @app.route('/model-info', methods=['GET'])
 def model_info():
     """Get model information and performance metrics"""
-    if metadata is None:
+    # Metadata is loaded together with the model in lazy mode
+    unavailable = model_unavailable()
+    if unavailable is not None:
+        return unavailable
+    
+    served = model_registry.active
+    if served is None or served.metadata is None:
         return jsonify({'error': 'Metadata not available'}), 500
     
     return jsonify({
-        'model': metadata,
+        'model': served.metadata,
+        'model_version': served.version,
+        'previous_version': model_registry.previous.version if model_registry.previous is not None else None,
         'endpoints': {
             'predict': '/predict (POST)',
             'health': '/health (GET)',
@@ -588,28 +981,37 @@ def batch_predict():
         ],
         "threshold": 0.1
     }
+    
+    Binary (batch, 24, 32) tensors are accepted and returned the same way
+    as for /predict.
     """
     try:
-        if model is None:
-            return jsonify({'error': 'Model not loaded'}), 500
-        
-        request_data = request.get_json()
-        
-        if 'samples' not in request_data:
-            return jsonify({'error': 'Missing "samples" field'}), 400
+        unavailable = model_unavailable()
+        if unavailable is not None:
+            return unavailable
         
-        # Parse batch
-        samples = np.array(request_data['samples'], dtype=np.float32)
-        threshold = request_data.get('threshold', 0.1)
+        # Parse batch (JSON or binary tensor)
+        try:
+            samples, threshold = parse_tensor_request('samples')
+        except PayloadError as e:
+            return jsonify({'error': str(e)}), 400
         
         # Validate shape
         if samples.shape[1:] != (24, 32):
             return jsonify({'error': f'Expected features (24, 32) per sample, got {samples.shape[1:]}'}), 400
         
         # Batch predict
-        predictions = model.predict(samples, verbose=0)
-        probabilities = predictions.flatten().tolist()
-        alerts = [float(p > threshold) for p in probabilities]
+        served = model_registry.active
+        predictions = predict_direct(samples, served)
+        probabilities = np.asarray(predictions).flatten()
+        alerts = (probabilities > threshold).astype(np.float32)
+        
+        response = binary_response(probabilities, alerts, threshold, served.version)
+        if response is not None:
+            return response, 200
+        
+        probabilities = probabilities.tolist()
+        alerts = alerts.tolist()
         
         return jsonify({
             'success': True,
@@ -618,7 +1020,8 @@ def batch_predict():
             'alerts': alerts,
             'alert_count': sum(alerts),
             'alert_rate': f"{100 * sum(alerts) / len(alerts):.2f}%",
-            'threshold': threshold
+            'threshold': threshold,
+            'model_version': served.version
         }), 200
         
     except Exception as e:
@@ -626,6 +1029,107 @@ def batch_predict():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/batch-predict/stream', methods=['POST'])
+def batch_predict_stream():
+    """
+    Streaming batch prediction for very large jobs (e.g. archive re-scoring)
+    
+    The request body is read incrementally and scored in fixed-size chunks,
+    so memory is bounded by the chunk size rather than the job size.
+    
+    Request body (by Content-Type):
+    - application/x-ndjson: one sample per line, either [[...], ...] or
+      {"sample": [[...], ...]}
+    - application/x-tensor-frames: repeated uint32 byte length + raw float32
+      tensor (same layout as /predict binary bodies), one or more samples each
+    
+    Query parameters:
+        threshold: Alert threshold (default 0.1)
+        chunk_size: Samples per chunk (default from config)
+    
+    Response (by Accept, defaults to the request encoding):
+    - NDJSON: one {"chunk", "offset", "count", "probabilities", "alerts"} line
+      per chunk followed by a {"done": true, ...} summary line
+    - Frames: one float32 probability frame per chunk, terminated by an empty frame
+    """
+    unavailable = model_unavailable()
+    if unavailable is not None:
+        return unavailable
+    
+    input_type = canonical_stream_type(request.mimetype)
+    if input_type is None:
+        return jsonify({
+            'error': f'Unsupported Content-Type {request.mimetype!r}',
+            'supported': [NDJSON_CONTENT_TYPE, FRAMES_CONTENT_TYPE]
+        }), 415
+    
+    streaming_config = serving_config.get('streaming', {})
+    threshold = request.args.get('threshold', 0.1, type=float)
+    chunk_size = request.args.get('chunk_size', streaming_config.get('chunk_size', 512), type=int)
+    chunk_size = max(1, min(chunk_size, streaming_config.get('max_chunk_size', 4096)))
+    
+    offered = [input_type] + [t for t in (NDJSON_CONTENT_TYPE, FRAMES_CONTENT_TYPE) if t != input_type]
+    response_type = request.accept_mimetypes.best_match(offered, default=input_type)
+    
+    if input_type == NDJSON_CONTENT_TYPE:
+        samples = iter_ndjson_samples(request.stream)
+    else:
+        samples = iter_frame_samples(request.stream)
+    
+    # The whole job is scored by one version, even if a new one is swapped in mid-stream
+    served = model_registry.active
+    
+    def generate():
+        scored = 0
+        alert_count = 0
+        chunk_index = 0
+        
+        try:
+            for chunk in iter_chunks(samples, chunk_size, (24, 32)):
+                probabilities = np.asarray(predict_direct(chunk, served)).flatten()
+                alerts = probabilities > threshold
+                
+                if response_type == NDJSON_CONTENT_TYPE:
+                    yield encode_ndjson_line({
+                        'chunk': chunk_index,
+                        'offset': scored,
+                        'count': len(probabilities),
+                        'probabilities': probabilities.tolist(),
+                        'alerts': alerts.astype(np.float32).tolist()
+                    })
+                else:
+                    yield encode_frame(probabilities)
+                
+                scored += len(probabilities)
+                alert_count += int(alerts.sum())
+                chunk_index += 1
+        
+        except Exception as e:
+            logger.error(f"Streaming batch prediction error after {scored} samples: {str(e)}")
+            if response_type == NDJSON_CONTENT_TYPE:
+                yield encode_ndjson_line({'success': False, 'error': str(e), 'scored': scored})
+            # Frame streams end without the terminating empty frame
+            return
+        
+        if response_type == NDJSON_CONTENT_TYPE:
+            yield encode_ndjson_line({
+                'done': True,
+                'success': True,
+                'total_samples': scored,
+                'chunks': chunk_index,
+                'chunk_size': chunk_size,
+                'alert_count': alert_count,
+                'threshold': threshold,
+                'model_version': served.version
+            })
+        else:
+            yield END_OF_STREAM_FRAME
+    
+    response = Response(stream_with_context(generate()), mimetype=response_type)
+    response.headers['X-Model-Version'] = served.version
+    return response
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
@@ -635,18 +1139,19 @@ def not_found(error):
             '/health',
             '/predict',
             '/batch-predict',
+            '/batch-predict/stream',
             '/model-info'
         ]
     }), 404
 
 
 if __name__ == '__main__':
-    import os
     logger.info("Starting Tsunami Detection API...")
     logger.info("Available endpoints:")
     logger.info("  - GET  /health")
     logger.info("  - POST /predict")
     logger.info("  - POST /batch-predict")
+    logger.info("  - POST /batch-predict/stream")
     logger.info("  - GET  /model-info")
     
     port = int(os.environ.get('PORT', 5000))
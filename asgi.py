@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+ASGI entry point for the Tsunami Detection API
+
+The live data endpoints (/live-data, /wave-data, /api/ocean/conditions and
+/api/advisories/incois) are served natively on the event loop: their
+upstream USGS, IOC, NDBC, NOAA and INCOIS requests go through the aiohttp
+client, so hundreds of dashboard polls can wait on slow feeds without a
+thread each. Every other route is the Flask app from app.py, mounted as
+WSGI and run on a bounded thread pool.
+
+    uvicorn asgi:application
+    gunicorn -c gunicorn.conf.py        (serving.workers.asgi: true)
+"""
+
+import hashlib
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+
+import app as api
+from src.data_collection import (
+    NOAATidesCollector, NOAABuoysCollector, INCOISCollector,
+    get_shared_async_client, collect_wave_data_async, fetch_ocean_conditions_async
+)
+from src.serving.http_caching import (
+    ENCODING_ETAG_SUFFIXES, caching_options, choose_encoding, compress, match_etag
+)
+
+logger = logging.getLogger(__name__)
+
+caching = caching_options(api.serving_config.get('http_caching', {}))
+
+CORS_HEADERS = {'Access-Control-Allow-Origin': '*'}
+
+# Collectors for the ocean and advisory routes (the sync client serves their CLI paths)
+tides_collector = NOAATidesCollector(api.config, api.http_client)
+buoys_collector = NOAABuoysCollector(api.config, api.http_client)
+incois_collector = INCOISCollector(api.config, api.http_client)
+
+
+def not_modified_response(matched):
+    """Empty 304 echoing the client's ETag variant"""
+    return Response(status_code=304, headers=dict(CORS_HEADERS, Vary='Accept-Encoding',
+                                                   ETag=f'"{matched}"'))
+
+
+def json_response(request, payload, status=200, etag=None):
+    """
+    JSON response with the same ETag, 304 and compression rules as the Flask routes
+
+    Args:
+        request: Incoming request
+        payload: JSON-serializable body
+        status: HTTP status
+        etag: Version ETag (default: hashed from the body, as for Flask JSON)
+
+    Returns:
+        Starlette response
+    """
+    headers = dict(CORS_HEADERS)
+    if status != 200:
+        body = api.app.json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        return Response(body, status_code=status, media_type='application/json', headers=headers)
+
+    headers['Vary'] = 'Accept-Encoding'
+    if etag is not None:
+        matched = match_etag(request.headers.get('if-none-match'), etag)
+        if matched is not None:
+            return not_modified_response(matched)
+
+    body = api.app.json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    if etag is None:
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        matched = match_etag(request.headers.get('if-none-match'), etag)
+        if matched is not None:
+            return not_modified_response(matched)
+
+    if caching['compression'] and len(body) >= caching['min_size']:
+        encoding = choose_encoding(request.headers.get('accept-encoding'))
+        if encoding is not None:
+            body = compress(body, encoding, caching['gzip_level'], caching['brotli_quality'])
+            headers['Content-Encoding'] = encoding
+            etag += ENCODING_ETAG_SUFFIXES[encoding]
+
+    headers['ETag'] = f'"{etag}"'
+    return Response(body, media_type='application/json', headers=headers)
+
+
+async def live_data(request: Request):
+    """/live-data: the USGS snapshot is awaited, only scoring runs on a thread"""
+    try:
+        page, page_size = api.parse_paging(request.query_params)
+        # Never waits for a lazy load: the loader state is reported instead
+        state = api.model_state()
+        served = api.model_registry.active if state == 'ready' else None
+
+        if api.usgs_poller is None:
+            raise RuntimeError(f'USGS settings missing from {api.CONFIG_PATH}')
+        snapshot = await api.usgs_poller.get_snapshot_async(api.async_http_client)
+
+        # Repeat polls are answered 304 before any filtering or scoring
+        etag = api.live_data_etag(snapshot, page, page_size, served, state)
+        matched = match_etag(request.headers.get('if-none-match'), etag)
+        if matched is not None:
+            return not_modified_response(matched)
+
+        payload = await run_in_threadpool(api.live_data_payload, snapshot, page, page_size, served, state)
+        return json_response(request, payload, etag=etag)
+
+    except Exception as e:
+        logger.error(f"Error fetching live data: {e}")
+        return json_response(request, {
+            'success': False,
+            'error': str(e),
+            'message': 'Failed to fetch live seismic data'
+        }, status=500)
+
+
+async def wave_data(request: Request):
+    """/wave-data: cold fetches and refreshes are asyncio tasks, not threads"""
+    try:
+        start = time.perf_counter()
+        if api.wave_cache is not None:
+            result = await api.wave_cache.get_async(api.async_http_client)
+        else:
+            result = await collect_wave_data_async(
+                station_timeout=api.WAVE_STATION_TIMEOUT,
+                total_timeout=api.WAVE_TOTAL_TIMEOUT,
+                http_client=api.async_http_client
+            )
+
+        etag = api.wave_data_etag(result) if api.wave_cache is not None else None
+        return json_response(request, api.wave_data_payload(result, start), etag=etag)
+
+    except Exception as e:
+        logger.error(f"Error fetching wave data: {e}")
+        return json_response(request, {
+            'success': False,
+            'error': str(e),
+            'message': 'Failed to fetch wave data'
+        }, status=500)
+
+
+async def ocean_conditions(request: Request):
+    """/api/ocean/conditions: tide gauges and buoys fetched concurrently"""
+    try:
+        data = await fetch_ocean_conditions_async(tides_collector, buoys_collector, hours=6,
+                                                  http_client=api.async_http_client)
+        return json_response(request, {'success': True, 'data': data})
+    except Exception as e:
+        logger.error(f"Error fetching ocean conditions: {e}")
+        return json_response(request, {'success': False, 'error': str(e)}, status=500)
+
+
+async def incois_advisories(request: Request):
+    """/api/advisories/incois: the advisory feed is fetched once and assessed"""
+    try:
+        advisories = await incois_collector.fetch_current_advisories_async(api.async_http_client)
+        return json_response(request, {
+            'success': True,
+            'data': {
+                'advisories': advisories,
+                'risk_assessment': incois_collector.get_india_specific_risk(advisories)
+            }
+        })
+    except Exception as e:
+        logger.error(f"Error fetching INCOIS advisories: {e}")
+        return json_response(request, {'success': False, 'error': str(e)}, status=500)
+
+
+@asynccontextmanager
+async def lifespan(application):
+    """Create this worker's async client on its event loop, close it on shutdown"""
+    api.async_http_client = get_shared_async_client(api.config)
+    try:
+        yield
+    finally:
+        await api.async_http_client.close()
+
+
+application = Starlette(
+    routes=[
+        Route('/live-data', live_data, methods=['GET']),
+        Route('/wave-data', wave_data, methods=['GET']),
+        Route('/api/ocean/conditions', ocean_conditions, methods=['GET']),
+        Route('/api/advisories/incois', incois_advisories, methods=['GET']),
+        # Everything else (predictions, dashboard, health) stays on Flask
+        Mount('/', WSGIMiddleware(api.app, workers=api.worker_settings['threads']))
+    ],
+    lifespan=lifespan
+)
@@ -0,0 +1,83 @@
+"""
+Gunicorn configuration for the Tsunami Detection API
+
+Pre-fork worker pool sized from serving.workers in config/config.yaml:
+
+    gunicorn -c gunicorn.conf.py
+
+serves app.py on threaded workers, or asgi.py on uvicorn workers when
+serving.workers.asgi is set (the live data routes then run on asyncio).
+
+With preload (the default) the master imports app.py once, so ONNX/TFLite
+weights are loaded a single time and shared copy-on-write by every worker.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.serving.workers import resolve_worker_settings
+
+CONFIG_PATH = Path(__file__).parent / 'config' / 'config.yaml'
+
+try:
+    with open(CONFIG_PATH, 'r') as f:
+        _config = yaml.safe_load(f) or {}
+except Exception:
+    _config = {}
+
+settings = resolve_worker_settings(_config.get('serving', {}).get('workers', {}))
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = settings['workers']
+threads = settings['threads']
+if settings['asgi']:
+    wsgi_app = 'asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'app:app'
+    worker_class = settings['worker_class']
+timeout = settings['timeout']
+preload_app = settings['preload']
+
+loglevel = 'info'
+accesslog = '-'
+errorlog = '-'
+
+# Read by app.py, and by the model runtimes when they start, so every
+# worker's thread pools fit its share of the cores
+os.environ['PREFORK_SERVER'] = '1'
+os.environ.setdefault('OMP_NUM_THREADS', str(settings['intra_op_threads']))
+os.environ.setdefault('TF_NUM_INTRAOP_THREADS', str(settings['intra_op_threads']))
+os.environ.setdefault('TF_NUM_INTEROP_THREADS', str(settings['inter_op_threads']))
+
+
+def when_ready(server):
+    """Master: the app is imported and the sockets are bound, workers are next"""
+    server.log.info(f"{workers} {worker_class} workers x {threads} threads, "
+                    f"{settings['intra_op_threads']} model threads per worker, preload={preload_app}")
+    if preload_app and 'app' in sys.modules:
+        sys.modules['app'].prepare_fork()
+
+
+def post_fork(server, worker):
+    """Worker: restart the threads and connections that did not survive fork"""
+    if preload_app and 'app' in sys.modules:
+        sys.modules['app'].after_fork()
+
+
+def worker_exit(server, worker):
+    """Worker: exit without interpreter teardown when the model came from the master"""
+    if not preload_app:
+        return
+    # ONNX Runtime's global destructors join threads that only exist in the
+    # master, which hangs or aborts a forked worker on the way out
+    error = sys.exc_info()[1]
+    code = error.code if isinstance(error, SystemExit) else 1
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code if isinstance(code, int) else (0 if code is None else 1))
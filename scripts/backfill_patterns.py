@@ -0,0 +1,99 @@
+"""
+Catalog Backfill Script
+Build seismic patterns (and optionally scores) for an entire earthquake catalog
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+from src.serving.seismic_patterns import patterns_from_catalog
+from src.utils import setup_logger
+from loguru import logger
+
+
+def main():
+    """Main backfill function"""
+
+    parser = argparse.ArgumentParser(
+        description='Generate model inputs for an earthquake catalog (CSV with id, magnitude, depth, latitude, longitude)'
+    )
+    parser.add_argument(
+        'catalog',
+        type=str,
+        help='Catalog CSV file'
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default=None,
+        help='Output .npz (default: <catalog>_patterns.npz)'
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=10000,
+        help='Events generated per vectorized call'
+    )
+    parser.add_argument(
+        '--unseeded',
+        action='store_true',
+        help='Do not seed patterns from event ids'
+    )
+    parser.add_argument(
+        '--score',
+        action='store_true',
+        help='Also score the patterns with the binary model'
+    )
+    parser.add_argument(
+        '--backend',
+        type=str,
+        default='keras',
+        help='Inference backend used with --score'
+    )
+    parser.add_argument(
+        '--model',
+        type=str,
+        default='models/tsunami_detection_binary_focal.keras',
+        help='Path to the Keras model'
+    )
+
+    args = parser.parse_args()
+
+    setup_logger(level='INFO')
+
+    catalog = pd.read_csv(args.catalog)
+    catalog = catalog.dropna(subset=['magnitude', 'depth', 'latitude', 'longitude']).reset_index(drop=True)
+    logger.info(f"Loaded {len(catalog)} events from {args.catalog}")
+
+    model = None
+    if args.score:
+        from src.serving.backends import load_backend
+        model = load_backend(args.backend, args.model)
+
+    patterns = np.empty((len(catalog), 24, 32), dtype=np.float32)
+    probabilities = np.empty(len(catalog), dtype=np.float32) if model is not None else None
+
+    for start in range(0, len(catalog), args.chunk_size):
+        chunk = catalog.iloc[start:start + args.chunk_size]
+        patterns[start:start + len(chunk)] = patterns_from_catalog(chunk, seeded=not args.unseeded)
+        if model is not None:
+            probabilities[start:start + len(chunk)] = np.asarray(
+                model.predict(patterns[start:start + len(chunk)])
+            ).reshape(-1)
+
+    output_path = Path(args.output or Path(args.catalog).with_name(Path(args.catalog).stem + '_patterns.npz'))
+    arrays = {'X': patterns, 'ids': catalog['id'].to_numpy().astype(str)}
+    if probabilities is not None:
+        arrays['probabilities'] = probabilities
+    np.savez_compressed(output_path, **arrays)
+
+    logger.success(f"✅ Wrote {len(catalog)} patterns to {output_path}")
+
+
+if __name__ == '__main__':
+    main()
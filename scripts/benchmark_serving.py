@@ -0,0 +1,234 @@
+"""
+Serving Throughput Benchmark
+Measure /predict throughput of the gunicorn pool as the worker count grows
+"""
+
+import sys
+import os
+import json
+import time
+import signal
+import argparse
+import subprocess
+from multiprocessing import Pool
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import requests
+from src.serving.backends import BACKENDS
+from src.serving.payloads import RAW_CONTENT_TYPE, encode_raw
+from src.utils import setup_logger
+from loguru import logger
+
+ROOT = Path(__file__).parent.parent
+
+
+def start_server(workers, port, backend, threads, variant=None):
+    """Start gunicorn with gunicorn.conf.py and the given worker count"""
+    env = dict(os.environ, WORKERS=str(workers), THREADS=str(threads), PORT=str(port),
+               INFERENCE_BACKEND=backend)
+    if variant:
+        env['MODEL_VARIANT'] = variant
+    return subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'app:app'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+def stop_server(process):
+    """Stop the gunicorn master and its workers"""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=30)
+    except (ProcessLookupError, subprocess.TimeoutExpired):
+        os.killpg(process.pid, signal.SIGKILL)
+
+
+def wait_until_ready(url, workers, timeout):
+    """
+    Wait until every worker has answered /health with a loaded model
+
+    Returns:
+        Whether all workers became ready in time
+    """
+    ready = set()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            health = requests.get(f'{url}/health', timeout=5).json()
+            if health.get('model_loaded'):
+                ready.add(health['worker']['pid'])
+                if len(ready) >= workers:
+                    return True
+        except (requests.RequestException, ValueError, KeyError):
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def client_loop(args):
+    """
+    One client process: send unique windows until the duration is over
+
+    Every window is random, so the /predict input cache never answers.
+
+    Returns:
+        (request latencies in ms, error count)
+    """
+    url, duration, batch_size, seed = args
+    rng = np.random.default_rng(seed)
+    session = requests.Session()
+    latencies, errors = [], 0
+    headers = {'Content-Type': RAW_CONTENT_TYPE}
+
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        body = encode_raw(rng.random((batch_size, 24, 32), dtype=np.float32))
+        start = time.perf_counter()
+        try:
+            response = session.post(f'{url}/predict', data=body, headers=headers, timeout=30)
+            if response.status_code == 200:
+                latencies.append((time.perf_counter() - start) * 1000.0)
+            else:
+                errors += 1
+        except requests.RequestException:
+            errors += 1
+    return latencies, errors
+
+
+def run_load(url, clients, duration, batch_size):
+    """
+    Drive /predict from several client processes
+
+    Returns:
+        Dictionary with requests, errors, req/s and latency percentiles
+    """
+    with Pool(clients) as pool:
+        started = time.perf_counter()
+        results = pool.map(client_loop, [(url, duration, batch_size, seed) for seed in range(clients)])
+        elapsed = time.perf_counter() - started
+
+    latencies = np.array([value for result in results for value in result[0]])
+    errors = sum(result[1] for result in results)
+    return {
+        'requests': int(len(latencies)),
+        'errors': errors,
+        'requests_per_second': round(len(latencies) / elapsed, 1),
+        'samples_per_second': round(len(latencies) * batch_size / elapsed, 1),
+        'p50_ms': round(float(np.percentile(latencies, 50)), 2) if len(latencies) else None,
+        'p99_ms': round(float(np.percentile(latencies, 99)), 2) if len(latencies) else None
+    }
+
+
+def main():
+    """Main serving benchmark function"""
+
+    parser = argparse.ArgumentParser(
+        description='Benchmark /predict throughput against the gunicorn worker count'
+    )
+    parser.add_argument(
+        '--backend',
+        choices=BACKENDS,
+        default='onnx',
+        help='Inference backend to serve'
+    )
+    parser.add_argument(
+        '--variant',
+        type=str,
+        default=None,
+        help='Optional model variant, e.g. int8_dynamic'
+    )
+    parser.add_argument(
+        '--workers',
+        nargs='+',
+        type=int,
+        default=None,
+        help='Worker counts to test (default: 1, 2, 4, ... up to the core count)'
+    )
+    parser.add_argument(
+        '--threads',
+        type=int,
+        default=4,
+        help='Request threads per worker'
+    )
+    parser.add_argument(
+        '--clients',
+        type=int,
+        default=None,
+        help='Concurrent client processes (default: 2 per worker)'
+    )
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=15.0,
+        help='Seconds of load per worker count'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=1,
+        help='Windows per /predict request'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=5055,
+        help='Port for the benchmark server'
+    )
+    parser.add_argument(
+        '--startup-timeout',
+        type=float,
+        default=180.0,
+        help='Seconds to wait for every worker to load the model'
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default=None,
+        help='Write the JSON report to this file'
+    )
+
+    args = parser.parse_args()
+
+    setup_logger(level='INFO')
+
+    cores = os.cpu_count() or 1
+    worker_counts = args.workers or [count for count in (1, 2, 4, 8, 16, 32) if count <= cores]
+    url = f'http://127.0.0.1:{args.port}'
+    logger.info(f"Benchmarking {args.backend} /predict on {cores} cores, workers {worker_counts}")
+    if max(worker_counts) * 2 > cores:
+        logger.warning("Clients share the cores with the server, so the largest pools are under-measured")
+
+    results = []
+    for workers in worker_counts:
+        server = start_server(workers, args.port, args.backend, args.threads, args.variant)
+        try:
+            if not wait_until_ready(url, workers, args.startup_timeout):
+                logger.error(f"{workers} workers did not become ready in {args.startup_timeout:.0f}s")
+                continue
+            clients = args.clients or 2 * workers
+            run_load(url, clients, min(2.0, args.duration), args.batch_size)  # warm the pools
+            result = {'workers': workers, 'clients': clients,
+                      **run_load(url, clients, args.duration, args.batch_size)}
+        finally:
+            stop_server(server)
+
+        baseline = results[0]['requests_per_second'] if results else result['requests_per_second']
+        result['speedup'] = round(result['requests_per_second'] / baseline, 2) if baseline else None
+        results.append(result)
+        logger.info(f"{workers:>3} workers: {result['requests_per_second']:>8.1f} req/s "
+                    f"(x{result['speedup']}), p50 {result['p50_ms']} ms, p99 {result['p99_ms']} ms, "
+                    f"{result['errors']} errors")
+
+    report = {'backend': args.backend, 'variant': args.variant, 'cores': cores,
+              'batch_size': args.batch_size, 'threads': args.threads, 'results': results}
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        logger.info(f"Benchmark report written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
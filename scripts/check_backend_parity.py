@@ -0,0 +1,149 @@
+"""
+Backend Parity Check
+Compare binary model probabilities across Keras, ONNX Runtime and TFLite
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from src.serving.backends import BACKENDS, backend_model_path, load_backend, compare_backends
+from src.utils import setup_logger
+from src.utils.data_helpers import create_synthetic_windows
+from loguru import logger
+
+
+def load_reference_set(reference_path=None, n_samples=512, seed=42) -> np.ndarray:
+    """
+    Load reference windows from a .npy/.npz file or generate synthetic ones
+    
+    Args:
+        reference_path: Optional .npy file, or .npz with an 'X' array
+        n_samples: Number of synthetic windows when no file is given
+        seed: Random seed for synthetic windows
+        
+    Returns:
+        Float32 array (n, 24, 32)
+    """
+    if reference_path:
+        data = np.load(reference_path)
+        X = data['X'] if hasattr(data, 'files') else data
+        return np.asarray(X, dtype=np.float32)
+    
+    X, _ = create_synthetic_windows(n_samples=n_samples, seed=seed)
+    return X
+
+
+def load_alert_threshold(model_path, default=0.1) -> float:
+    """Read the alert threshold from model_metadata.json next to the model"""
+    metadata_path = Path(model_path).parent / 'model_metadata.json'
+    if not metadata_path.exists():
+        return default
+    return json.loads(metadata_path.read_text()).get('threshold', default)
+
+
+def run_parity_check(model_path, backends, reference, threshold, tolerance) -> dict:
+    """
+    Load the requested backends and compare them against Keras
+    
+    Returns:
+        Parity report (see compare_backends)
+    """
+    loaded = {'keras': load_backend('keras', model_path)}
+    for name in backends:
+        if name == 'keras':
+            continue
+        if not backend_model_path(model_path, name).exists():
+            logger.warning(f"Skipping {name}: {backend_model_path(model_path, name)} not found")
+            continue
+        loaded[name] = load_backend(name, model_path)
+    
+    report = compare_backends(loaded, reference, threshold=threshold, tolerance=tolerance)
+    
+    for name, result in report['backends'].items():
+        log = logger.success if result['passed'] else logger.error
+        log(f"{name:>7}: max |Δp|={result['max_abs_diff']:.2e}, "
+            f"mean |Δp|={result['mean_abs_diff']:.2e}, "
+            f"alert mismatches={result['alert_mismatches']}/{report['samples']}")
+    
+    return report
+
+
+def main():
+    """Main parity check function"""
+    
+    parser = argparse.ArgumentParser(
+        description='Compare inference backends on a reference set'
+    )
+    parser.add_argument(
+        '--model',
+        type=str,
+        default='models/tsunami_detection_binary_focal.keras',
+        help='Path to the Keras model (exports are looked up next to it)'
+    )
+    parser.add_argument(
+        '--backends',
+        nargs='+',
+        choices=BACKENDS,
+        default=['onnx', 'tflite'],
+        help='Backends to compare against Keras'
+    )
+    parser.add_argument(
+        '--reference',
+        type=str,
+        default=None,
+        help='Reference windows (.npy, or .npz with X); synthetic if omitted'
+    )
+    parser.add_argument(
+        '--samples',
+        type=int,
+        default=512,
+        help='Number of synthetic reference windows'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=None,
+        help='Alert threshold (default from models/model_metadata.json)'
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=1e-4,
+        help='Maximum allowed absolute probability difference'
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default=None,
+        help='Write the JSON report to this file'
+    )
+    
+    args = parser.parse_args()
+    
+    setup_logger(level='INFO')
+    
+    threshold = args.threshold if args.threshold is not None else load_alert_threshold(args.model)
+    
+    reference = load_reference_set(args.reference, args.samples)
+    logger.info(f"Comparing backends on {len(reference)} reference windows (threshold={threshold})")
+    
+    report = run_parity_check(args.model, args.backends, reference, threshold, args.tolerance)
+    
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        logger.info(f"Parity report written to {args.output}")
+    
+    if not report['passed']:
+        logger.error("Backend parity check FAILED")
+        sys.exit(1)
+    
+    logger.success("Backend parity check passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Model Export Script
+Convert the binary Keras model to ONNX and TFLite serving artifacts
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.serving.backends import backend_model_path
+from src.serving.model_export import export_onnx, export_tflite
+from src.utils import setup_logger
+from loguru import logger
+
+
+def main():
+    """Main export function"""
+    
+    parser = argparse.ArgumentParser(
+        description='Export the binary tsunami model to ONNX / TFLite'
+    )
+    parser.add_argument(
+        '--model',
+        type=str,
+        default='models/tsunami_detection_binary_focal.keras',
+        help='Path to the Keras model'
+    )
+    parser.add_argument(
+        '--formats',
+        nargs='+',
+        choices=['onnx', 'tflite'],
+        default=['onnx', 'tflite'],
+        help='Formats to export'
+    )
+    parser.add_argument(
+        '--opset',
+        type=int,
+        default=17,
+        help='ONNX opset version'
+    )
+    parser.add_argument(
+        '--skip-parity',
+        action='store_true',
+        help='Do not compare exported models against Keras'
+    )
+    
+    args = parser.parse_args()
+    
+    setup_logger(level='INFO')
+    
+    logger.info("=" * 60)
+    logger.info("📦 TSUNAMI MODEL EXPORT")
+    logger.info("=" * 60)
+    
+    from tensorflow import keras
+    model = keras.models.load_model(args.model, compile=False)
+    logger.info(f"Loaded {args.model} ({model.count_params():,} parameters)")
+    
+    if 'onnx' in args.formats:
+        export_onnx(model, backend_model_path(args.model, 'onnx'), opset=args.opset)
+    
+    if 'tflite' in args.formats:
+        export_tflite(model, backend_model_path(args.model, 'tflite'))
+    
+    if args.skip_parity:
+        return
+    
+    from check_backend_parity import load_alert_threshold, load_reference_set, run_parity_check
+    
+    report = run_parity_check(args.model, args.formats, load_reference_set(),
+                              threshold=load_alert_threshold(args.model), tolerance=1e-4)
+    if not report['passed']:
+        logger.error("Exported models do not match Keras within tolerance")
+        sys.exit(1)
+    
+    logger.success("✅ Export completed and parity verified")
+
+
+if __name__ == '__main__':
+    main()
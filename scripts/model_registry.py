@@ -0,0 +1,128 @@
+"""
+Model Registry Script
+Publish, list, activate and roll back served model versions
+"""
+
+import sys
+import shutil
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.serving.model_registry import ModelRegistry, METADATA_FILE, PIN_FILE
+from src.utils import setup_logger
+from loguru import logger
+
+ARTIFACT_SUFFIXES = ('.keras', '.onnx', '.tflite')
+
+
+def load_registry(config_path: str, root: str = None) -> ModelRegistry:
+    """Registry configured as in app.py (versions are only listed, never loaded)"""
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f)
+    registry_config = config.get('serving', {}).get('model_registry', {})
+    # Every published version carries its metadata, whichever backend serves it
+    return ModelRegistry(root or registry_config.get('path') or 'models/registry',
+                         artifact=METADATA_FILE, load_fn=lambda path: None,
+                         fallback_dir='models', settle_seconds=0, name='cli')
+
+
+def publish(registry: ModelRegistry, source: Path, version: str):
+    """
+    Copy the artifacts and metadata in source into a new version
+
+    The files are copied into a hidden directory that is renamed into place,
+    so watching servers never see a half-copied version.
+    """
+    target = registry.root / version
+    if target.exists():
+        raise FileExistsError(f"Model version {version} already exists in {registry.root}")
+
+    files = [path for path in sorted(source.iterdir())
+             if path.is_file() and (path.suffix in ARTIFACT_SUFFIXES or path.name == METADATA_FILE)]
+    if not any(path.name == METADATA_FILE for path in files):
+        raise FileNotFoundError(f"{source / METADATA_FILE} not found")
+
+    staging = registry.root / f'.{version}.tmp'
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    for path in files:
+        shutil.copy2(path, staging / path.name)
+        logger.info(f"  {path.name} ({path.stat().st_size / 1024:.0f} KB)")
+    staging.rename(target)
+    logger.success(f"Published {source} as model version {version}")
+
+
+def main():
+    """Main registry function"""
+
+    parser = argparse.ArgumentParser(
+        description='Manage the versioned model registry served by app.py'
+    )
+    parser.add_argument('--config', type=str, default='config/config.yaml',
+                        help='Path to configuration file')
+    parser.add_argument('--root', type=str, default=None,
+                        help='Registry directory (default: serving.model_registry.path)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('list', help='List versions, the pin and the served target')
+
+    publish_parser = commands.add_parser('publish', help='Copy trained artifacts into a new version')
+    publish_parser.add_argument('--source', type=str, default='models',
+                                help='Directory with the artifacts and model_metadata.json')
+    publish_parser.add_argument('--version', type=str, default=None,
+                                help='Version name (default: UTC timestamp)')
+
+    activate_parser = commands.add_parser('activate', help='Pin a version')
+    activate_parser.add_argument('version', type=str)
+
+    commands.add_parser('rollback', help='Pin the version before the served one')
+    commands.add_parser('unpin', help='Serve the newest version again')
+
+    args = parser.parse_args()
+
+    setup_logger(level='INFO')
+    registry = load_registry(args.config, args.root)
+
+    if args.command == 'list':
+        versions = registry.versions()
+        target, pinned = registry.target(), registry.pinned()
+        logger.info(f"Registry: {registry.root}")
+        if not versions:
+            logger.info(f"No versions; serving the files in {registry.fallback_dir}")
+        for version in versions:
+            marks = [label for label, match in (('served', version == target),
+                                                ('pinned', version == pinned)) if match]
+            logger.info(f"  {version}{'  (' + ', '.join(marks) + ')' if marks else ''}")
+
+    elif args.command == 'publish':
+        version = args.version or datetime.utcnow().strftime('%Y%m%d-%H%M%S')
+        publish(registry, Path(args.source), version)
+
+    elif args.command == 'activate':
+        if args.version not in registry.versions():
+            logger.error(f"Unknown model version {args.version}")
+            sys.exit(1)
+        registry.pin(args.version)
+        logger.success(f"Pinned {args.version}; servers swap within one poll interval")
+
+    elif args.command == 'rollback':
+        versions, target = registry.versions(), registry.target()
+        if target not in versions or versions.index(target) == 0:
+            logger.error(f"No version before {target} to roll back to")
+            sys.exit(1)
+        version = versions[versions.index(target) - 1]
+        registry.pin(version)
+        logger.success(f"Rolled back {target} -> {version} (pinned in {registry.root / PIN_FILE})")
+
+    elif args.command == 'unpin':
+        registry.unpin()
+        logger.success(f"Unpinned; serving {registry.target()}")
+
+
+if __name__ == "__main__":
+    main()
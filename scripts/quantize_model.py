@@ -0,0 +1,247 @@
+"""
+Model Quantization Script
+Post-training int8 quantization of the binary model with an accuracy-regression report
+"""
+
+import sys
+import json
+import argparse
+import tempfile
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from src.serving.backends import backend_model_path, load_backend
+from src.serving.model_export import QUANTIZATION_MODES, export_tflite
+from src.serving.quantization import evaluate_model, check_regression
+from src.utils import setup_logger
+from src.utils.data_helpers import create_synthetic_windows
+from check_backend_parity import load_alert_threshold
+from loguru import logger
+
+
+# Artifact variant per quantization mode (see backend_model_path)
+VARIANTS = {
+    'dynamic': 'int8_dynamic',
+    'int8': 'int8'
+}
+
+
+def load_windows(data_path=None, n_samples=2000, eval_fraction=0.2, seed=42):
+    """
+    Load training windows and split them into calibration and evaluation sets
+
+    Args:
+        data_path: Optional .npz file with 'X' (n, 24, 32) and 'y' (n,) arrays
+        n_samples: Number of synthetic windows when no file is given
+        eval_fraction: Fraction of windows held out for evaluation
+        seed: Random seed for synthetic data and the split
+
+    Returns:
+        Tuple of (calibration windows, evaluation windows, evaluation labels)
+    """
+    if data_path:
+        data = np.load(data_path)
+        X = np.asarray(data['X'], dtype=np.float32)
+        y = np.asarray(data['y']).reshape(-1)
+    else:
+        X, y = create_synthetic_windows(n_samples=n_samples, seed=seed)
+
+    order = np.random.default_rng(seed).permutation(len(X))
+    n_eval = max(int(len(X) * eval_fraction), 1)
+    eval_idx, calib_idx = order[:n_eval], order[n_eval:]
+
+    return X[calib_idx], X[eval_idx], y[eval_idx]
+
+
+def _export_worker(model_path, output_path, mode, calibration_path):
+    """Run one conversion (executed in a child process)"""
+    from tensorflow import keras
+
+    model = keras.models.load_model(model_path, compile=False)
+    calibration = np.load(calibration_path) if mode == 'int8' else None
+    export_tflite(model, output_path, quantization=mode, calibration_windows=calibration)
+
+
+def quantize(model_path, mode, calibration_windows) -> dict:
+    """
+    Export one quantized TFLite model in an isolated process
+
+    The TFLite calibrator can abort the whole interpreter on unsupported
+    graphs, so each conversion runs in its own process and a crash is
+    reported instead of ending the run.
+
+    Returns:
+        Dictionary with the artifact path, or the failure reason
+    """
+    output_path = backend_model_path(model_path, 'tflite', VARIANTS[mode])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        calibration_path = Path(tmp) / 'calibration.npy'
+        np.save(calibration_path, calibration_windows)
+
+        context = multiprocessing.get_context('spawn')
+        process = context.Process(
+            target=_export_worker,
+            args=(str(model_path), str(output_path), mode, str(calibration_path))
+        )
+        process.start()
+        process.join()
+
+    if process.exitcode != 0:
+        reason = (f"converter crashed (signal {-process.exitcode})" if process.exitcode < 0
+                  else f"converter exited with code {process.exitcode}")
+        logger.error(f"{mode} quantization failed: {reason}")
+        return {'mode': mode, 'converted': False, 'error': reason}
+
+    return {'mode': mode, 'converted': True, 'model_path': str(output_path)}
+
+
+def _fmt(value):
+    """Format an optional metric"""
+    return 'n/a' if value is None else f"{value:.4f}"
+
+
+def _public(result):
+    """Drop raw probabilities from an evaluation before writing the report"""
+    return {key: value for key, value in result.items() if key != 'probabilities'}
+
+
+def main():
+    """Main quantization function"""
+
+    parser = argparse.ArgumentParser(
+        description='Quantize the binary tsunami model to int8 and check for recall regressions'
+    )
+    parser.add_argument(
+        '--model',
+        type=str,
+        default='models/tsunami_detection_binary_focal.keras',
+        help='Path to the Keras model'
+    )
+    parser.add_argument(
+        '--modes',
+        nargs='+',
+        choices=QUANTIZATION_MODES,
+        default=list(QUANTIZATION_MODES),
+        help='Quantization modes (dynamic-range and/or full-integer)'
+    )
+    parser.add_argument(
+        '--data',
+        type=str,
+        default=None,
+        help=".npz with training windows 'X' and labels 'y' (default: synthetic windows)"
+    )
+    parser.add_argument(
+        '--samples',
+        type=int,
+        default=2000,
+        help='Number of synthetic windows when --data is not given'
+    )
+    parser.add_argument(
+        '--calibration-samples',
+        type=int,
+        default=500,
+        help='Windows used as the representative dataset'
+    )
+    parser.add_argument(
+        '--max-recall-drop',
+        type=float,
+        default=0.0,
+        help='Allowed absolute recall drop on tsunami positives'
+    )
+    parser.add_argument(
+        '--latency-runs',
+        type=int,
+        default=200,
+        help='Timed single-sample calls per model'
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default='models/quantization_report.json',
+        help='Where to write the report'
+    )
+
+    args = parser.parse_args()
+
+    setup_logger(level='INFO')
+
+    logger.info("=" * 60)
+    logger.info("🔢 TSUNAMI MODEL QUANTIZATION")
+    logger.info("=" * 60)
+
+    threshold = load_alert_threshold(args.model)
+    calibration, X_eval, y_eval = load_windows(args.data, n_samples=args.samples)
+    calibration = calibration[:args.calibration_samples]
+    logger.info(f"Calibration windows: {len(calibration)}, evaluation windows: {len(X_eval)} "
+                f"({int(y_eval.sum())} positives), threshold: {threshold}")
+
+    # The float TFLite model is the reference: same runtime, same fixed batch size
+    float_path = backend_model_path(args.model, 'tflite')
+    if not float_path.exists():
+        from tensorflow import keras
+        export_tflite(keras.models.load_model(args.model, compile=False), float_path)
+
+    reference = evaluate_model(load_backend('tflite', args.model), float_path,
+                               X_eval, y_eval, threshold, args.latency_runs)
+    keras_result = evaluate_model(load_backend('keras', args.model), args.model,
+                                  X_eval, y_eval, threshold, args.latency_runs)
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'model': args.model,
+        'data': args.data or f'synthetic ({args.samples} windows)',
+        'threshold': threshold,
+        'calibration_samples': int(len(calibration)),
+        'evaluation_samples': int(len(X_eval)),
+        'evaluation_positives': int(y_eval.sum()),
+        'float': {'keras': _public(keras_result), 'tflite': _public(reference)},
+        'quantized': {},
+        'passed': True
+    }
+
+    for mode in args.modes:
+        entry = quantize(args.model, mode, calibration)
+
+        if entry['converted']:
+            result = evaluate_model(load_backend('tflite', args.model, variant=VARIANTS[mode]),
+                                    entry['model_path'], X_eval, y_eval, threshold, args.latency_runs)
+            regression = check_regression(reference, result, y_eval, threshold, args.max_recall_drop)
+            entry.update(_public(result))
+            entry['vs_float'] = regression
+            report['passed'] = report['passed'] and regression['passed']
+
+            log = logger.success if regression['passed'] else logger.error
+            log(f"{mode:>7}: recall {_fmt(result['recall'])} (float {_fmt(reference['recall'])}), "
+                f"newly missed positives {regression['newly_missed_positives']}, "
+                f"AUC {_fmt(result['auc'])}, {result['size_kb']:.0f} KB "
+                f"(x{regression['size_ratio']}), p50 {result['latency']['p50_ms']:.3f} ms")
+
+            if not regression['passed']:
+                # A regressing model must never be picked up by the serving nodes
+                Path(entry['model_path']).unlink(missing_ok=True)
+                entry['model_path'] = None
+
+        report['quantized'][mode] = entry
+
+    if not any(entry['converted'] for entry in report['quantized'].values()):
+        report['passed'] = False
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, indent=2))
+    logger.info(f"Report written to {output_path}")
+
+    if not report['passed']:
+        logger.error("❌ No quantized model can replace the float model without losing recall")
+        sys.exit(1)
+
+    logger.success("✅ Quantized models keep float recall on tsunami positives")
+
+
+if __name__ == '__main__':
+    main()
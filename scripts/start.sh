@@ -3,14 +3,11 @@ set -e
 
 # Default to port 5000 if PORT is not set
 PORT=${PORT:-5000}
+export PORT
 
 echo "Starting Tsunami Detection API on port $PORT..."
 
-# Start gunicorn with the PORT variable
-exec gunicorn app:app \
-  --bind 0.0.0.0:$PORT \
-  --workers 2 \
-  --timeout 120 \
-  --log-level info \
-  --access-logfile - \
-  --error-logfile -
+# Pre-fork gunicorn pool: workers, threads, model thread pools and the app
+# (app.py, or asgi.py on uvicorn workers) come from serving.workers in
+# config/config.yaml (WORKERS / THREADS / ASGI env vars override)
+exec gunicorn -c gunicorn.conf.py
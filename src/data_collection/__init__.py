@@ -1,18 +1,52 @@
 """
 Data Collection Module
 Handles real-time data ingestion from public APIs
+
+Exports are imported on first access, so an API worker that only needs
+a few submodules (the USGS poller, say) does not load the bathymetry
+loader (xarray) or the other collectors.
 """
 
-from .usgs_collector import USGSEarthquakeCollector
-from .noaa_tides_collector import NOAATidesCollector
-from .noaa_buoys_collector import NOAABuoysCollector
-from .incois_collector import INCOISCollector
-from .bathymetry_loader import BathymetryLoader
-
-__all__ = [
-    'USGSEarthquakeCollector',
-    'NOAATidesCollector',
-    'NOAABuoysCollector',
-    'INCOISCollector',
-    'BathymetryLoader'
-]
+from importlib import import_module
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'HTTPClient': 'http_client',
+    'get_shared_client': 'http_client',
+    'AsyncHTTPClient': 'async_http_client',
+    'get_shared_async_client': 'async_http_client',
+    'USGSEarthquakeCollector': 'usgs_collector',
+    'USGSPoller': 'usgs_poller',
+    'EarthquakeSnapshot': 'usgs_poller',
+    'get_shared_poller': 'usgs_poller',
+    'collect_wave_data': 'wave_stations',
+    'collect_wave_data_async': 'wave_stations',
+    'WaveStationCache': 'wave_stations',
+    'WAVE_STATIONS': 'wave_stations',
+    'NOAATidesCollector': 'noaa_tides_collector',
+    'NOAABuoysCollector': 'noaa_buoys_collector',
+    'INCOISCollector': 'incois_collector',
+    'analyze_ocean_conditions': 'ocean_conditions',
+    'summarize_ocean_conditions': 'ocean_conditions',
+    'fetch_ocean_conditions_async': 'ocean_conditions',
+    'ParallelAcquisition': 'acquisition',
+    'RefreshPolicy': 'source_scheduler',
+    'SourceValue': 'source_scheduler',
+    'LatestValueStore': 'source_scheduler',
+    'SourceScheduler': 'source_scheduler',
+    'BathymetryLoader': 'bathymetry_loader'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
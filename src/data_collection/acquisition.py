@@ -0,0 +1,133 @@
+"""
+Parallel Data Acquisition
+Concurrent source fetches with per-source and overall deadlines
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict
+
+from loguru import logger
+
+
+# Shared pool so overlapping checks do not each spawn their own threads
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='acquisition')
+
+
+class ParallelAcquisition:
+    """
+    One acquisition stage: every fetch starts at once, results are awaited per source
+
+    Fetches are grouped by source (e.g. one per tide station under
+    'noaa_tides'). Each source has its own deadline, measured from the
+    start of the stage and capped by the overall deadline; a fetch that
+    has not finished by then is treated as missing, whether or not it
+    completes later. :meth:`report` records which sources arrived in time.
+    """
+
+    def __init__(self, source_timeouts: Dict[str, float], total_timeout: float = 20.0):
+        """
+        Initialize acquisition stage
+
+        Args:
+            source_timeouts: {source: deadline in seconds from the start}
+            total_timeout: Deadline for the whole stage in seconds
+        """
+        self.start = time.monotonic()
+        self.total_timeout = float(total_timeout)
+        self.source_timeouts = {source: min(float(timeout), self.total_timeout)
+                                for source, timeout in source_timeouts.items()}
+        self._futures: Dict[str, Dict[str, Any]] = {}
+        self._completed_at: Dict[Any, float] = {}
+        self._report: Dict[str, Dict] = {}
+
+    def timeout(self, source: str) -> float:
+        """Deadline of a source in seconds from the start"""
+        return self.source_timeouts.get(source, self.total_timeout)
+
+    def submit(self, source: str, key: str, fn: Callable, *args, **kwargs):
+        """
+        Start a fetch on the shared pool
+
+        Args:
+            source: Source the fetch belongs to
+            key: Name of this fetch within the source (e.g. station id)
+            fn: Fetch function
+            *args, **kwargs: Passed to ``fn``
+        """
+        future = _executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda f: self._completed_at.setdefault(f, time.monotonic()))
+        self._futures.setdefault(source, {})[key] = future
+
+    def collect(self, source: str) -> Dict[str, Any]:
+        """
+        Wait for a source until its deadline
+
+        Args:
+            source: Source to collect
+
+        Returns:
+            {key: result} of the fetches that finished in time without an error
+        """
+        futures = self._futures.get(source, {})
+        deadline = self.start + self.timeout(source)
+        if futures:
+            wait(list(futures.values()), timeout=max(0.0, deadline - time.monotonic()))
+
+        results, late, failed = {}, [], []
+        for key, future in futures.items():
+            if not future.done() or future.cancelled():
+                late.append(key)
+                continue
+            # wait() can return before the done callback has recorded the time
+            if self._completed_at.setdefault(future, time.monotonic()) > deadline:
+                late.append(key)
+                continue
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                logger.warning(f"{source} fetch {key} failed: {e}")
+                failed.append(key)
+
+        finished = [self._completed_at[future] for key, future in futures.items() if key in results]
+        self._report[source] = {
+            'status': 'ok' if not late and not failed else ('partial' if results else 'missing'),
+            'elapsed_ms': round((max(finished) - self.start) * 1000.0, 1) if finished else None,
+            'deadline_seconds': self.timeout(source),
+            'late': late,
+            'failed': failed
+        }
+        if late:
+            logger.warning(f"{source}: {len(late)}/{len(futures)} fetches missed the "
+                           f"{self.timeout(source):g}s deadline ({', '.join(late)})")
+        return results
+
+    def close(self) -> Dict[str, Dict]:
+        """
+        End the stage: cancel fetches still queued and report every source
+
+        Sources that were started but never collected (not needed after all)
+        are reported as 'skipped'; fetches already running are left to
+        finish in the background.
+
+        Returns:
+            {source: {'status', 'elapsed_ms', 'deadline_seconds', 'late', 'failed'}}
+        """
+        for source, futures in self._futures.items():
+            for future in futures.values():
+                if not future.done():
+                    future.cancel()
+            if source not in self._report:
+                self._report[source] = {'status': 'skipped', 'elapsed_ms': None,
+                                        'deadline_seconds': self.timeout(source),
+                                        'late': [], 'failed': []}
+        return self.report()
+
+    def report(self) -> Dict[str, Dict]:
+        """Per-source arrival report so far"""
+        return {source: dict(entry) for source, entry in self._report.items()}
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the stage started"""
+        return round((time.monotonic() - self.start) * 1000.0, 1)
@@ -0,0 +1,379 @@
+"""
+Async HTTP Client
+Non-blocking counterpart of the pooled HTTP client for the async API endpoints
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlencode, urlsplit
+
+from loguru import logger
+
+from .http_client import RETRY_STATUSES, _ConditionalEntry, _HostMetrics, _SourceMetrics
+
+try:
+    import aiohttp
+except ImportError:  # only needed by the async endpoints (asgi.py)
+    aiohttp = None
+
+
+# Failures of an async fetch (the sync collectors catch RequestException)
+if aiohttp is not None:
+    ASYNC_REQUEST_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+else:
+    ASYNC_REQUEST_ERRORS = (asyncio.TimeoutError,)
+
+
+class AsyncResponse:
+    """
+    Fully read response with the parts of the ``requests.Response`` API the
+    collectors' parsers use (status_code, headers, content, text, json())
+    """
+
+    def __init__(self, url: str, status_code: int, headers, content: bytes,
+                 encoding: Optional[str] = None, reason: Optional[str] = None, request_info=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+        self.reason = reason
+        self.request_info = request_info
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        """Raise aiohttp.ClientResponseError for 4xx/5xx statuses"""
+        if self.status_code >= 400:
+            raise aiohttp.ClientResponseError(
+                self.request_info, (), status=self.status_code, message=self.reason or '',
+                headers=self.headers
+            )
+
+
+class AsyncHTTPClient:
+    """
+    aiohttp-based HTTP client for code running on an event loop
+
+    Mirrors :class:`HTTPClient`: the same system.http settings, per-host
+    keep-alive pools and concurrency caps, full-jitter retries on
+    connection errors, timeouts and 429/5xx, per-host timing metrics and
+    conditional requests. Waiting on an upstream never blocks a thread, so
+    one event loop can overlap many slow fetches.
+
+    The session belongs to the event loop that first used the client; a
+    client reused from another loop opens a new session there.
+    """
+
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        Initialize async HTTP client
+
+        Args:
+            config: Configuration dictionary (system.api_timeout_seconds,
+                system.max_api_retries and system.http)
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for the async endpoints: pip install aiohttp")
+
+        system_config = (config or {}).get('system', {})
+        http_config = system_config.get('http', {})
+
+        self.timeout = float(system_config.get('api_timeout_seconds', 30))
+        self.max_retries = int(system_config.get('max_api_retries', 3))
+        self.backoff_base = float(http_config.get('backoff_base_seconds', 0.5))
+        self.backoff_max = float(http_config.get('backoff_max_seconds', 10.0))
+        self.pool_connections = int(http_config.get('pool_connections', 10))
+        self.pool_maxsize = int(http_config.get('pool_maxsize', 10))
+        self.per_host_concurrency = int(http_config.get('per_host_concurrency', 8))
+        self.conditional_max_entries = int(http_config.get('conditional_max_entries', 256))
+        self.user_agent = http_config.get('user_agent', 'tsunami-monitor/1.0')
+
+        self._session: Optional['aiohttp.ClientSession'] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._metrics: Dict[str, _HostMetrics] = {}
+
+        self._conditional: 'OrderedDict[str, _ConditionalEntry]' = OrderedDict()
+        self._source_metrics: Dict[str, _SourceMetrics] = {}
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """Session (and per-host semaphores) for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_connections * self.pool_maxsize,
+                limit_per_host=self.pool_maxsize,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': self.user_agent},
+                trace_configs=[self._trace_config()]
+            )
+            self._loop = loop
+            self._host_limits = {}
+        return self._session
+
+    @staticmethod
+    def _trace_config() -> 'aiohttp.TraceConfig':
+        """Record connection setup and time to first byte on the request's context"""
+        trace = aiohttp.TraceConfig()
+
+        async def on_connection_create_start(session, context, params):
+            context.trace_request_ctx.connect_start = time.perf_counter()
+
+        async def on_connection_create_end(session, context, params):
+            timing = context.trace_request_ctx
+            timing.connect_ms += (time.perf_counter() - timing.connect_start) * 1000.0
+            timing.new_connections += 1
+
+        async def on_request_end(session, context, params):
+            timing = context.trace_request_ctx
+            timing.ttfb_ms = (time.perf_counter() - timing.start) * 1000.0
+
+        trace.on_connection_create_start.append(on_connection_create_start)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_request_end.append(on_request_end)
+        return trace
+
+    def _host_state(self, host: str):
+        """Concurrency semaphore and metrics for a host"""
+        if host not in self._metrics:
+            self._metrics[host] = _HostMetrics()
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return self._host_limits[host], self._metrics[host]
+
+    def _backoff(self, attempt: int, response: Optional[AsyncResponse] = None) -> float:
+        """Full-jitter exponential backoff, honouring a numeric Retry-After"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return random.uniform(0.0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def _client_timeout(timeout) -> 'aiohttp.ClientTimeout':
+        """aiohttp timeout from seconds or a (connect, read) tuple"""
+        if isinstance(timeout, tuple):
+            return aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+        return aiohttp.ClientTimeout(total=timeout)
+
+    async def get(self, url: str, params: Optional[Dict] = None, timeout=None,
+                  max_retries: Optional[int] = None, headers: Optional[Dict] = None) -> AsyncResponse:
+        """
+        Send a GET request and read the body
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            timeout: Timeout in seconds or (connect, read) tuple (default from config)
+            max_retries: Retry budget for this call (default from config; 0 for
+                deadline-bound fetches)
+            headers: Extra request headers
+
+        Returns:
+            The final response (non-retryable statuses are returned as is)
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: If every attempt failed
+        """
+        timeout = self.timeout if timeout is None else timeout
+        max_retries = self.max_retries if max_retries is None else max_retries
+        session = self._get_session()
+        host = urlsplit(url).netloc
+        limit, metrics = self._host_state(host)
+
+        slot_timeout = timeout[0] if isinstance(timeout, tuple) else timeout
+        try:
+            await asyncio.wait_for(limit.acquire(), slot_timeout)
+        except asyncio.TimeoutError:
+            metrics.errors += 1
+            raise aiohttp.ServerTimeoutError(
+                f"Timed out waiting for a connection slot to {host} "
+                f"({self.per_host_concurrency} concurrent requests)"
+            )
+
+        metrics.in_flight += 1
+        try:
+            attempt = 0
+            while True:
+                timing = SimpleNamespace(start=time.perf_counter(), connect_start=0.0,
+                                         connect_ms=0.0, new_connections=0, ttfb_ms=None)
+                response = None
+                error = None
+                try:
+                    async with session.get(url, params=params, headers=headers,
+                                           timeout=self._client_timeout(timeout),
+                                           trace_request_ctx=timing) as raw:
+                        content = await raw.read()
+                        response = AsyncResponse(str(raw.url), raw.status, raw.headers, content,
+                                                 encoding=raw.get_encoding() if content else None,
+                                                 reason=raw.reason, request_info=raw.request_info)
+                except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError,
+                        asyncio.TimeoutError) as e:
+                    error = e
+                total_ms = (time.perf_counter() - timing.start) * 1000.0
+
+                metrics.requests += 1
+                metrics.new_connections += timing.new_connections
+                metrics.connect_ms += timing.connect_ms
+                metrics.total_ms += total_ms
+                metrics.max_total_ms = max(metrics.max_total_ms, total_ms)
+                if timing.ttfb_ms is not None:
+                    metrics.ttfb_ms += timing.ttfb_ms
+                if error is not None or response.status_code >= 500:
+                    metrics.errors += 1
+
+                retryable = error is not None or response.status_code in RETRY_STATUSES
+                if not retryable or attempt >= max_retries:
+                    if error is not None:
+                        raise error
+                    return response
+
+                delay = self._backoff(attempt, response)
+                attempt += 1
+                metrics.retries += 1
+                logger.debug(f"Retrying {host} in {delay:.2f}s (attempt {attempt}/{max_retries}): "
+                             f"{error if error is not None else response.status_code}")
+                await asyncio.sleep(delay)
+        finally:
+            metrics.in_flight -= 1
+            limit.release()
+
+    async def get_conditional(self, url: str, parse: Callable[[AsyncResponse], Any],
+                              params: Optional[Dict] = None, source: Optional[str] = None,
+                              **kwargs) -> Any:
+        """
+        Conditional GET that reuses the previous parse when nothing changed
+
+        Same semantics as :meth:`HTTPClient.get_conditional`: validators of
+        the last full download are sent, and a 304 or an unchanged body
+        returns the previous parse without calling ``parse``.
+
+        Args:
+            url: Request URL
+            parse: Builds the result from a 200 response
+            params: Query parameters
+            source: Name under which bytes saved and parse time avoided are reported
+            **kwargs: Passed through to :meth:`get` (timeout, max_retries, ...)
+
+        Returns:
+            Parsed value (fresh or reused)
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: If the request fails or
+                returns an error status
+        """
+        key = f"{url}?{urlencode(params)}" if params else url
+        source = source or urlsplit(url).netloc
+        entry = self._conditional.get(key)
+        metrics = self._source_metrics.setdefault(source, _SourceMetrics())
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        response = await self.get(url, params=params, headers=headers, **kwargs)
+        metrics.requests += 1
+
+        if response.status_code == 304 and entry is not None:
+            metrics.not_modified += 1
+            metrics.bytes_saved += entry.size
+            metrics.parse_ms_saved += entry.parse_ms
+            self._conditional.move_to_end(key)
+            return entry.value
+
+        response.raise_for_status()
+        content_hash = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+
+        if entry is not None and entry.content_hash == content_hash:
+            value, parse_ms = entry.value, entry.parse_ms
+            metrics.unchanged += 1
+            metrics.parse_ms_saved += parse_ms
+        else:
+            start = time.perf_counter()
+            value = parse(response)
+            parse_ms = (time.perf_counter() - start) * 1000.0
+            metrics.parsed += 1
+            metrics.parse_ms += parse_ms
+
+        metrics.bytes_downloaded += len(response.content)
+        self._conditional[key] = _ConditionalEntry(
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            content_hash=content_hash,
+            size=len(response.content),
+            parse_ms=parse_ms,
+            value=value
+        )
+        self._conditional.move_to_end(key)
+        while len(self._conditional) > self.conditional_max_entries:
+            self._conditional.popitem(last=False)
+
+        return value
+
+    def get_stats(self) -> Dict:
+        """
+        Get per-host request metrics
+
+        Returns:
+            Dictionary with pool settings, per-host counters and timings, and
+            per-source conditional request savings
+        """
+        return {
+            'timeout_seconds': self.timeout,
+            'max_retries': self.max_retries,
+            'pool_maxsize': self.pool_maxsize,
+            'per_host_concurrency': self.per_host_concurrency,
+            'hosts': {host: metrics.to_dict() for host, metrics in list(self._metrics.items())},
+            'conditional': {source: metrics.to_dict()
+                            for source, metrics in list(self._source_metrics.items())}
+        }
+
+    async def close(self):
+        """Close pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+_shared_client: Optional[AsyncHTTPClient] = None
+
+
+def get_shared_async_client(config: Optional[Dict] = None) -> AsyncHTTPClient:
+    """
+    Get the process-wide async HTTP client
+
+    Async collectors that are not given a client share this one. It is
+    created from the first caller's configuration.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Shared AsyncHTTPClient instance
+    """
+    global _shared_client
+
+    if _shared_client is None:
+        _shared_client = AsyncHTTPClient(config)
+        logger.info(f"Async HTTP client ready (timeout {_shared_client.timeout:.0f}s, "
+                    f"{_shared_client.max_retries} retries, "
+                    f"{_shared_client.pool_maxsize} connections per host)")
+    return _shared_client
@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Dict, Tuple, Optional
 from loguru import logger
 
+from .source_scheduler import RefreshPolicy
+
 
 class BathymetryLoader:
     """Loads and processes bathymetry (ocean depth) data"""
@@ -26,6 +28,8 @@ class BathymetryLoader:
         self.data_dir = Path(data_dir)
         self.bathymetry_data = None
         self.india_region = config['india_region']
+        # Static grid: loaded once, never expires
+        self.refresh_policy = RefreshPolicy(cadence_seconds=None, ttl_seconds=None, priority=3)
     
     def load_gebco_data(self, file_path: Optional[str] = None) -> xr.Dataset:
         """
@@ -0,0 +1,457 @@
+"""
+Pooled HTTP Client
+Shared keep-alive sessions, retries and request metrics for all collectors
+"""
+
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from loguru import logger
+
+
+# Statuses worth retrying (rate limiting and transient upstream failures)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_timing = threading.local()
+
+
+def _record_connect(start: float):
+    """Accumulate connection setup time for the request running on this thread"""
+    _timing.connect_ms = getattr(_timing, 'connect_ms', 0.0) + (time.perf_counter() - start) * 1000.0
+    _timing.new_connections = getattr(_timing, 'new_connections', 0) + 1
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """HTTP connection that records TCP connect time"""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _record_connect(start)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """HTTPS connection that records TCP connect + TLS handshake time"""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _record_connect(start)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _PooledAdapter(HTTPAdapter):
+    """Keep-alive adapter whose per-host pools time new connections"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool
+        }
+
+
+class _HostMetrics:
+    """Counters and timing sums for one host"""
+
+    __slots__ = ('requests', 'errors', 'retries', 'new_connections', 'in_flight',
+                 'connect_ms', 'ttfb_ms', 'total_ms', 'max_total_ms')
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.new_connections = 0
+        self.in_flight = 0
+        self.connect_ms = 0.0
+        self.ttfb_ms = 0.0
+        self.total_ms = 0.0
+        self.max_total_ms = 0.0
+
+    def to_dict(self) -> Dict:
+        completed = max(1, self.requests)
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'in_flight': self.in_flight,
+            'new_connections': self.new_connections,
+            'connection_reuse_rate': (round(1.0 - self.new_connections / self.requests, 4)
+                                      if self.requests else None),
+            'avg_connect_ms': round(self.connect_ms / max(1, self.new_connections), 1),
+            'avg_ttfb_ms': round(self.ttfb_ms / completed, 1),
+            'avg_total_ms': round(self.total_ms / completed, 1),
+            'max_total_ms': round(self.max_total_ms, 1)
+        }
+
+
+class _ConditionalEntry:
+    """Validators and parsed result of the last full download of a URL"""
+
+    __slots__ = ('etag', 'last_modified', 'content_hash', 'size', 'parse_ms', 'value')
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], content_hash: str,
+                 size: int, parse_ms: float, value: Any):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+        self.size = size
+        self.parse_ms = parse_ms
+        self.value = value
+
+
+class _SourceMetrics:
+    """Conditional request counters for one data source"""
+
+    __slots__ = ('requests', 'not_modified', 'unchanged', 'parsed',
+                 'bytes_downloaded', 'bytes_saved', 'parse_ms', 'parse_ms_saved')
+
+    def __init__(self):
+        self.requests = 0
+        self.not_modified = 0
+        self.unchanged = 0
+        self.parsed = 0
+        self.bytes_downloaded = 0
+        self.bytes_saved = 0
+        self.parse_ms = 0.0
+        self.parse_ms_saved = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            'requests': self.requests,
+            'not_modified': self.not_modified,
+            'unchanged': self.unchanged,
+            'parsed': self.parsed,
+            'bytes_downloaded': self.bytes_downloaded,
+            'bytes_saved': self.bytes_saved,
+            'parse_ms': round(self.parse_ms, 1),
+            'parse_ms_saved': round(self.parse_ms_saved, 1)
+        }
+
+
+class HTTPClient:
+    """
+    Shared HTTP client for the data collectors
+
+    Wraps one ``requests.Session`` with per-host keep-alive connection pools,
+    so repeated polls of USGS, NOAA, IOC and INCOIS skip DNS, TCP and TLS
+    setup. Transient failures (connection errors, timeouts, 429/5xx) are
+    retried with full-jitter exponential backoff, concurrent requests per
+    host are capped, and connect, time-to-first-byte and total times are
+    recorded per host. ``get`` mirrors ``requests.get`` and raises the same
+    exceptions, so collectors only swap the call.
+
+    ``get_conditional`` additionally remembers each URL's validators (ETag,
+    Last-Modified and a content hash) together with the parsed result, so
+    an unchanged feed costs a 304 and no parsing.
+    """
+
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        Initialize HTTP client
+
+        Args:
+            config: Configuration dictionary (system.api_timeout_seconds,
+                system.max_api_retries and system.http)
+        """
+        system_config = (config or {}).get('system', {})
+        http_config = system_config.get('http', {})
+
+        self.timeout = float(system_config.get('api_timeout_seconds', 30))
+        self.max_retries = int(system_config.get('max_api_retries', 3))
+        self.backoff_base = float(http_config.get('backoff_base_seconds', 0.5))
+        self.backoff_max = float(http_config.get('backoff_max_seconds', 10.0))
+        self.pool_connections = int(http_config.get('pool_connections', 10))
+        self.pool_maxsize = int(http_config.get('pool_maxsize', 10))
+        self.per_host_concurrency = int(http_config.get('per_host_concurrency', 8))
+        self.conditional_max_entries = int(http_config.get('conditional_max_entries', 256))
+
+        self.user_agent = http_config.get('user_agent', 'tsunami-monitor/1.0')
+
+        self.session = self._new_session()
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._metrics: Dict[str, _HostMetrics] = {}
+        self._lock = threading.Lock()
+
+        self._conditional: 'OrderedDict[str, _ConditionalEntry]' = OrderedDict()
+        self._source_metrics: Dict[str, _SourceMetrics] = {}
+
+    def _new_session(self) -> requests.Session:
+        """Session with the pooled adapter mounted"""
+        session = requests.Session()
+        adapter = _PooledAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0  # retries are handled here, with jitter
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['User-Agent'] = self.user_agent
+        return session
+
+    def _host_state(self, host: str):
+        """Concurrency semaphore and metrics for a host"""
+        with self._lock:
+            if host not in self._metrics:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host_concurrency)
+                self._metrics[host] = _HostMetrics()
+            return self._host_limits[host], self._metrics[host]
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Full-jitter exponential backoff, honouring a numeric Retry-After"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return random.uniform(0.0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def get(self, url: str, params: Optional[Dict] = None, timeout=None,
+            max_retries: Optional[int] = None, **kwargs) -> requests.Response:
+        """
+        Send a GET request
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            timeout: Timeout in seconds or (connect, read) tuple (default from config)
+            max_retries: Retry budget for this call (default from config; 0 for
+                deadline-bound fetches)
+            **kwargs: Passed through to ``requests.Session.get``
+
+        Returns:
+            The final response (non-retryable statuses are returned as is)
+
+        Raises:
+            requests.exceptions.RequestException: If every attempt failed
+        """
+        timeout = self.timeout if timeout is None else timeout
+        max_retries = self.max_retries if max_retries is None else max_retries
+        host = urlsplit(url).netloc
+        limit, metrics = self._host_state(host)
+
+        slot_timeout = timeout[0] if isinstance(timeout, tuple) else timeout
+        if not limit.acquire(timeout=slot_timeout):
+            with self._lock:
+                metrics.errors += 1
+            raise requests.exceptions.ConnectTimeout(
+                f"Timed out waiting for a connection slot to {host} "
+                f"({self.per_host_concurrency} concurrent requests)"
+            )
+
+        with self._lock:
+            metrics.in_flight += 1
+        try:
+            attempt = 0
+            while True:
+                _timing.connect_ms = 0.0
+                _timing.new_connections = 0
+                start = time.perf_counter()
+                response = None
+                error = None
+                try:
+                    response = self.session.get(url, params=params, timeout=timeout, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    error = e
+                total_ms = (time.perf_counter() - start) * 1000.0
+
+                with self._lock:
+                    metrics.requests += 1
+                    metrics.new_connections += _timing.new_connections
+                    metrics.connect_ms += _timing.connect_ms
+                    metrics.total_ms += total_ms
+                    metrics.max_total_ms = max(metrics.max_total_ms, total_ms)
+                    if response is not None:
+                        # elapsed stops once the response headers are parsed
+                        metrics.ttfb_ms += response.elapsed.total_seconds() * 1000.0
+                    if error is not None or response.status_code >= 500:
+                        metrics.errors += 1
+
+                retryable = error is not None or response.status_code in RETRY_STATUSES
+                if not retryable or attempt >= max_retries:
+                    if error is not None:
+                        raise error
+                    return response
+
+                delay = self._backoff(attempt, response)
+                attempt += 1
+                with self._lock:
+                    metrics.retries += 1
+                logger.debug(f"Retrying {host} in {delay:.2f}s (attempt {attempt}/{max_retries}): "
+                             f"{error if error is not None else response.status_code}")
+                if response is not None:
+                    response.close()
+                time.sleep(delay)
+        finally:
+            with self._lock:
+                metrics.in_flight -= 1
+            limit.release()
+
+    def get_conditional(self, url: str, parse: Callable[[requests.Response], Any],
+                        params: Optional[Dict] = None, source: Optional[str] = None,
+                        **kwargs) -> Any:
+        """
+        Conditional GET that reuses the previous parse when nothing changed
+
+        Sends If-None-Match / If-Modified-Since from the last full download
+        of the same URL and parameters. On 304 Not Modified, or a 200 whose
+        body hashes to the previous one, the previously parsed value is
+        returned without calling ``parse``. Callers must treat the returned
+        value as read-only since later calls may return the same object.
+
+        Args:
+            url: Request URL
+            parse: Builds the result from a 200 response
+            params: Query parameters
+            source: Name under which bytes saved and parse time avoided are reported
+            **kwargs: Passed through to :meth:`get` (timeout, max_retries, ...)
+
+        Returns:
+            Parsed value (fresh or reused)
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails or
+                returns an error status
+        """
+        key = requests.Request('GET', url, params=params).prepare().url
+        source = source or urlsplit(url).netloc
+
+        with self._lock:
+            entry = self._conditional.get(key)
+            metrics = self._source_metrics.setdefault(source, _SourceMetrics())
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        response = self.get(url, params=params, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                metrics.requests += 1
+                metrics.not_modified += 1
+                metrics.bytes_saved += entry.size
+                metrics.parse_ms_saved += entry.parse_ms
+                self._conditional.move_to_end(key)
+            return entry.value
+
+        response.raise_for_status()
+        content_hash = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+
+        if entry is not None and entry.content_hash == content_hash:
+            # Server without validators (or weak ones): same bytes, skip parsing
+            value, parse_ms = entry.value, entry.parse_ms
+            with self._lock:
+                metrics.unchanged += 1
+                metrics.parse_ms_saved += parse_ms
+        else:
+            start = time.perf_counter()
+            value = parse(response)
+            parse_ms = (time.perf_counter() - start) * 1000.0
+            with self._lock:
+                metrics.parsed += 1
+                metrics.parse_ms += parse_ms
+
+        with self._lock:
+            metrics.requests += 1
+            metrics.bytes_downloaded += len(response.content)
+            self._conditional[key] = _ConditionalEntry(
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                content_hash=content_hash,
+                size=len(response.content),
+                parse_ms=parse_ms,
+                value=value
+            )
+            self._conditional.move_to_end(key)
+            while len(self._conditional) > self.conditional_max_entries:
+                self._conditional.popitem(last=False)
+
+        return value
+
+    def get_stats(self) -> Dict:
+        """
+        Get per-host request metrics
+
+        Returns:
+            Dictionary with pool settings, per-host counters and timings, and
+            per-source conditional request savings
+        """
+        with self._lock:
+            return {
+                'timeout_seconds': self.timeout,
+                'max_retries': self.max_retries,
+                'pool_maxsize': self.pool_maxsize,
+                'per_host_concurrency': self.per_host_concurrency,
+                'hosts': {host: metrics.to_dict() for host, metrics in self._metrics.items()},
+                'conditional': {source: metrics.to_dict()
+                                for source, metrics in self._source_metrics.items()}
+            }
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+    def reset_after_fork(self):
+        """
+        Give a forked worker its own connections and locks
+
+        Pooled sockets opened by the parent must not be shared between
+        processes, and a lock held by a parent thread at fork time would
+        never be released. Cached validators and statistics are kept.
+        """
+        self.session = self._new_session()
+        self._lock = threading.Lock()
+        self._host_limits = {host: threading.BoundedSemaphore(self.per_host_concurrency)
+                             for host in self._host_limits}
+
+
+_shared_client: Optional[HTTPClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_client(config: Optional[Dict] = None) -> HTTPClient:
+    """
+    Get the process-wide HTTP client
+
+    Collectors that are not given a client share this one, so every data
+    source reuses the same per-host connection pools. It is created from
+    the first caller's configuration.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Shared HTTPClient instance
+    """
+    global _shared_client
+
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HTTPClient(config)
+            logger.info(f"HTTP client ready (timeout {_shared_client.timeout:.0f}s, "
+                        f"{_shared_client.max_retries} retries, "
+                        f"{_shared_client.pool_maxsize} connections per host)")
+        return _shared_client
@@ -9,26 +9,39 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from loguru import logger
 
+from .http_client import HTTPClient, get_shared_client
+from .async_http_client import ASYNC_REQUEST_ERRORS, AsyncHTTPClient, get_shared_async_client
+from .source_scheduler import RefreshPolicy
+
 
 class INCOISCollector:
     """Collects tsunami advisories and event data from INCOIS"""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None):
         """
         Initialize INCOIS collector
         
         Args:
             config: Configuration dictionary with API settings
+            http_client: HTTP client (default: the shared pooled client)
         """
         self.config = config['apis']['incois']
+        self.http = http_client or get_shared_client(config)
         self.base_url = self.config['base_url']
         self.advisory_endpoint = self.config['advisory_endpoint']
         self.event_endpoint = self.config['event_endpoint']
+        # Advisories are the authoritative warning, so they are refreshed first
+        self.refresh_policy = RefreshPolicy.from_config(
+            self.config.get('refresh'), RefreshPolicy(cadence_seconds=300, ttl_seconds=1800, priority=0)
+        )
     
-    def fetch_current_advisories(self) -> List[Dict]:
+    def fetch_current_advisories(self, timeout: Optional[float] = None) -> List[Dict]:
         """
         Fetch current tsunami advisories from INCOIS
         
+        Args:
+            timeout: Request timeout in seconds (default from config)
+            
         Returns:
             List of active advisory dictionaries
         """
@@ -36,12 +49,14 @@ class INCOISCollector:
             url = f"{self.base_url}{self.advisory_endpoint}"
             
             logger.info("Fetching current INCOIS advisories...")
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
+            # Conditional request: an unchanged bulletin is not re-downloaded or re-parsed
             # Note: INCOIS API format may vary - this is a template
-            data = response.json()
-            advisories = data.get('advisories', [])
+            advisories = list(self.http.get_conditional(
+                url,
+                lambda response: response.json().get('advisories', []),
+                source='incois',
+                timeout=timeout
+            ))
             
             logger.success(f"Fetched {len(advisories)} INCOIS advisories")
             return advisories
@@ -54,6 +69,38 @@ class INCOISCollector:
             logger.error(f"Error processing INCOIS advisories: {e}")
             return []
     
+    async def fetch_current_advisories_async(self, http_client: Optional[AsyncHTTPClient] = None
+                                             ) -> List[Dict]:
+        """
+        Non-blocking fetch_current_advisories for code running on an event loop
+        
+        Args:
+            http_client: Async HTTP client (default: the shared async client)
+            
+        Returns:
+            List of active advisory dictionaries
+        """
+        try:
+            url = f"{self.base_url}{self.advisory_endpoint}"
+            
+            logger.info("Fetching current INCOIS advisories...")
+            http = http_client or get_shared_async_client()
+            advisories = list(await http.get_conditional(
+                url,
+                lambda response: response.json().get('advisories', []),
+                source='incois'
+            ))
+            
+            logger.success(f"Fetched {len(advisories)} INCOIS advisories")
+            return advisories
+            
+        except ASYNC_REQUEST_ERRORS as e:
+            logger.error(f"Failed to fetch INCOIS advisories: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Error processing INCOIS advisories: {e}")
+            return []
+    
     def fetch_historical_events(self, start_date: Optional[datetime] = None,
                                end_date: Optional[datetime] = None) -> pd.DataFrame:
         """
@@ -76,7 +123,7 @@ class INCOISCollector:
                 params['end_date'] = end_date.strftime('%Y-%m-%d')
             
             logger.info("Fetching INCOIS historical events...")
-            response = requests.get(url, params=params, timeout=30)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -117,14 +164,18 @@ class INCOISCollector:
             'source': 'INCOIS'
         }
     
-    def get_india_specific_risk(self) -> Dict[str, any]:
+    def get_india_specific_risk(self, advisories: Optional[List[Dict]] = None) -> Dict[str, any]:
         """
         Get current India-specific tsunami risk assessment
         
+        Args:
+            advisories: Already fetched advisories (fetched now if omitted)
+            
         Returns:
             Dictionary with risk assessment
         """
-        advisories = self.fetch_current_advisories()
+        if advisories is None:
+            advisories = self.fetch_current_advisories()
         
         if not advisories:
             return {
@@ -3,6 +3,7 @@ NOAA Buoys Data Collector
 Fetches real-time wave height and ocean state data from NOAA NDBC
 """
 
+import asyncio
 import requests
 import pandas as pd
 from datetime import datetime, timedelta
@@ -10,28 +11,104 @@ from typing import Dict, List, Optional
 from io import StringIO
 from loguru import logger
 
+from .http_client import HTTPClient, get_shared_client
+from .async_http_client import ASYNC_REQUEST_ERRORS, AsyncHTTPClient, get_shared_async_client
+from .source_scheduler import RefreshPolicy
+
 
 class NOAABuoysCollector:
     """Collects wave and ocean data from NOAA NDBC buoys"""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None):
         """
         Initialize NOAA Buoys collector
         
         Args:
             config: Configuration dictionary with API settings
+            http_client: HTTP client (default: the shared pooled client)
         """
         self.config = config['apis']['noaa_buoys']
+        self.http = http_client or get_shared_client(config)
         self.base_url = self.config['base_url']
         self.stations = self.config['stations']
+        # NDBC realtime2 files change every 10-60 minutes
+        self.refresh_policy = RefreshPolicy.from_config(
+            self.config.get('refresh'), RefreshPolicy(cadence_seconds=1200, ttl_seconds=7200, priority=2)
+        )
+    
+    def _parse_buoy_text(self, station_id: str, text: str) -> pd.DataFrame:
+        """
+        Parse an NDBC realtime2 file into a DataFrame
+        
+        Args:
+            station_id: Buoy station identifier
+            text: Raw file contents
+            
+        Returns:
+            DataFrame with every parseable record (not time-filtered)
+        """
+        # Parse the fixed-width text format
+        lines = text.strip().split('\n')
+        
+        if len(lines) < 3:
+            return pd.DataFrame()
+        
+        # First line is header, second line is units
+        header = lines[0].split()
+        data_lines = lines[2:]
+        
+        records = []
+        for line in data_lines:
+            values = line.split()
+            if len(values) < len(header):
+                continue
+            
+            try:
+                # Parse timestamp
+                year, month, day, hour, minute = map(int, values[:5])
+                timestamp = datetime(year, month, day, hour, minute)
+                
+                # Parse wave data
+                record = {
+                    'station_id': station_id,
+                    'time': timestamp,
+                    'wave_height': float(values[5]) if values[5] != 'MM' else None,
+                    'dominant_period': float(values[6]) if values[6] != 'MM' else None,
+                    'average_period': float(values[7]) if values[7] != 'MM' else None,
+                    'wave_direction': float(values[8]) if len(values) > 8 and values[8] != 'MM' else None,
+                }
+                records.append(record)
+            except (ValueError, IndexError):
+                continue
+        
+        return pd.DataFrame(records)
+    
+    def _recent(self, station_id: str, parsed: pd.DataFrame) -> pd.DataFrame:
+        """Last 48 hours of a parsed buoy file (a copy, the parse may be cached)"""
+        if parsed.empty:
+            logger.warning(f"No valid records from buoy {station_id}")
+            return pd.DataFrame()
+        
+        # Filter recent data only (last 48 hours)
+        cutoff_time = datetime.utcnow() - timedelta(hours=48)
+        df = parsed[parsed['time'] >= cutoff_time].copy()
+        
+        logger.success(f"Fetched {len(df)} buoy readings from station {station_id}")
+        return df
     
-    def fetch_buoy_data(self, station_id: str, data_type: str = 'spec') -> pd.DataFrame:
+    def fetch_buoy_data(self, station_id: str, data_type: str = 'spec',
+                        timeout: Optional[float] = None) -> pd.DataFrame:
         """
         Fetch real-time buoy data
         
+        NDBC files only change every 10-60 minutes, so the request is
+        conditional: an unchanged file is not downloaded or parsed again and
+        the previously parsed frame is re-filtered instead.
+        
         Args:
             station_id: Buoy station identifier
             data_type: Type of data ('spec' for wave spectra, 'txt' for standard met)
+            timeout: Request timeout in seconds (default from config)
             
         Returns:
             DataFrame with buoy measurements
@@ -41,55 +118,13 @@ class NOAABuoysCollector:
             url = f"{self.base_url}/{station_id}.{data_type}"
             
             logger.info(f"Fetching buoy data from station {station_id}...")
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            # Parse the fixed-width text format
-            lines = response.text.strip().split('\n')
-            
-            if len(lines) < 3:
-                logger.warning(f"Insufficient data from buoy {station_id}")
-                return pd.DataFrame()
-            
-            # First line is header, second line is units
-            header = lines[0].split()
-            data_lines = lines[2:]
-            
-            records = []
-            for line in data_lines:
-                values = line.split()
-                if len(values) < len(header):
-                    continue
-                
-                try:
-                    # Parse timestamp
-                    year, month, day, hour, minute = map(int, values[:5])
-                    timestamp = datetime(year, month, day, hour, minute)
-                    
-                    # Parse wave data
-                    record = {
-                        'station_id': station_id,
-                        'time': timestamp,
-                        'wave_height': float(values[5]) if values[5] != 'MM' else None,
-                        'dominant_period': float(values[6]) if values[6] != 'MM' else None,
-                        'average_period': float(values[7]) if values[7] != 'MM' else None,
-                        'wave_direction': float(values[8]) if len(values) > 8 and values[8] != 'MM' else None,
-                    }
-                    records.append(record)
-                except (ValueError, IndexError):
-                    continue
-            
-            if not records:
-                logger.warning(f"No valid records from buoy {station_id}")
-                return pd.DataFrame()
-            
-            df = pd.DataFrame(records)
-            # Filter recent data only (last 48 hours)
-            cutoff_time = datetime.utcnow() - timedelta(hours=48)
-            df = df[df['time'] >= cutoff_time]
-            
-            logger.success(f"Fetched {len(df)} buoy readings from station {station_id}")
-            return df
+            parsed = self.http.get_conditional(
+                url,
+                lambda response: self._parse_buoy_text(station_id, response.text),
+                source='noaa_buoys',
+                timeout=timeout
+            )
+            return self._recent(station_id, parsed)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch buoy data for station {station_id}: {e}")
@@ -114,6 +149,58 @@ class NOAABuoysCollector:
         logger.info(f"Collected data from {len(all_data)} buoy stations")
         return all_data
     
+    async def fetch_buoy_data_async(self, station_id: str, data_type: str = 'spec',
+                                    http_client: Optional[AsyncHTTPClient] = None) -> pd.DataFrame:
+        """
+        Non-blocking fetch_buoy_data for code running on an event loop
+        
+        Args:
+            station_id: Buoy station identifier
+            data_type: Type of data ('spec' for wave spectra, 'txt' for standard met)
+            http_client: Async HTTP client (default: the shared async client)
+            
+        Returns:
+            DataFrame with buoy measurements
+        """
+        try:
+            url = f"{self.base_url}/{station_id}.{data_type}"
+            
+            logger.info(f"Fetching buoy data from station {station_id}...")
+            http = http_client or get_shared_async_client()
+            parsed = await http.get_conditional(
+                url,
+                lambda response: self._parse_buoy_text(station_id, response.text),
+                source='noaa_buoys'
+            )
+            return self._recent(station_id, parsed)
+            
+        except ASYNC_REQUEST_ERRORS as e:
+            logger.error(f"Failed to fetch buoy data for station {station_id}: {e}")
+            return pd.DataFrame()
+        except Exception as e:
+            logger.error(f"Error processing buoy data: {e}")
+            return pd.DataFrame()
+    
+    async def fetch_all_buoys_async(self, http_client: Optional[AsyncHTTPClient] = None
+                                    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch every configured buoy station concurrently
+        
+        Args:
+            http_client: Async HTTP client (default: the shared async client)
+            
+        Returns:
+            Dictionary mapping station IDs to DataFrames
+        """
+        frames = await asyncio.gather(*(
+            self.fetch_buoy_data_async(station_id, http_client=http_client)
+            for station_id in self.stations
+        ))
+        all_data = {station_id: df for station_id, df in zip(self.stations, frames) if not df.empty}
+        
+        logger.info(f"Collected data from {len(all_data)} buoy stations")
+        return all_data
+    
     def analyze_wave_patterns(self, df: pd.DataFrame) -> Dict[str, float]:
         """
         Analyze wave patterns for tsunami indicators
@@ -3,25 +3,36 @@ NOAA Tides and Currents Data Collector
 Fetches real-time sea level and tidal data from NOAA API
 """
 
+import asyncio
 import requests
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from loguru import logger
 
+from .http_client import HTTPClient, get_shared_client
+from .async_http_client import ASYNC_REQUEST_ERRORS, AsyncHTTPClient, get_shared_async_client
+from .source_scheduler import RefreshPolicy
+
 
 class NOAATidesCollector:
     """Collects tidal and sea level data from NOAA API"""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None):
         """
         Initialize NOAA Tides collector
         
         Args:
             config: Configuration dictionary with API settings
+            http_client: HTTP client (default: the shared pooled client)
         """
         self.config = config['apis']['noaa_tides']
+        self.http = http_client or get_shared_client(config)
         self.base_url = self.config['base_url']
+        # Water levels are published every 6 minutes
+        self.refresh_policy = RefreshPolicy.from_config(
+            self.config.get('refresh'), RefreshPolicy(cadence_seconds=360, ttl_seconds=1800, priority=1)
+        )
         
         # Indian Ocean coastal stations (examples - would need actual station IDs)
         self.indian_stations = [
@@ -30,10 +41,49 @@ class NOAATidesCollector:
             '9009876',  # Example: Andaman Sea station
         ]
     
+    def _water_level_params(self, station_id: str, hours: int) -> Dict:
+        """Query parameters for a station's water levels over the last ``hours``"""
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(hours=hours)
+        
+        return {
+            'begin_date': start_time.strftime('%Y%m%d %H:%M'),
+            'end_date': end_time.strftime('%Y%m%d %H:%M'),
+            'station': station_id,
+            'product': self.config['product'],
+            'datum': self.config['datum'],
+            'units': self.config['units'],
+            'time_zone': self.config['time_zone'],
+            'format': self.config['format'],
+            'application': self.config['application']
+        }
+    
+    def _parse_water_levels(self, station_id: str, data: Dict) -> pd.DataFrame:
+        """DataFrame from a water level API response"""
+        if 'data' not in data or not data['data']:
+            logger.warning(f"No data available for station {station_id}")
+            return pd.DataFrame()
+        
+        records = []
+        for entry in data['data']:
+            records.append({
+                'station_id': station_id,
+                'time': pd.to_datetime(entry['t']),
+                'water_level': float(entry['v']),
+                'sigma': float(entry.get('s', 0)),
+                'flags': entry.get('f', ''),
+                'quality': entry.get('q', '')
+            })
+        
+        df = pd.DataFrame(records)
+        logger.success(f"Fetched {len(df)} water level readings for station {station_id}")
+        return df
+    
     def fetch_water_levels(self, 
                           station_id: str, 
                           hours: int = 24,
-                          interval: str = '6') -> pd.DataFrame:
+                          interval: str = '6',
+                          timeout: Optional[float] = None) -> pd.DataFrame:
         """
         Fetch water level data for a specific station
         
@@ -41,50 +91,19 @@ class NOAATidesCollector:
             station_id: NOAA station identifier
             hours: Lookback period in hours
             interval: Data interval in minutes ('h' for hourly, '6' for 6-min)
+            timeout: Request timeout in seconds (default from config)
             
         Returns:
             DataFrame with water level data
         """
         try:
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(hours=hours)
-            
-            params = {
-                'begin_date': start_time.strftime('%Y%m%d %H:%M'),
-                'end_date': end_time.strftime('%Y%m%d %H:%M'),
-                'station': station_id,
-                'product': self.config['product'],
-                'datum': self.config['datum'],
-                'units': self.config['units'],
-                'time_zone': self.config['time_zone'],
-                'format': self.config['format'],
-                'application': self.config['application']
-            }
+            params = self._water_level_params(station_id, hours)
             
             logger.info(f"Fetching water levels for station {station_id}...")
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.http.get(self.base_url, params=params, timeout=timeout)
             response.raise_for_status()
             
-            data = response.json()
-            
-            if 'data' not in data or not data['data']:
-                logger.warning(f"No data available for station {station_id}")
-                return pd.DataFrame()
-            
-            records = []
-            for entry in data['data']:
-                records.append({
-                    'station_id': station_id,
-                    'time': pd.to_datetime(entry['t']),
-                    'water_level': float(entry['v']),
-                    'sigma': float(entry.get('s', 0)),
-                    'flags': entry.get('f', ''),
-                    'quality': entry.get('q', '')
-                })
-            
-            df = pd.DataFrame(records)
-            logger.success(f"Fetched {len(df)} water level readings for station {station_id}")
-            return df
+            return self._parse_water_levels(station_id, response.json())
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch NOAA tides data for station {station_id}: {e}")
@@ -112,6 +131,58 @@ class NOAATidesCollector:
         logger.info(f"Collected data from {len(all_data)} stations")
         return all_data
     
+    async def fetch_water_levels_async(self, station_id: str, hours: int = 24,
+                                       http_client: Optional[AsyncHTTPClient] = None) -> pd.DataFrame:
+        """
+        Non-blocking fetch_water_levels for code running on an event loop
+        
+        Args:
+            station_id: NOAA station identifier
+            hours: Lookback period in hours
+            http_client: Async HTTP client (default: the shared async client)
+            
+        Returns:
+            DataFrame with water level data
+        """
+        try:
+            params = self._water_level_params(station_id, hours)
+            
+            logger.info(f"Fetching water levels for station {station_id}...")
+            http = http_client or get_shared_async_client()
+            response = await http.get(self.base_url, params=params)
+            response.raise_for_status()
+            
+            return self._parse_water_levels(station_id, response.json())
+            
+        except ASYNC_REQUEST_ERRORS as e:
+            logger.error(f"Failed to fetch NOAA tides data for station {station_id}: {e}")
+            return pd.DataFrame()
+        except Exception as e:
+            logger.error(f"Error processing NOAA tides data: {e}")
+            return pd.DataFrame()
+    
+    async def fetch_all_stations_async(self, hours: int = 24,
+                                       http_client: Optional[AsyncHTTPClient] = None
+                                       ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch every Indian Ocean station concurrently
+        
+        Args:
+            hours: Lookback period in hours
+            http_client: Async HTTP client (default: the shared async client)
+            
+        Returns:
+            Dictionary mapping station IDs to DataFrames
+        """
+        frames = await asyncio.gather(*(
+            self.fetch_water_levels_async(station_id, hours, http_client=http_client)
+            for station_id in self.indian_stations
+        ))
+        all_data = {station_id: df for station_id, df in zip(self.indian_stations, frames) if not df.empty}
+        
+        logger.info(f"Collected data from {len(all_data)} stations")
+        return all_data
+    
     def detect_anomalies(self, df: pd.DataFrame, threshold_std: float = 3.0) -> pd.DataFrame:
         """
         Detect anomalous sea level readings
@@ -0,0 +1,109 @@
+"""
+Ocean Conditions
+Sea level and wave anomaly summary from the NOAA tide gauges and buoys
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+from .noaa_tides_collector import NOAATidesCollector
+from .noaa_buoys_collector import NOAABuoysCollector
+from .async_http_client import AsyncHTTPClient
+
+
+def analyze_ocean_conditions(tides: NOAATidesCollector, buoys: NOAABuoysCollector,
+                             tide_data: Dict, buoy_data: Dict) -> Dict:
+    """
+    Analyze ocean conditions for anomalies
+
+    Args:
+        tides: Tide collector used to score sea level anomalies
+        buoys: Buoy collector used to detect tsunami signatures
+        tide_data: {station id: water level DataFrame}
+        buoy_data: {station id: buoy DataFrame}
+
+    Returns:
+        Dictionary with sea_level_anomaly, wave_height_anomaly and tsunami_indicators
+    """
+    conditions = {
+        'sea_level_anomaly': 'normal',
+        'wave_height_anomaly': 'normal',
+        'tsunami_indicators': []
+    }
+
+    # Analyze tide data
+    for station_id, df in tide_data.items():
+        if not df.empty:
+            anomaly_score = tides.calculate_sea_level_anomaly(df)
+            if anomaly_score > 2.0:
+                conditions['sea_level_anomaly'] = 'elevated'
+                conditions['tsunami_indicators'].append('sea_level_anomaly')
+
+    # Analyze buoy data
+    for station_id, df in buoy_data.items():
+        if not df.empty:
+            signature = buoys.detect_tsunami_signature(df)
+            if signature['detected']:
+                conditions['wave_height_anomaly'] = 'anomalous'
+                conditions['tsunami_indicators'].extend(signature['indicators'])
+
+    return conditions
+
+
+def summarize_ocean_conditions(tides: NOAATidesCollector, buoys: NOAABuoysCollector,
+                               tide_data: Dict, buoy_data: Dict) -> Dict:
+    """
+    Conditions plus the latest reading of every station, as served by the API
+
+    Args:
+        tides: Tide collector
+        buoys: Buoy collector
+        tide_data: {station id: water level DataFrame}
+        buoy_data: {station id: buoy DataFrame}
+
+    Returns:
+        Dictionary with 'conditions', 'tide_stations' and 'buoy_stations'
+    """
+    tide_summary = {}
+    for station_id, df in tide_data.items():
+        if not df.empty:
+            tide_summary[station_id] = {
+                'latest_reading': df.iloc[-1].to_dict(),
+                'anomaly_score': tides.calculate_sea_level_anomaly(df)
+            }
+
+    buoy_summary = {}
+    for station_id, df in buoy_data.items():
+        if not df.empty:
+            buoy_summary[station_id] = {
+                'latest_reading': df.iloc[-1].to_dict(),
+                'tsunami_signature': buoys.detect_tsunami_signature(df)
+            }
+
+    return {
+        'conditions': analyze_ocean_conditions(tides, buoys, tide_data, buoy_data),
+        'tide_stations': tide_summary,
+        'buoy_stations': buoy_summary
+    }
+
+
+async def fetch_ocean_conditions_async(tides: NOAATidesCollector, buoys: NOAABuoysCollector,
+                                       hours: int = 6,
+                                       http_client: Optional[AsyncHTTPClient] = None) -> Dict:
+    """
+    Fetch tide gauges and buoys concurrently on the event loop and summarize them
+
+    Args:
+        tides: Tide collector (station list and anomaly scoring)
+        buoys: Buoy collector (station list and signature detection)
+        hours: Hours of water levels to fetch
+        http_client: Async HTTP client (default: the shared async client)
+
+    Returns:
+        Same dictionary as summarize_ocean_conditions()
+    """
+    tide_data, buoy_data = await asyncio.gather(
+        tides.fetch_all_stations_async(hours=hours, http_client=http_client),
+        buoys.fetch_all_buoys_async(http_client=http_client)
+    )
+    return summarize_ocean_conditions(tides, buoys, tide_data, buoy_data)
@@ -0,0 +1,451 @@
+"""
+Source Scheduler
+Refreshes every data source on its own cadence into a shared latest-value store
+"""
+
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+
+class RefreshPolicy:
+    """
+    How a source is refreshed
+
+    Each collector declares its own policy (overridable under the
+    collector's ``refresh`` config section): the upstream's natural
+    cadence, how long a value stays usable (TTL) and its priority when
+    several sources are due at once (0 first).
+    """
+
+    __slots__ = ('cadence_seconds', 'ttl_seconds', 'priority')
+
+    def __init__(self, cadence_seconds: Optional[float], ttl_seconds: Optional[float] = None,
+                 priority: int = 1):
+        """
+        Initialize refresh policy
+
+        Args:
+            cadence_seconds: Refresh interval (None: load once, e.g. static data)
+            ttl_seconds: Age after which a value is no longer used (None: never expires)
+            priority: Order among sources due at the same time (lower first)
+        """
+        self.cadence_seconds = float(cadence_seconds) if cadence_seconds is not None else None
+        self.ttl_seconds = float(ttl_seconds) if ttl_seconds is not None else None
+        self.priority = int(priority)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict], default: 'RefreshPolicy') -> 'RefreshPolicy':
+        """Policy from a ``refresh`` config section, falling back to ``default`` per key"""
+        config = config or {}
+        return cls(config.get('cadence_seconds', default.cadence_seconds),
+                   config.get('ttl_seconds', default.ttl_seconds),
+                   config.get('priority', default.priority))
+
+    def to_dict(self) -> Dict:
+        """Policy as a JSON-serializable dictionary"""
+        return {'cadence_seconds': self.cadence_seconds, 'ttl_seconds': self.ttl_seconds,
+                'priority': self.priority}
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """Whether a refreshed value equals the previous one (frames and datasets by content)"""
+    if old is new:
+        return True
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(_same_value(old[key], new[key]) for key in old)
+    if isinstance(old, (list, tuple)):
+        return len(old) == len(new) and all(_same_value(a, b) for a, b in zip(old, new))
+    try:
+        equals = getattr(old, 'equals', None)
+        return bool(equals(new)) if callable(equals) else bool(old == new)
+    except Exception:
+        return False
+
+
+class SourceValue:
+    """Latest value of one source (read-only: a refresh replaces the whole entry)"""
+
+    __slots__ = ('value', 'version', 'fetched_at', 'ttl_seconds', 'duration_ms', '_fetched_monotonic')
+
+    def __init__(self, value: Any, version: int, ttl_seconds: Optional[float], duration_ms: float):
+        self.value = value
+        self.version = version
+        self.fetched_at = datetime.utcnow()
+        self.ttl_seconds = ttl_seconds
+        self.duration_ms = duration_ms
+        self._fetched_monotonic = time.monotonic()
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the value was fetched"""
+        return time.monotonic() - self._fetched_monotonic
+
+    @property
+    def is_expired(self) -> bool:
+        """Whether the value is older than its TTL"""
+        return self.ttl_seconds is not None and self.age_seconds > self.ttl_seconds
+
+
+class LatestValueStore:
+    """
+    Thread-safe latest value per source
+
+    Readers get the current :class:`SourceValue` without blocking on any
+    fetch. A source's version only increases when its value changes: a
+    refresh that returns the same data (e.g. an NDBC file answered 304)
+    keeps the previous value object and version and only renews its age.
+    """
+
+    def __init__(self):
+        """Initialize empty store"""
+        self._values: Dict[str, SourceValue] = {}
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def put(self, name: str, value: Any, ttl_seconds: Optional[float] = None,
+            duration_ms: float = 0.0) -> bool:
+        """
+        Publish a freshly fetched value
+
+        Args:
+            name: Source name
+            value: Fetched value (treated as read-only from now on)
+            ttl_seconds: How long the value stays usable
+            duration_ms: How long the fetch took
+
+        Returns:
+            True if the value changed (a new version)
+        """
+        with self._lock:
+            previous = self._values.get(name)
+            changed = previous is None or not _same_value(previous.value, value)
+            if changed:
+                entry = SourceValue(value, (previous.version if previous else 0) + 1, ttl_seconds, duration_ms)
+            else:
+                entry = SourceValue(previous.value, previous.version, ttl_seconds, duration_ms)
+            self._values[name] = entry
+            self._errors.pop(name, None)
+        return changed
+
+    def put_error(self, name: str, error: str):
+        """Record a failed refresh (the previous value stays until it expires)"""
+        with self._lock:
+            self._errors[name] = error
+
+    def get(self, name: str) -> Optional[SourceValue]:
+        """Latest entry of a source, expired or not (None if never fetched)"""
+        return self._values.get(name)
+
+    def fresh(self, name: str) -> Optional[SourceValue]:
+        """Latest entry of a source if it has not expired"""
+        entry = self._values.get(name)
+        return entry if entry is not None and not entry.is_expired else None
+
+    def versions(self, names: Iterable[str]) -> Dict[str, int]:
+        """Current version of each source (0 if never fetched)"""
+        return {name: (self._values[name].version if name in self._values else 0) for name in names}
+
+    def describe(self, names: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Status of each source's latest value
+
+        Returns:
+            {source: {'status' (ok / stale / missing), 'age_seconds',
+            'fetched_at', 'version', 'last_error'}}
+        """
+        status = {}
+        for name in names:
+            entry = self._values.get(name)
+            status[name] = {
+                'status': 'missing' if entry is None else ('stale' if entry.is_expired else 'ok'),
+                'age_seconds': round(entry.age_seconds, 1) if entry is not None else None,
+                'fetched_at': entry.fetched_at.isoformat() if entry is not None else None,
+                'version': entry.version if entry is not None else 0,
+                'last_error': self._errors.get(name)
+            }
+        return status
+
+
+class _Source:
+    """Registered source and its schedule"""
+
+    __slots__ = ('name', 'fetch', 'policy', 'timeout', 'next_due', 'inflight', 'refreshes', 'errors')
+
+    def __init__(self, name: str, fetch: Callable[[], Any], policy: RefreshPolicy, timeout: float):
+        self.name = name
+        self.fetch = fetch
+        self.policy = policy
+        self.timeout = timeout
+        self.next_due: Optional[float] = None
+        self.inflight = None
+        self.refreshes = 0
+        self.errors = 0
+
+
+class SourceScheduler:
+    """
+    Background refresh of every registered source into a LatestValueStore
+
+    Each source is refreshed on fixed slots of its own cadence (slots
+    missed while a fetch ran long are skipped, not run back to back);
+    sources due at the same time are started in priority order. A source
+    is never fetched twice concurrently: :meth:`ensure_fresh` joins a
+    refresh already in flight instead of starting another, so consumers
+    reading the store never cause redundant upstream requests.
+    """
+
+    def __init__(self, store: Optional[LatestValueStore] = None,
+                 cadence_fn: Optional[Callable[[str], Optional[float]]] = None,
+                 max_workers: int = 8, name: str = 'sources'):
+        """
+        Initialize source scheduler
+
+        Args:
+            store: Store the sources are refreshed into (default: a new one)
+            cadence_fn: Current cadence of a source, overriding its policy
+                (e.g. escalated polling); None keeps the policy cadence
+            max_workers: Concurrent fetches
+            name: Name used for the threads and log messages
+        """
+        self.store = store or LatestValueStore()
+        self.cadence_fn = cadence_fn
+        self.name = name
+        self._sources: Dict[str, _Source] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f'{name}-refresh')
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background thread is scheduling refreshes"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def register(self, name: str, fetch: Callable[[], Any], policy: RefreshPolicy,
+                 timeout: float = 30.0):
+        """
+        Add a source
+
+        Args:
+            name: Source name (the store key)
+            fetch: Function returning the source's current value
+            policy: Cadence, TTL and priority
+            timeout: How long :meth:`ensure_fresh` waits for this source
+        """
+        with self._lock:
+            self._sources[name] = _Source(name, fetch, policy, float(timeout))
+
+    def policy(self, name: str) -> RefreshPolicy:
+        """Refresh policy of a registered source"""
+        return self._sources[name].policy
+
+    def cadence(self, name: str) -> Optional[float]:
+        """Current cadence of a source in seconds (None: load once)"""
+        source = self._sources[name]
+        if source.policy.cadence_seconds is None:
+            return None
+        if self.cadence_fn is not None:
+            cadence = self.cadence_fn(name)
+            if cadence is not None:
+                return cadence
+        return source.policy.cadence_seconds
+
+    def _run(self, source: _Source):
+        """Fetch one source and publish the result (called on the pool)"""
+        start = time.perf_counter()
+        try:
+            value = source.fetch()
+        except Exception as e:
+            source.errors += 1
+            self.store.put_error(source.name, str(e))
+            logger.warning(f"Refreshing {source.name} failed: {e}")
+            raise
+        source.refreshes += 1
+        self.store.put(source.name, value, source.policy.ttl_seconds,
+                       (time.perf_counter() - start) * 1000.0)
+        return value
+
+    def _submit(self, source: _Source):
+        """Start a refresh unless one is already in flight (caller holds the lock)"""
+        if source.inflight is None or source.inflight.done():
+            source.inflight = self._executor.submit(self._run, source)
+        return source.inflight
+
+    def refresh(self, name: str) -> Any:
+        """
+        Refresh a source now and wait for it
+
+        Returns:
+            The fetched value
+
+        Raises:
+            Exception: Whatever the fetch raised
+        """
+        with self._lock:
+            future = self._submit(self._sources[name])
+        return future.result()
+
+    def _stale(self, source: _Source) -> bool:
+        """
+        Whether a source needs a refresh before it is read
+
+        Missing and expired values always do. While the background thread
+        is not running nobody refreshes on cadence, so a value older than
+        its cadence does too (on-demand use then fetches at most once per
+        cadence instead of on every read).
+        """
+        entry = self.store.fresh(source.name)
+        if entry is None:
+            return True
+        cadence = self.cadence(source.name)
+        return not self.is_running and cadence is not None and entry.age_seconds >= cadence
+
+    def prefetch(self, names: Iterable[str]) -> Dict[str, Any]:
+        """
+        Start refreshing every source that needs it (see :meth:`_stale`)
+
+        Args:
+            names: Sources to check
+
+        Returns:
+            {source: future} of the refreshes started or already in flight
+        """
+        futures = {}
+        with self._lock:
+            for name in names:
+                source = self._sources[name]
+                if self._stale(source) or (source.inflight is not None and not source.inflight.done()):
+                    futures[name] = self._submit(source)
+        return futures
+
+    def ensure_fresh(self, names: Iterable[str], timeout: Optional[float] = None) -> Dict[str, Optional[SourceValue]]:
+        """
+        Latest unexpired values, refreshing the ones that need it first
+
+        Refreshes run concurrently; each source is waited for up to its
+        registered timeout (capped by ``timeout``). While the scheduler is
+        running and the sources are fresh this returns immediately.
+
+        Args:
+            names: Sources to read
+            timeout: Overall wait in seconds
+
+        Returns:
+            {source: SourceValue or None if it is still missing or expired}
+        """
+        names = list(names)
+        start = time.monotonic()
+        futures = self.prefetch(names)
+        for name, future in futures.items():
+            limit = self._sources[name].timeout if timeout is None else min(self._sources[name].timeout, timeout)
+            wait([future], timeout=max(0.0, start + limit - time.monotonic()))
+        return {name: self.store.fresh(name) for name in names}
+
+    def _schedule(self, source: _Source, now: float):
+        """Move a source to its next slot after ``now``"""
+        cadence = self.cadence(source.name)
+        if cadence is None:
+            source.next_due = None
+            return
+        slot = (source.next_due if source.next_due is not None else now) + cadence
+        if slot <= now:
+            slot += ((now - slot) // cadence + 1) * cadence
+        source.next_due = slot
+
+    def reschedule(self):
+        """Apply changed cadences now (e.g. escalation): no source waits longer than its new cadence"""
+        with self._lock:
+            now = time.monotonic()
+            for source in self._sources.values():
+                cadence = self.cadence(source.name)
+                if cadence is None or source.next_due is None:
+                    continue
+                entry = self.store.get(source.name)
+                last = now - entry.age_seconds if entry is not None else now
+                source.next_due = min(source.next_due, last + cadence)
+        self._wake_event.set()
+
+    def start(self) -> 'SourceScheduler':
+        """Start the background thread (no-op if already running)"""
+        if self.is_running:
+            return self
+
+        with self._lock:
+            now = time.monotonic()
+            for source in self._sources.values():
+                # Sources with a value still in date wait for their next slot
+                entry = self.store.fresh(source.name)
+                cadence = self.cadence(source.name)
+                if entry is None:
+                    source.next_due = now
+                elif cadence is not None:
+                    source.next_due = now - entry.age_seconds + cadence
+                else:
+                    source.next_due = None
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name=f'{self.name}-scheduler', daemon=True)
+        self._thread.start()
+        logger.info("Source scheduler started: " + ', '.join(
+            f"{name} every {self.cadence(name):g}s" if self.cadence(name) else f"{name} once"
+            for name in self._sources))
+        return self
+
+    def stop(self):
+        """Stop the background thread (fetches in flight finish on their own)"""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        self._thread = None
+
+    def _loop(self):
+        """Start due refreshes in priority order, then sleep until the next slot"""
+        while not self._stop_event.is_set():
+            with self._lock:
+                now = time.monotonic()
+                due = [(source.policy.priority, source.next_due, source.name, source)
+                       for source in self._sources.values()
+                       if source.next_due is not None and source.next_due <= now]
+                for _, _, _, source in sorted(due, key=lambda item: item[:3]):
+                    self._submit(source)
+                    self._schedule(source, now)
+                upcoming = [source.next_due for source in self._sources.values() if source.next_due is not None]
+
+            timeout = max(0.0, min(upcoming) - time.monotonic()) if upcoming else None
+            self._wake_event.wait(timeout)
+            self._wake_event.clear()
+
+    def get_stats(self) -> Dict:
+        """
+        Get scheduler status
+
+        Returns:
+            Dictionary with the running flag and, per source, its policy,
+            current cadence, next slot, refresh/error counters and the
+            status of its latest value
+        """
+        now = time.monotonic()
+        values = self.store.describe(self._sources)
+        sources = {}
+        for name, source in self._sources.items():
+            sources[name] = dict(
+                values[name],
+                policy=source.policy.to_dict(),
+                cadence_seconds=self.cadence(name),
+                next_refresh_in_seconds=(round(max(0.0, source.next_due - now), 1)
+                                         if source.next_due is not None and self.is_running else None),
+                refreshing=source.inflight is not None and not source.inflight.done(),
+                refreshes=source.refreshes,
+                errors=source.errors
+            )
+        return {'running': self.is_running, 'sources': sources}
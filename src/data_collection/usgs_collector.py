@@ -9,23 +9,141 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from loguru import logger
 
+from .http_client import HTTPClient, get_shared_client
+from .async_http_client import AsyncHTTPClient, get_shared_async_client
+from .source_scheduler import RefreshPolicy
+
+
+def features_to_dataframe(features: List[Dict]) -> pd.DataFrame:
+    """
+    Convert USGS GeoJSON features to the collector's DataFrame format
+    
+    Args:
+        features: GeoJSON features from the USGS API
+        
+    Returns:
+        DataFrame with one row per earthquake
+    """
+    earthquakes = []
+    for feature in features:
+        props = feature['properties']
+        coords = feature['geometry']['coordinates']
+        
+        earthquakes.append({
+            'id': feature['id'],
+            'magnitude': props['mag'],
+            'depth': coords[2],  # km
+            'latitude': coords[1],
+            'longitude': coords[0],
+            # Naive UTC, like every other timestamp in the pipeline (utcnow)
+            'time': datetime.utcfromtimestamp(props['time'] / 1000),
+            'updated': datetime.utcfromtimestamp(props.get('updated', props['time']) / 1000),
+            'place': props['place'],
+            'type': props['type'],
+            'tsunami': props.get('tsunami', 0),
+            'sig': props.get('sig', 0),
+            'url': props.get('url', '')
+        })
+    
+    return pd.DataFrame(earthquakes)
+
 
 class USGSEarthquakeCollector:
     """Collects earthquake data from USGS Earthquake API"""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None):
         """
         Initialize USGS collector
         
         Args:
             config: Configuration dictionary with API settings
+            http_client: HTTP client (default: the shared pooled client)
         """
         self.config = config['apis']['usgs_earthquake']
+        self.http = http_client or get_shared_client(config)
         self.base_url = self.config['base_url']
         self.min_magnitude = self.config['min_magnitude']
         self.region = self.config['region']
         self.lookback_hours = self.config['lookback_hours']
+        # The feed is polled at the shared poller's cadence
+        self.refresh_policy = RefreshPolicy.from_config(
+            self.config.get('refresh'),
+            RefreshPolicy(cadence_seconds=self.config.get('poller', {}).get('interval_seconds', 60),
+                          ttl_seconds=600, priority=0)
+        )
+        
+    def _query_params(self, hours: Optional[int] = None,
+                      region: Optional[Dict] = None,
+                      min_magnitude: Optional[float] = None) -> Dict:
+        """FDSN event query for the lookback window ending now (defaults from config)"""
+        hours = hours or self.lookback_hours
+        region = region or self.region
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(hours=hours)
+        
+        return {
+            'format': self.config['format'],
+            'starttime': start_time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'endtime': end_time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'minmagnitude': self.min_magnitude if min_magnitude is None else min_magnitude,
+            'minlatitude': region['min_latitude'],
+            'maxlatitude': region['max_latitude'],
+            'minlongitude': region['min_longitude'],
+            'maxlongitude': region['max_longitude'],
+            'orderby': 'time'
+        }
+    
+    def fetch_features(self, hours: Optional[int] = None,
+                       region: Optional[Dict] = None,
+                       min_magnitude: Optional[float] = None) -> List[Dict]:
+        """
+        Fetch raw GeoJSON features from USGS API
+        
+        Args:
+            hours: Lookback period in hours (default from config)
+            region: Bounding box with min/max latitude/longitude (default from config)
+            min_magnitude: Minimum magnitude (default from config)
+            
+        Returns:
+            List of GeoJSON features, most recent first
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        params = self._query_params(hours, region, min_magnitude)
+        
+        response = self.http.get(self.base_url, params=params)
+        response.raise_for_status()
+        
+        return response.json().get('features', [])
+    
+    async def fetch_features_async(self, hours: Optional[int] = None,
+                                   region: Optional[Dict] = None,
+                                   min_magnitude: Optional[float] = None,
+                                   http_client: Optional[AsyncHTTPClient] = None) -> List[Dict]:
+        """
+        Non-blocking fetch_features for code running on an event loop
         
+        Args:
+            hours: Lookback period in hours (default from config)
+            region: Bounding box with min/max latitude/longitude (default from config)
+            min_magnitude: Minimum magnitude (default from config)
+            http_client: Async HTTP client (default: the shared async client)
+            
+        Returns:
+            List of GeoJSON features, most recent first
+            
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: If the request fails
+        """
+        params = self._query_params(hours, region, min_magnitude)
+        
+        http = http_client or get_shared_async_client()
+        response = await http.get(self.base_url, params=params)
+        response.raise_for_status()
+        
+        return response.json().get('features', [])
+    
     def fetch_recent_earthquakes(self, hours: Optional[int] = None) -> pd.DataFrame:
         """
         Fetch recent earthquakes from USGS API
@@ -38,51 +156,15 @@ class USGSEarthquakeCollector:
         """
         try:
             hours = hours or self.lookback_hours
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(hours=hours)
-            
-            params = {
-                'format': self.config['format'],
-                'starttime': start_time.strftime('%Y-%m-%dT%H:%M:%S'),
-                'endtime': end_time.strftime('%Y-%m-%dT%H:%M:%S'),
-                'minmagnitude': self.min_magnitude,
-                'minlatitude': self.region['min_latitude'],
-                'maxlatitude': self.region['max_latitude'],
-                'minlongitude': self.region['min_longitude'],
-                'maxlongitude': self.region['max_longitude']
-            }
             
             logger.info(f"Fetching earthquakes from USGS (last {hours} hours)...")
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            features = data.get('features', [])
+            features = self.fetch_features(hours=hours)
             
             if not features:
                 logger.warning("No earthquakes found in specified region")
                 return pd.DataFrame()
             
-            earthquakes = []
-            for feature in features:
-                props = feature['properties']
-                coords = feature['geometry']['coordinates']
-                
-                earthquakes.append({
-                    'id': feature['id'],
-                    'magnitude': props['mag'],
-                    'depth': coords[2],  # km
-                    'latitude': coords[1],
-                    'longitude': coords[0],
-                    'time': datetime.fromtimestamp(props['time'] / 1000),
-                    'place': props['place'],
-                    'type': props['type'],
-                    'tsunami': props.get('tsunami', 0),
-                    'sig': props.get('sig', 0),
-                    'url': props.get('url', '')
-                })
-            
-            df = pd.DataFrame(earthquakes)
+            df = features_to_dataframe(features)
             logger.success(f"Fetched {len(df)} earthquakes from USGS")
             return df
             
@@ -0,0 +1,389 @@
+"""
+USGS Earthquake Poller
+Background refresh of a shared, immutable earthquake snapshot
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from loguru import logger
+
+from .http_client import HTTPClient
+from .async_http_client import AsyncHTTPClient
+from .usgs_collector import USGSEarthquakeCollector, features_to_dataframe
+
+
+# Superset of every consumer's region (/live-data uses the widest box)
+DEFAULT_POLLER_REGION = {
+    'min_latitude': -40,
+    'max_latitude': 30,
+    'min_longitude': 40,
+    'max_longitude': 120
+}
+
+
+def in_region(feature: Dict, region: Dict) -> bool:
+    """Check whether a GeoJSON feature lies inside a bounding box"""
+    longitude, latitude = feature['geometry']['coordinates'][:2]
+    return (region['min_latitude'] <= latitude <= region['max_latitude'] and
+            region['min_longitude'] <= longitude <= region['max_longitude'])
+
+
+class EarthquakeSnapshot:
+    """
+    Immutable result of one USGS poll
+
+    Consumers apply their own region, magnitude and time filters locally,
+    so any number of viewers is served from a single upstream request.
+    """
+
+    __slots__ = ('features', 'fetched_at', 'start_time', 'end_time', 'region', 'min_magnitude')
+
+    def __init__(self, features: List[Dict], fetched_at: datetime, start_time: datetime,
+                 end_time: datetime, region: Dict, min_magnitude: float):
+        self.features: Tuple[Dict, ...] = tuple(features)
+        self.fetched_at = fetched_at
+        self.start_time = start_time
+        self.end_time = end_time
+        self.region = dict(region)
+        self.min_magnitude = min_magnitude
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the snapshot was fetched"""
+        return (datetime.utcnow() - self.fetched_at).total_seconds()
+
+    @property
+    def lookback_hours(self) -> float:
+        """Time window covered by the snapshot"""
+        return (self.end_time - self.start_time).total_seconds() / 3600.0
+
+    def covers(self, hours: Optional[float] = None, min_magnitude: Optional[float] = None) -> bool:
+        """Whether the snapshot holds every event for the requested window and magnitude"""
+        if hours is not None and hours > self.lookback_hours + 1e-9:
+            return False
+        if min_magnitude is not None and min_magnitude < self.min_magnitude:
+            return False
+        return True
+
+    def filter(self, region: Optional[Dict] = None,
+               min_magnitude: Optional[float] = None,
+               hours: Optional[float] = None) -> List[Dict]:
+        """
+        Select features locally
+
+        Args:
+            region: Bounding box with min/max latitude/longitude
+            min_magnitude: Minimum magnitude
+            hours: Only events from the last N hours (relative to the poll)
+
+        Returns:
+            Matching GeoJSON features, most recent first
+        """
+        cutoff_ms = None
+        if hours is not None:
+            # end_time is naive UTC, USGS times are epoch milliseconds
+            end_ms = self.end_time.replace(tzinfo=timezone.utc).timestamp() * 1000.0
+            cutoff_ms = end_ms - hours * 3600.0 * 1000.0
+
+        selected = []
+        for feature in self.features:
+            props = feature['properties']
+            if min_magnitude is not None and (props.get('mag') is None or props['mag'] < min_magnitude):
+                continue
+            if cutoff_ms is not None and props.get('time', 0) < cutoff_ms:
+                continue
+            if region is not None and not in_region(feature, region):
+                continue
+            selected.append(feature)
+        return selected
+
+    def to_dataframe(self, **filters) -> pd.DataFrame:
+        """Filtered features in USGSEarthquakeCollector's DataFrame format"""
+        features = self.filter(**filters)
+        if not features:
+            return pd.DataFrame()
+        return features_to_dataframe(features)
+
+
+class USGSPoller:
+    """
+    Single background poller for the USGS FDSN event API
+
+    Refreshes a superset region on a fixed cadence and atomically swaps in
+    a new immutable snapshot. When the background thread is not running,
+    :meth:`get_snapshot` refreshes on demand once the snapshot is older
+    than the interval. A failed refresh keeps the previous snapshot.
+    """
+
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None):
+        """
+        Initialize USGS poller
+
+        Args:
+            config: Configuration dictionary (apis.usgs_earthquake.poller)
+            http_client: HTTP client (default: the shared pooled client)
+        """
+        usgs_config = config['apis']['usgs_earthquake']
+        poller_config = usgs_config.get('poller', {})
+
+        self.collector = USGSEarthquakeCollector(config, http_client)
+        self.interval = float(poller_config.get('interval_seconds', 60))
+        self.lookback_hours = int(poller_config.get('lookback_hours', usgs_config['lookback_hours']))
+        self.min_magnitude = float(poller_config.get('min_magnitude', usgs_config['min_magnitude']))
+        self.region = poller_config.get('region', DEFAULT_POLLER_REGION)
+
+        self._snapshot: Optional[EarthquakeSnapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._async_refresh_lock: Optional[asyncio.Lock] = None
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self._polls = 0
+        self._errors = 0
+        self._last_error: Optional[str] = None
+        self._last_duration_ms: Optional[float] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background thread is polling"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> 'USGSPoller':
+        """Start the background polling thread (no-op if already running)"""
+        if self.is_running:
+            return self
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._poll_loop, name='usgs-poller', daemon=True)
+        self._thread.start()
+        logger.info(f"USGS poller started (every {self.interval:.0f}s, "
+                    f"M≥{self.min_magnitude}, last {self.lookback_hours}h)")
+        return self
+
+    def stop(self):
+        """Stop the background polling thread"""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        self._thread = None
+
+    def _poll_loop(self):
+        """Refresh on a fixed cadence until stopped"""
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            self.refresh()
+            # Re-evaluated when set_interval() changes the cadence mid-wait
+            while not self._stop_event.is_set():
+                remaining = self.interval - (time.monotonic() - started)
+                if remaining <= 0:
+                    break
+                self._wake_event.wait(remaining)
+                self._wake_event.clear()
+
+    def set_interval(self, seconds: float):
+        """
+        Change the refresh cadence (e.g. while monitoring is escalated)
+
+        A running poller applies it to the wait in progress, so a shorter
+        interval that is already overdue triggers a refresh at once.
+
+        Args:
+            seconds: New interval in seconds
+        """
+        if float(seconds) == self.interval:
+            return
+        self.interval = float(seconds)
+        self._wake_event.set()
+
+    def refresh(self) -> Optional[EarthquakeSnapshot]:
+        """
+        Poll USGS once and swap in the new snapshot
+
+        Returns:
+            The current snapshot (the previous one if the poll failed)
+        """
+        with self._refresh_lock:
+            return self._refresh_locked()
+
+    def _swap_in(self, features: List[Dict], end_time: datetime):
+        """Publish a successful poll as the new snapshot"""
+        self._snapshot = EarthquakeSnapshot(
+            features,
+            fetched_at=datetime.utcnow(),
+            start_time=end_time - timedelta(hours=self.lookback_hours),
+            end_time=end_time,
+            region=self.region,
+            min_magnitude=self.min_magnitude
+        )
+        self._polls += 1
+
+    def _poll_failed(self, error: Exception):
+        """Record a failed poll (the previous snapshot stays)"""
+        self._errors += 1
+        self._last_error = str(error)
+        logger.error(f"USGS poll failed (serving previous snapshot): {error}")
+
+    def _refresh_locked(self) -> Optional[EarthquakeSnapshot]:
+        """Poll USGS (caller holds the refresh lock)"""
+        start = time.perf_counter()
+        end_time = datetime.utcnow()
+        try:
+            features = self.collector.fetch_features(
+                hours=self.lookback_hours,
+                region=self.region,
+                min_magnitude=self.min_magnitude
+            )
+            self._swap_in(features, end_time)
+        except Exception as e:
+            self._poll_failed(e)
+        finally:
+            self._last_duration_ms = (time.perf_counter() - start) * 1000.0
+
+        return self._snapshot
+
+    async def refresh_async(self, http_client: Optional[AsyncHTTPClient] = None
+                            ) -> Optional[EarthquakeSnapshot]:
+        """
+        Poll USGS once without blocking the event loop
+
+        Args:
+            http_client: Async HTTP client (default: the shared async client)
+
+        Returns:
+            The current snapshot (the previous one if the poll failed)
+        """
+        start = time.perf_counter()
+        end_time = datetime.utcnow()
+        try:
+            features = await self.collector.fetch_features_async(
+                hours=self.lookback_hours,
+                region=self.region,
+                min_magnitude=self.min_magnitude,
+                http_client=http_client
+            )
+            self._swap_in(features, end_time)
+        except Exception as e:
+            self._poll_failed(e)
+        finally:
+            self._last_duration_ms = (time.perf_counter() - start) * 1000.0
+
+        return self._snapshot
+
+    def _needs_refresh(self, snapshot: Optional[EarthquakeSnapshot]) -> bool:
+        """No snapshot yet, or stale while the background thread is not running"""
+        if snapshot is None:
+            return True
+        return not self.is_running and snapshot.age_seconds >= self.interval
+
+    def get_snapshot(self) -> EarthquakeSnapshot:
+        """
+        Get the latest snapshot
+
+        Returns:
+            Current snapshot
+
+        Raises:
+            RuntimeError: If no poll has succeeded yet
+        """
+        snapshot = self._snapshot
+
+        if self._needs_refresh(snapshot):
+            with self._refresh_lock:
+                # Another request may have refreshed while this one waited
+                snapshot = self._snapshot
+                if self._needs_refresh(snapshot):
+                    snapshot = self._refresh_locked()
+
+        if snapshot is None:
+            raise RuntimeError(f"No USGS snapshot available: {self._last_error}")
+        return snapshot
+
+    async def get_snapshot_async(self, http_client: Optional[AsyncHTTPClient] = None) -> EarthquakeSnapshot:
+        """
+        Get the latest snapshot from code running on an event loop
+
+        Same refresh rules as :meth:`get_snapshot`, but an on-demand poll
+        awaits the async client instead of blocking a thread. Concurrent
+        callers share one poll.
+
+        Args:
+            http_client: Async HTTP client (default: the shared async client)
+
+        Returns:
+            Current snapshot
+
+        Raises:
+            RuntimeError: If no poll has succeeded yet
+        """
+        snapshot = self._snapshot
+
+        if self._needs_refresh(snapshot):
+            if self._async_refresh_lock is None:
+                self._async_refresh_lock = asyncio.Lock()
+            async with self._async_refresh_lock:
+                snapshot = self._snapshot
+                if self._needs_refresh(snapshot):
+                    snapshot = await self.refresh_async(http_client)
+
+        if snapshot is None:
+            raise RuntimeError(f"No USGS snapshot available: {self._last_error}")
+        return snapshot
+
+    def get_stats(self) -> Dict:
+        """
+        Get poller statistics
+
+        Returns:
+            Dictionary with polling state, snapshot age and error counters
+        """
+        snapshot = self._snapshot
+        return {
+            'running': self.is_running,
+            'interval_seconds': self.interval,
+            'region': self.region,
+            'min_magnitude': self.min_magnitude,
+            'lookback_hours': self.lookback_hours,
+            'polls': self._polls,
+            'errors': self._errors,
+            'last_error': self._last_error,
+            'last_duration_ms': round(self._last_duration_ms, 1) if self._last_duration_ms is not None else None,
+            'snapshot_events': len(snapshot.features) if snapshot is not None else 0,
+            'snapshot_age_seconds': round(snapshot.age_seconds, 1) if snapshot is not None else None
+        }
+
+
+_shared_poller: Optional[USGSPoller] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_poller(config: Dict, http_client: Optional[HTTPClient] = None) -> USGSPoller:
+    """
+    Get the process-wide USGS poller
+
+    /live-data, /api/earthquake/recent and the monitoring loop share one
+    poller per process; it is created (and started, unless disabled in
+    apis.usgs_earthquake.poller) on first use.
+
+    Args:
+        config: Configuration dictionary
+        http_client: HTTP client (default: the shared pooled client)
+
+    Returns:
+        Shared USGSPoller instance
+    """
+    global _shared_poller
+
+    with _shared_lock:
+        if _shared_poller is None:
+            _shared_poller = USGSPoller(config, http_client)
+            if config['apis']['usgs_earthquake'].get('poller', {}).get('enabled', True):
+                _shared_poller.start()
+        return _shared_poller
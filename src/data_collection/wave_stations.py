@@ -0,0 +1,844 @@
+"""
+Wave Station Collector
+Concurrent sea level / wave height fetches for the dashboard monitoring stations
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from loguru import logger
+
+from .http_client import HTTPClient, get_shared_client
+from .async_http_client import AsyncHTTPClient, get_shared_async_client
+
+
+IOC_URL = "http://www.ioc-sealevelmonitoring.org/service.php"
+DART_URL = "https://www.ndbc.noaa.gov/data/realtime2/{buoy_id}.txt"
+
+# Monitoring stations with IOC codes, grouped by region
+WAVE_STATIONS = {
+    'arabian': {
+        'name': 'Arabian Sea',
+        'stations': [
+            {'id': 'okha', 'ioc_code': 'okha', 'lat': 22.47, 'lon': 69.07, 'name': 'Okha, India'},
+            {'id': 'mumbai', 'ioc_code': 'bomb', 'lat': 18.95, 'lon': 72.82, 'name': 'Mumbai, India'},
+        ]
+    },
+    'bengal': {
+        'name': 'Bay of Bengal',
+        'stations': [
+            {'id': 'chennai', 'ioc_code': 'ched', 'lat': 13.10, 'lon': 80.30, 'name': 'Chennai, India'},
+            {'id': 'vizag', 'ioc_code': 'visa', 'lat': 17.68, 'lon': 83.28, 'name': 'Visakhapatnam, India'},
+        ]
+    },
+    'andaman': {
+        'name': 'Andaman Sea',
+        'stations': [
+            {'id': 'portblair', 'ioc_code': 'port', 'lat': 11.66, 'lon': 92.73, 'name': 'Port Blair, India'},
+            {'id': 'phuket', 'ioc_code': 'phuk', 'lat': 7.89, 'lon': 98.39, 'name': 'Phuket, Thailand'},
+        ]
+    }
+}
+
+# Nearby DART buoys used as backup when a region's IOC station has no data
+DART_BUOYS = {
+    'bengal': '23401',  # Bay of Bengal DART
+    'andaman': '23401'  # Also covers Andaman
+}
+
+# Tide/wave parameters for the simulated fallback
+REGIONAL_PARAMS = {
+    'arabian': {'baseline': 4.2, 'tide_amp': 1.8, 'wave_amp': 0.6},
+    'bengal': {'baseline': 4.8, 'tide_amp': 2.2, 'wave_amp': 0.8},
+    'andaman': {'baseline': 3.9, 'tide_amp': 1.6, 'wave_amp': 0.7}
+}
+
+# Shared pool so concurrent requests do not each spawn their own threads
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='wave-fetch')
+
+
+def parse_ioc_readings(text: str) -> Optional[List[Dict]]:
+    """
+    Parse an IOC sea level service response
+
+    Args:
+        text: Raw response body
+
+    Returns:
+        Last 10 readings, or None if fewer than 5 are available
+    """
+    if len(text) <= 100:
+        return None
+
+    readings = []
+
+    # Skip header lines and parse data
+    data_started = False
+    for line in text.strip().split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if 'slevel' in line.lower() or 'time' in line.lower():
+            data_started = True
+            continue
+        if data_started:
+            parts = line.split(',')
+            if len(parts) >= 2:
+                try:
+                    # Format: timestamp, water_level, ...
+                    timestamp = parts[0].strip()
+                    water_level = float(parts[1].strip())
+
+                    # Convert to meters and add offset for visualization
+                    water_level_m = water_level / 100.0  # cm to meters
+                    water_level_m += 5.0  # Add baseline for positive display
+
+                    readings.append({
+                        'time': timestamp,
+                        'value': round(water_level_m, 3),
+                        'quality': 'verified'
+                    })
+                except (ValueError, IndexError):
+                    continue
+
+    # Need at least 5 readings
+    return readings[-10:] if len(readings) >= 5 else None
+
+
+def parse_dart_readings(text: str) -> Optional[List[Dict]]:
+    """
+    Parse an NDBC realtime2 DART file
+
+    Args:
+        text: Raw file contents
+
+    Returns:
+        Up to 10 readings, or None if fewer than 5 are available
+    """
+    lines = text.strip().split('\n')
+    readings = []
+
+    # Parse NDBC format (first 2 lines are headers)
+    for line in lines[2:12]:  # Get 10 readings
+        parts = line.split()
+        if len(parts) >= 5:
+            try:
+                # NDBC format: YY MM DD hh mm WDIR WSPD GST WVHT ...
+                year, month, day, hour, minute = parts[0:5]
+
+                # Construct timestamp
+                timestamp = f"20{year}-{month}-{day} {hour}:{minute}"
+
+                # Get wave height if available (usually column 8)
+                wave_height = float(parts[8]) if len(parts) > 8 and parts[8] != 'MM' else 5.0
+
+                readings.append({
+                    'time': timestamp,
+                    'value': round(wave_height, 2),
+                    'quality': 'measured'
+                })
+            except (ValueError, IndexError):
+                continue
+
+    return readings[-10:] if len(readings) >= 5 else None
+
+
+def fetch_ioc_readings(ioc_code: str, timeout: float,
+                       http_client: Optional[HTTPClient] = None) -> Optional[List[Dict]]:
+    """
+    Fetch the last hour of sea level readings from an IOC station
+
+    Args:
+        ioc_code: IOC station code
+        timeout: Request timeout in seconds
+        http_client: HTTP client (default: the shared pooled client)
+
+    Returns:
+        Last 10 readings, or None if fewer than 5 are available
+    """
+    params = {
+        'code': ioc_code.upper(),
+        'period': 0.04  # Last ~1 hour (0.04 days)
+    }
+
+    # No retries: the caller's deadline already bounds this fetch
+    http = http_client or get_shared_client()
+    return http.get_conditional(
+        IOC_URL,
+        lambda response: parse_ioc_readings(response.text),
+        params=params,
+        source='ioc',
+        timeout=timeout,
+        max_retries=0
+    )
+
+
+def fetch_dart_readings(buoy_id: str, timeout: float,
+                        http_client: Optional[HTTPClient] = None) -> Optional[List[Dict]]:
+    """
+    Fetch recent wave heights from an NDBC DART buoy
+
+    The realtime2 file changes every 10-60 minutes, so an unchanged file
+    is answered with 304 and the previous readings are reused.
+
+    Args:
+        buoy_id: NDBC station id
+        timeout: Request timeout in seconds
+        http_client: HTTP client (default: the shared pooled client)
+
+    Returns:
+        Up to 10 readings, or None if fewer than 5 are available
+    """
+    http = http_client or get_shared_client()
+    return http.get_conditional(
+        DART_URL.format(buoy_id=buoy_id),
+        lambda response: parse_dart_readings(response.text),
+        source='ndbc_dart',
+        timeout=timeout,
+        max_retries=0
+    )
+
+
+async def fetch_ioc_readings_async(ioc_code: str, timeout: float,
+                                   http_client: Optional[AsyncHTTPClient] = None) -> Optional[List[Dict]]:
+    """Non-blocking fetch_ioc_readings for code running on an event loop"""
+    http = http_client or get_shared_async_client()
+    return await http.get_conditional(
+        IOC_URL,
+        lambda response: parse_ioc_readings(response.text),
+        params={'code': ioc_code.upper(), 'period': 0.04},
+        source='ioc',
+        timeout=timeout,
+        max_retries=0
+    )
+
+
+async def fetch_dart_readings_async(buoy_id: str, timeout: float,
+                                    http_client: Optional[AsyncHTTPClient] = None) -> Optional[List[Dict]]:
+    """Non-blocking fetch_dart_readings for code running on an event loop"""
+    http = http_client or get_shared_async_client()
+    return await http.get_conditional(
+        DART_URL.format(buoy_id=buoy_id),
+        lambda response: parse_dart_readings(response.text),
+        source='ndbc_dart',
+        timeout=timeout,
+        max_retries=0
+    )
+
+
+def simulated_readings(region_key: str) -> List[Dict]:
+    """Realistic tide + wave readings for stations without real-time data"""
+    current_time = datetime.utcnow()
+    params = REGIONAL_PARAMS[region_key]
+    readings = []
+
+    for i in range(10):
+        time_offset = current_time - timedelta(minutes=6 * (9 - i))
+        tide = params['baseline'] + params['tide_amp'] * np.sin(2 * np.pi * time_offset.hour / 12)
+        wave = params['wave_amp'] * np.sin(2 * np.pi * i / 3) * (0.8 + 0.2 * np.random.rand())
+        noise = np.random.randn() * 0.1
+        water_level = tide + wave + noise
+
+        readings.append({
+            'time': time_offset.strftime('%Y-%m-%d %H:%M'),
+            'value': round(water_level, 2),
+            'quality': 'estimated'
+        })
+
+    return readings
+
+
+def _result(future, completed_at: Dict, deadline: float):
+    """Result of a fetch that finished before the deadline (None otherwise or on failure)"""
+    if future is None or future.cancelled() or completed_at.get(future, float('inf')) > deadline:
+        return None
+    try:
+        return future.result()
+    except Exception as e:
+        logger.debug(f"Wave station fetch failed: {e}")
+        return None
+
+
+def _select_stations(station_ids: Optional[Iterable[str]]) -> List[Tuple[str, Dict]]:
+    """(region key, station) pairs for the requested station ids (all by default)"""
+    selected = None if station_ids is None else set(station_ids)
+    return [
+        (region_key, station)
+        for region_key, region_info in WAVE_STATIONS.items()
+        for station in region_info['stations']
+        if selected is None or station['id'] in selected
+    ]
+
+
+def _dart_timeouts(stations: List[Tuple[str, Dict]], station_deadlines: Dict[str, float],
+                   start: float) -> Dict[str, float]:
+    """Timeout per distinct DART buoy: the latest deadline of the stations it backs up"""
+    return {
+        buoy_id: max(station_deadlines[station['id']] for region_key, station in stations
+                     if DART_BUOYS.get(region_key) == buoy_id) - start
+        for buoy_id in {DART_BUOYS[region_key] for region_key, _ in stations if region_key in DART_BUOYS}
+    }
+
+
+def _station_entry(region_key: str, station: Dict, ioc_readings: Optional[List[Dict]],
+                   dart_readings: Optional[List[Dict]], timed_out: bool) -> Dict:
+    """Entry from the IOC readings, else the region's DART backup, else simulated readings"""
+    if ioc_readings is not None:
+        logger.info(f"✓ Real-time data from {station['name']} "
+                    f"({station['ioc_code'].upper()}): {len(ioc_readings)} readings")
+        return {
+            'station_id': station['id'],
+            'station_name': station['name'],
+            'location': {'lat': station['lat'], 'lon': station['lon']},
+            'readings': ioc_readings,
+            'source': 'IOC Sea Level Station',
+            'data_type': 'sea_level',
+            'unit': 'meters',
+            'real_data': True
+        }
+
+    # Try NDBC/DART buoys for backup
+    buoy_id = DART_BUOYS.get(region_key)
+    if dart_readings is not None:
+        logger.info(f"✓ Real-time DART data from buoy {buoy_id}: {len(dart_readings)} readings")
+        return {
+            'station_id': f'dart_{buoy_id}',
+            'station_name': f'DART Buoy {buoy_id}',
+            'location': {'lat': station['lat'], 'lon': station['lon']},
+            'readings': dart_readings,
+            'source': 'NOAA DART Buoy',
+            'data_type': 'wave_height',
+            'unit': 'meters',
+            'real_data': True
+        }
+
+    # If no real data available, generate realistic fallback
+    logger.info(f"Using simulated data for {station['name']}"
+                f"{' (deadline exceeded)' if timed_out else ''}")
+    return {
+        'station_id': station['id'],
+        'station_name': station['name'],
+        'location': {'lat': station['lat'], 'lon': station['lon']},
+        'readings': simulated_readings(region_key),
+        'source': 'Simulated (No real-time station)',
+        'data_type': 'water_level',
+        'unit': 'meters',
+        'real_data': False
+    }
+
+
+def _station_settled(region_key: str, station: Dict, ioc_futures: Dict, dart_futures: Dict,
+                     completed_at: Dict, deadline: float, now: float) -> bool:
+    """Whether a station's entry is final: IOC data arrived, every source has finished, or time is up"""
+    if now >= deadline:
+        return True
+    ioc_future = ioc_futures[station['id']]
+    if not ioc_future.done():
+        return False
+    if (not ioc_future.cancelled() and ioc_future.exception() is None
+            and ioc_future.result() is not None and completed_at.get(ioc_future, float('inf')) <= deadline):
+        return True
+    dart_future = dart_futures.get(DART_BUOYS.get(region_key))
+    return dart_future is None or dart_future.done()
+
+
+def _next_deadline(stations: List[Tuple[str, Dict]], ioc_futures: Dict, dart_futures: Dict,
+                   completed_at: Dict, station_deadlines: Dict[str, float],
+                   global_deadline: float) -> Optional[float]:
+    """Earliest deadline of a station whose entry can still change (None once all are settled)"""
+    now = time.monotonic()
+    deadlines = [min(station_deadlines[station['id']], global_deadline) for _, station in stations]
+    unsettled = [
+        deadline for (region_key, station), deadline in zip(stations, deadlines)
+        if not _station_settled(region_key, station, ioc_futures, dart_futures, completed_at, deadline, now)
+    ]
+    return min(unsettled) if unsettled else None
+
+
+def _collect_entries(stations: List[Tuple[str, Dict]], ioc_futures: Dict, dart_futures: Dict,
+                     completed_at: Dict, station_deadlines: Dict[str, float],
+                     global_deadline: float) -> Tuple[Dict, List[str]]:
+    """Station entries from finished fetches (thread or asyncio futures) and the timed-out ids"""
+    entries = {}
+    timed_out = []
+
+    for region_key, station in stations:
+        deadline = min(station_deadlines[station['id']], global_deadline)
+        ioc_future = ioc_futures[station['id']]
+        dart_future = dart_futures.get(DART_BUOYS.get(region_key))
+        ioc_readings = _result(ioc_future, completed_at, deadline)
+        dart_readings = _result(dart_future, completed_at, deadline) if ioc_readings is None else None
+
+        station_timed_out = ioc_readings is None and dart_readings is None and any(
+            future is not None and completed_at.get(future, float('inf')) > deadline
+            for future in (ioc_future, dart_future)
+        )
+        if station_timed_out:
+            timed_out.append(station['id'])
+
+        entries[station['id']] = _station_entry(region_key, station, ioc_readings,
+                                                dart_readings, station_timed_out)
+
+    return entries, timed_out
+
+
+def fetch_station_entries(station_ids: Optional[Iterable[str]] = None,
+                          station_timeout: float = 6.0, total_timeout: float = 8.0,
+                          http_client: Optional[HTTPClient] = None) -> Dict:
+    """
+    Fetch monitoring stations concurrently
+
+    All selected IOC stations and each distinct DART buoy are requested at
+    once on a shared thread pool; a buoy shared by several regions is
+    downloaded once. Each station gets its own deadline (a station's
+    'timeout' entry, or ``station_timeout``) and the whole fan-out is
+    bounded by ``total_timeout``. Stations are settled as their fetches
+    complete (a DART backup is not awaited for stations whose IOC data has
+    arrived) and the call returns as soon as no station can still change.
+    Stations without data by their deadline fall back to simulated
+    readings and are listed in ``timed_out``.
+
+    Args:
+        station_ids: Stations to fetch (default: all of WAVE_STATIONS)
+        station_timeout: Default deadline per station (IOC and DART backup) in seconds
+        total_timeout: Deadline for the whole fan-out in seconds
+        http_client: HTTP client (default: the shared pooled client)
+
+    Returns:
+        Dictionary with 'entries' ({station id: station entry}), 'timed_out'
+        station ids and 'elapsed_ms'
+    """
+    start = time.monotonic()
+    global_deadline = start + total_timeout
+    stations = _select_stations(station_ids)
+
+    completed_at = {}
+
+    def submit(fn, *args):
+        future = _executor.submit(fn, *args)
+        future.add_done_callback(lambda f: completed_at.setdefault(f, time.monotonic()))
+        return future
+
+    ioc_futures = {}
+    station_deadlines = {}
+    for region_key, station in stations:
+        timeout = min(station.get('timeout', station_timeout), total_timeout)
+        station_deadlines[station['id']] = start + timeout
+        ioc_futures[station['id']] = submit(fetch_ioc_readings, station.get('ioc_code', ''), timeout, http_client)
+
+    # DART backups start at the same time, once per distinct buoy
+    dart_futures = {
+        buoy_id: submit(fetch_dart_readings, buoy_id, timeout, http_client)
+        for buoy_id, timeout in _dart_timeouts(stations, station_deadlines, start).items()
+    }
+
+    # Settle stations as their fetches complete and return once none can change
+    # (a DART backup is not awaited once its stations have IOC data), waking up
+    # at the next station deadline at the latest
+    remaining = set(ioc_futures.values()) | set(dart_futures.values())
+    while remaining:
+        deadline = _next_deadline(stations, ioc_futures, dart_futures, completed_at,
+                                  station_deadlines, global_deadline)
+        if deadline is None:
+            break
+        done, remaining = wait(remaining, timeout=max(0.0, deadline - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+        for future in done:
+            # wait() can return before the future's done callback has run
+            completed_at.setdefault(future, time.monotonic())
+
+    # Requests still queued once nothing depends on them are not worth starting
+    for future in list(ioc_futures.values()) + list(dart_futures.values()):
+        if not future.done():
+            future.cancel()
+
+    entries, timed_out = _collect_entries(stations, ioc_futures, dart_futures, completed_at,
+                                          station_deadlines, global_deadline)
+
+    return {
+        'entries': entries,
+        'timed_out': timed_out,
+        'elapsed_ms': round((time.monotonic() - start) * 1000.0, 1)
+    }
+
+
+async def fetch_station_entries_async(station_ids: Optional[Iterable[str]] = None,
+                                      station_timeout: float = 6.0, total_timeout: float = 8.0,
+                                      http_client: Optional[AsyncHTTPClient] = None) -> Dict:
+    """
+    fetch_station_entries on the event loop
+
+    Same deadlines and fallbacks, but every IOC station and DART buoy is an
+    asyncio task, so the fan-out holds no thread while it waits.
+
+    Args:
+        station_ids: Stations to fetch (default: all of WAVE_STATIONS)
+        station_timeout: Default deadline per station (IOC and DART backup) in seconds
+        total_timeout: Deadline for the whole fan-out in seconds
+        http_client: Async HTTP client (default: the shared async client)
+
+    Returns:
+        Dictionary with 'entries' ({station id: station entry}), 'timed_out'
+        station ids and 'elapsed_ms'
+    """
+    start = time.monotonic()
+    global_deadline = start + total_timeout
+    stations = _select_stations(station_ids)
+
+    completed_at = {}
+
+    def finished(task):
+        completed_at.setdefault(task, time.monotonic())
+        if not task.cancelled():
+            task.exception()  # retrieved here so late failures are not logged as unhandled
+
+    def launch(coroutine):
+        task = asyncio.ensure_future(coroutine)
+        task.add_done_callback(finished)
+        return task
+
+    ioc_tasks = {}
+    station_deadlines = {}
+    for region_key, station in stations:
+        timeout = min(station.get('timeout', station_timeout), total_timeout)
+        station_deadlines[station['id']] = start + timeout
+        ioc_tasks[station['id']] = launch(
+            fetch_ioc_readings_async(station.get('ioc_code', ''), timeout, http_client))
+
+    dart_tasks = {
+        buoy_id: launch(fetch_dart_readings_async(buoy_id, timeout, http_client))
+        for buoy_id, timeout in _dart_timeouts(stations, station_deadlines, start).items()
+    }
+
+    remaining = set(ioc_tasks.values()) | set(dart_tasks.values())
+    while remaining:
+        deadline = _next_deadline(stations, ioc_tasks, dart_tasks, completed_at,
+                                  station_deadlines, global_deadline)
+        if deadline is None:
+            break
+        _, remaining = await asyncio.wait(remaining, timeout=max(0.0, deadline - time.monotonic()),
+                                          return_when=asyncio.FIRST_COMPLETED)
+
+    for task in list(ioc_tasks.values()) + list(dart_tasks.values()):
+        if not task.done():
+            task.cancel()
+
+    entries, timed_out = _collect_entries(stations, ioc_tasks, dart_tasks, completed_at,
+                                          station_deadlines, global_deadline)
+    return {
+        'entries': entries,
+        'timed_out': timed_out,
+        'elapsed_ms': round((time.monotonic() - start) * 1000.0, 1)
+    }
+
+
+def group_by_region(entries: Dict[str, Dict]) -> Dict:
+    """Arrange per-station entries into the /wave-data region layout"""
+    wave_data = {}
+    for region_key, region_info in WAVE_STATIONS.items():
+        wave_data[region_key] = {
+            'region': region_info['name'],
+            'stations': [entries[station['id']] for station in region_info['stations']
+                         if station['id'] in entries],
+            'last_update': datetime.utcnow().isoformat()
+        }
+    return wave_data
+
+
+def collect_wave_data(station_timeout: float = 6.0, total_timeout: float = 8.0,
+                      http_client: Optional[HTTPClient] = None) -> Dict:
+    """
+    Fetch every monitoring station concurrently (see fetch_station_entries)
+
+    Args:
+        station_timeout: Default deadline per station in seconds
+        total_timeout: Deadline for the whole collection in seconds
+        http_client: HTTP client (default: the shared pooled client)
+
+    Returns:
+        Dictionary with per-region 'wave_data', 'timed_out' station ids and
+        'elapsed_ms'
+    """
+    result = fetch_station_entries(station_timeout=station_timeout, total_timeout=total_timeout,
+                                   http_client=http_client)
+    return {
+        'wave_data': group_by_region(result['entries']),
+        'timed_out': result['timed_out'],
+        'elapsed_ms': result['elapsed_ms']
+    }
+
+
+async def collect_wave_data_async(station_timeout: float = 6.0, total_timeout: float = 8.0,
+                                  http_client: Optional[AsyncHTTPClient] = None) -> Dict:
+    """collect_wave_data on the event loop (see fetch_station_entries_async)"""
+    result = await fetch_station_entries_async(station_timeout=station_timeout,
+                                               total_timeout=total_timeout,
+                                               http_client=http_client)
+    return {
+        'wave_data': group_by_region(result['entries']),
+        'timed_out': result['timed_out'],
+        'elapsed_ms': result['elapsed_ms']
+    }
+
+
+class WaveStationCache:
+    """
+    Per-station reading cache with stale-while-revalidate semantics
+
+    Requests are answered from the last good reading of every station.
+    Once an entry is older than the TTL it is still served, and a single
+    background refresh per station replaces it; only stations that were
+    never fetched are fetched in the request. A refresh that only yields
+    simulated readings keeps the previous real reading until it is older
+    than ``max_stale_seconds``.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_stale_seconds: float = 1800.0,
+                 station_timeout: float = 6.0, total_timeout: float = 8.0,
+                 http_client: Optional[HTTPClient] = None):
+        """
+        Initialize wave station cache
+
+        Args:
+            ttl_seconds: Age after which an entry is refreshed in the background
+            max_stale_seconds: How long a real reading is preferred over simulated data
+            station_timeout: Per-station fetch deadline in seconds
+            total_timeout: Deadline for one fan-out in seconds
+            http_client: HTTP client (default: the shared pooled client)
+        """
+        self.ttl = max(0.0, float(ttl_seconds))
+        self.max_stale = max(self.ttl, float(max_stale_seconds))
+        self.station_timeout = station_timeout
+        self.total_timeout = total_timeout
+        self.http = http_client
+
+        # station id -> (fetched_at monotonic, fetched_at UTC, entry)
+        self._entries: Dict[str, Tuple[float, datetime, Dict]] = {}
+        self._refreshing: Set[str] = set()
+        # station id -> monotonic time of the last fetch attempt
+        self._attempted: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        # Serializes cold fetches so a burst of first requests fetches once
+        self._fetch_lock = threading.Lock()
+        # Same for requests served on an event loop (created on first use)
+        self._async_fetch_lock: Optional[asyncio.Lock] = None
+        self._async_refreshes: Set[asyncio.Task] = set()
+
+        # Statistics
+        self._fresh_hits = 0
+        self._stale_hits = 0
+        self._cold_fetches = 0
+        self._refreshes = 0
+        self._refresh_errors = 0
+        self._last_refresh_ms: Optional[float] = None
+
+    def _store(self, result: Dict):
+        """Swap in fetched entries, keeping recent real readings over simulated ones"""
+        now = time.monotonic()
+        fetched_at = datetime.utcnow()
+        with self._lock:
+            for station_id, entry in result['entries'].items():
+                self._attempted[station_id] = now
+                previous = self._entries.get(station_id)
+                if (not entry['real_data'] and previous is not None and
+                        previous[2]['real_data'] and now - previous[0] <= self.max_stale):
+                    continue
+                self._entries[station_id] = (now, fetched_at, entry)
+
+    def _fetch(self, station_ids: List[str]) -> Dict:
+        """Fetch stations and store the results"""
+        result = fetch_station_entries(
+            station_ids,
+            station_timeout=self.station_timeout,
+            total_timeout=self.total_timeout,
+            http_client=self.http
+        )
+        self._store(result)
+        self._last_refresh_ms = result['elapsed_ms']
+        return result
+
+    async def _fetch_async(self, station_ids: List[str], http_client: Optional[AsyncHTTPClient]) -> Dict:
+        """Fetch stations on the event loop and store the results"""
+        result = await fetch_station_entries_async(
+            station_ids,
+            station_timeout=self.station_timeout,
+            total_timeout=self.total_timeout,
+            http_client=http_client
+        )
+        self._store(result)
+        self._last_refresh_ms = result['elapsed_ms']
+        return result
+
+    def _refresh_failed(self, error: Exception):
+        """Count and log a failed background refresh"""
+        self._refresh_errors += 1
+        logger.error(f"Wave station refresh failed (serving cached readings): {error}")
+
+    def _refresh(self, station_ids: List[str]):
+        """Background refresh of stale stations"""
+        try:
+            self._fetch(station_ids)
+            self._refreshes += 1
+        except Exception as e:
+            self._refresh_failed(e)
+        finally:
+            with self._lock:
+                self._refreshing.difference_update(station_ids)
+
+    async def _refresh_async(self, station_ids: List[str], http_client: Optional[AsyncHTTPClient]):
+        """Background refresh of stale stations on the event loop"""
+        try:
+            await self._fetch_async(station_ids, http_client)
+            self._refreshes += 1
+        except Exception as e:
+            self._refresh_failed(e)
+        finally:
+            with self._lock:
+                self._refreshing.difference_update(station_ids)
+
+    @staticmethod
+    def _all_ids() -> List[str]:
+        """Every monitoring station id"""
+        return [station['id'] for region_info in WAVE_STATIONS.values()
+                for station in region_info['stations']]
+
+    def _missing(self, all_ids: List[str]) -> List[str]:
+        """Stations that were never fetched"""
+        return [station_id for station_id in all_ids if station_id not in self._entries]
+
+    def _snapshot(self, all_ids: List[str]) -> Tuple[Dict, List[str], List[str]]:
+        """
+        Cached entries with their age, claiming stale stations for a refresh
+
+        Returns:
+            (station entries, stations to refresh now, all stations being refreshed)
+        """
+        now = time.monotonic()
+        entries = {}
+        stale = []
+        with self._lock:
+            for station_id in all_ids:
+                cached = self._entries.get(station_id)
+                if cached is None:
+                    continue
+                fetched_mono, fetched_at, entry = cached
+                age = now - fetched_mono
+                is_stale = age > self.ttl
+                if is_stale:
+                    self._stale_hits += 1
+                    # A kept real reading stays stale; retry at most once per TTL
+                    retry_due = now - self._attempted.get(station_id, 0.0) > self.ttl
+                    if station_id not in self._refreshing and retry_due:
+                        stale.append(station_id)
+                else:
+                    self._fresh_hits += 1
+                entries[station_id] = dict(
+                    entry,
+                    fetched_at=fetched_at.isoformat(),
+                    data_age_seconds=round(age, 1),
+                    stale=is_stale
+                )
+            self._refreshing.update(stale)
+            refreshing = sorted(self._refreshing)
+        return entries, stale, refreshing
+
+    @staticmethod
+    def _response(entries: Dict, refreshing: List[str], timed_out: List[str]) -> Dict:
+        """The get() result from a snapshot"""
+        return {
+            'wave_data': group_by_region(entries),
+            'data_age_seconds': max((entry['data_age_seconds'] for entry in entries.values()), default=None),
+            'refreshing': refreshing,
+            'timed_out': timed_out
+        }
+
+    def get(self) -> Dict:
+        """
+        Get every station's latest reading
+
+        Returns:
+            Dictionary with per-region 'wave_data' (each station entry carries
+            'data_age_seconds' and 'stale'), the overall 'data_age_seconds',
+            'refreshing' station ids and 'timed_out' ids from a cold fetch
+        """
+        all_ids = self._all_ids()
+        timed_out = []
+
+        if self._missing(all_ids):
+            with self._fetch_lock:
+                # Another request may have fetched while this one waited
+                missing = self._missing(all_ids)
+                if missing:
+                    self._cold_fetches += 1
+                    timed_out = self._fetch(missing)['timed_out']
+
+        entries, stale, refreshing = self._snapshot(all_ids)
+        if stale:
+            threading.Thread(
+                target=self._refresh, args=(stale,), name='wave-refresh', daemon=True
+            ).start()
+
+        return self._response(entries, refreshing, timed_out)
+
+    async def get_async(self, http_client: Optional[AsyncHTTPClient] = None) -> Dict:
+        """
+        get() for requests served on an event loop
+
+        Cold fetches and background refreshes run as asyncio tasks on the
+        running loop instead of blocking a thread.
+
+        Args:
+            http_client: Async HTTP client (default: the shared async client)
+
+        Returns:
+            Same dictionary as get()
+        """
+        all_ids = self._all_ids()
+        timed_out = []
+
+        if self._missing(all_ids):
+            if self._async_fetch_lock is None:
+                self._async_fetch_lock = asyncio.Lock()
+            async with self._async_fetch_lock:
+                missing = self._missing(all_ids)
+                if missing:
+                    self._cold_fetches += 1
+                    timed_out = (await self._fetch_async(missing, http_client))['timed_out']
+
+        entries, stale, refreshing = self._snapshot(all_ids)
+        if stale:
+            # Keep a reference so the task is not collected mid-refresh
+            task = asyncio.ensure_future(self._refresh_async(stale, http_client))
+            self._async_refreshes.add(task)
+            task.add_done_callback(self._async_refreshes.discard)
+
+        return self._response(entries, refreshing, timed_out)
+
+    def get_stats(self) -> Dict:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with hit/refresh counters and the oldest entry's age
+        """
+        now = time.monotonic()
+        with self._lock:
+            ages = [now - cached[0] for cached in self._entries.values()]
+            return {
+                'stations': len(self._entries),
+                'ttl_seconds': self.ttl,
+                'max_stale_seconds': self.max_stale,
+                'fresh_hits': self._fresh_hits,
+                'stale_hits': self._stale_hits,
+                'cold_fetches': self._cold_fetches,
+                'refreshes': self._refreshes,
+                'refresh_errors': self._refresh_errors,
+                'refreshing': len(self._refreshing),
+                'last_refresh_ms': self._last_refresh_ms,
+                'oldest_age_seconds': round(max(ages), 1) if ages else None
+            }
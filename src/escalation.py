@@ -0,0 +1,170 @@
+"""
+Escalation Scheduler
+Shorter per-source polling intervals after significant earthquakes
+"""
+
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+
+
+ARRIVAL_TIME_FORMAT = '%Y-%m-%d %H:%M UTC'
+
+
+class EscalationScheduler:
+    """
+    Per-source polling cadence that tightens after a trigger and decays back
+
+    Every source has a baseline and an escalated interval. A trigger (a
+    significant earthquake) opens an escalation window that lasts until its
+    last predicted tsunami arrival plus a margin. While any window is open
+    every source runs at its escalated interval; once the last window has
+    closed the intervals ease linearly back to baseline over the decay
+    period.
+
+    The scheduler only decides cadences; the sources run on the slots of
+    whatever polls them (the USGS poller and the SourceScheduler).
+    """
+
+    def __init__(self,
+                 baseline_seconds: Dict[str, float],
+                 escalated_seconds: Dict[str, float],
+                 arrival_margin_hours: float = 1.0,
+                 default_window_hours: float = 3.0,
+                 decay_minutes: float = 60.0,
+                 enabled: bool = True):
+        """
+        Initialize escalation scheduler
+
+        Args:
+            baseline_seconds: {source: interval in seconds when nothing is happening}
+            escalated_seconds: {source: interval in seconds inside an escalation window}
+            arrival_margin_hours: How long after the last predicted arrival a window stays open
+            default_window_hours: Window length when no arrival time is predicted
+            decay_minutes: How long the intervals take to return to baseline
+            enabled: Escalate on triggers (otherwise every source stays at baseline)
+        """
+        self.baseline = {source: float(seconds) for source, seconds in baseline_seconds.items()}
+        self.escalated = {source: min(float(escalated_seconds.get(source, seconds)), float(seconds))
+                          for source, seconds in baseline_seconds.items()}
+        self.arrival_margin = timedelta(hours=arrival_margin_hours)
+        self.default_window = timedelta(hours=default_window_hours)
+        self.decay = timedelta(minutes=decay_minutes)
+        self.enabled = enabled
+
+        self._windows: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._triggers = 0
+
+    def set_baseline(self, source: str, seconds: float):
+        """Change a source's baseline interval (the escalated one never exceeds it)"""
+        with self._lock:
+            self.baseline[source] = float(seconds)
+            self.escalated[source] = min(self.escalated.get(source, seconds), float(seconds))
+
+    def trigger(self, event_id: str, event_time: Optional[datetime] = None,
+                arrival_times: Optional[Iterable[datetime]] = None) -> bool:
+        """
+        Open (or extend) the escalation window of an event
+
+        Args:
+            event_id: Triggering event (a revised event re-triggers its own window)
+            event_time: Origin time (default: now)
+            arrival_times: Predicted tsunami arrival times (UTC)
+
+        Returns:
+            True if a window was opened or extended (cadences may have shortened)
+        """
+        if not self.enabled:
+            return False
+
+        now = datetime.utcnow()
+        arrivals = list(arrival_times or [])
+        if arrivals:
+            end = max(arrivals) + self.arrival_margin
+        else:
+            end = (event_time or now) + self.default_window
+        if end <= now:
+            return False
+
+        with self._lock:
+            previous = self._windows.get(event_id)
+            if previous is not None and end <= previous['end']:
+                return False
+            self._windows[event_id] = {'start': previous['start'] if previous else now, 'end': end}
+            self._triggers += 1
+
+        if previous is None:
+            logger.warning(f"Monitoring escalated for {event_id} until {end.strftime(ARRIVAL_TIME_FORMAT)}")
+        return True
+
+    def _level(self, now: datetime) -> float:
+        """0 at baseline, 1 while escalated, in between while decaying"""
+        if not self._windows:
+            return 0.0
+        if any(window['start'] <= now < window['end'] for window in self._windows.values()):
+            return 1.0
+        closed = max(window['end'] for window in self._windows.values())
+        if self.decay.total_seconds() <= 0 or now >= closed + self.decay:
+            return 0.0
+        return 1.0 - (now - closed) / self.decay
+
+    def _expire(self, now: datetime):
+        """Forget windows that have fully decayed"""
+        expired = [event_id for event_id, window in self._windows.items()
+                   if now >= window['end'] + self.decay]
+        for event_id in expired:
+            del self._windows[event_id]
+        if expired and not self._windows:
+            logger.info("Monitoring back at baseline cadence")
+
+    def interval(self, source: str) -> float:
+        """Current interval of a source in seconds"""
+        with self._lock:
+            now = datetime.utcnow()
+            self._expire(now)
+            level = self._level(now)
+            baseline = self.baseline[source]
+            return baseline - level * (baseline - self.escalated[source])
+
+    def get_stats(self) -> Dict:
+        """
+        Get escalation state
+
+        Returns:
+            Dictionary with the state (baseline / escalated / decaying),
+            open windows and the current, baseline and escalated cadence
+            per source
+        """
+        cadence = {source: round(self.interval(source), 1) for source in self.baseline}
+        with self._lock:
+            now = datetime.utcnow()
+            level = self._level(now)
+            windows = {event_id: {'start': window['start'].isoformat(), 'end': window['end'].isoformat()}
+                       for event_id, window in self._windows.items()}
+            until = max((window['end'] for window in self._windows.values()), default=None)
+
+        return {
+            'enabled': self.enabled,
+            'state': 'escalated' if level >= 1.0 else ('decaying' if level > 0.0 else 'baseline'),
+            'level': round(level, 3),
+            'escalated_until': until.isoformat() if until is not None else None,
+            'windows': windows,
+            'cadence_seconds': cadence,
+            'baseline_seconds': dict(self.baseline),
+            'escalated_seconds': dict(self.escalated),
+            'triggers': self._triggers
+        }
+
+
+def parse_arrival_times(estimated_arrival_times: Dict[str, str]) -> List[datetime]:
+    """Arrival datetimes from RiskAssessor's {region: '%Y-%m-%d %H:%M UTC'} estimates"""
+    arrivals = []
+    for value in (estimated_arrival_times or {}).values():
+        try:
+            arrivals.append(datetime.strptime(value, ARRIVAL_TIME_FORMAT))
+        except (TypeError, ValueError):
+            continue
+    return arrivals
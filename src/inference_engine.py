@@ -4,10 +4,14 @@ Continuously monitors and predicts tsunami risk
 """
 
 import time
+import hashlib
 import threading
+from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from loguru import logger
+import numpy as np
+import pandas as pd
 import yaml
 
 from .data_collection import (
@@ -15,10 +19,31 @@ from .data_collection import (
     NOAATidesCollector,
     NOAABuoysCollector,
     INCOISCollector,
-    BathymetryLoader
+    get_shared_client,
+    get_shared_poller,
+    analyze_ocean_conditions,
+    ParallelAcquisition,
+    LatestValueStore,
+    SourceScheduler
 )
-from .models import TsunamiPredictionBinaryModel as TsunamiPredictionModel, DataPreprocessor
+from .models import TsunamiPredictionBinaryModel as TsunamiPredictionModel
 from .filtering import IndiaImpactFilter, RiskAssessor
+from .serving import ModelRegistry
+from .serving.seismic_patterns import catalog_complete_mask, patterns_from_catalog
+from .escalation import EscalationScheduler, parse_arrival_times
+
+
+# Per-source acquisition deadlines in seconds (system.acquisition.source_timeouts)
+DEFAULT_SOURCE_TIMEOUTS = {'usgs': 15.0, 'noaa_tides': 10.0, 'noaa_buoys': 10.0, 'incois': 10.0}
+
+# Sources whose new data triggers a full re-assessment (USGS is followed by every poll)
+OCEAN_SOURCES = ('noaa_tides', 'noaa_buoys', 'incois')
+
+# Every source an assessment reads from the latest-value store
+ASSESSMENT_SOURCES = ('usgs',) + OCEAN_SOURCES
+
+# Alert levels from most to least severe, for ranking per-event assessments
+ALERT_LEVEL_RANK = {'WARNING': 0, 'ADVISORY': 1, 'WATCH': 2, 'INFORMATION': 3, 'NONE': 4}
 
 
 class RealTimeInferenceEngine:
@@ -40,26 +65,38 @@ class RealTimeInferenceEngine:
         with open(config_path, 'r') as f:
             self.config = yaml.safe_load(f)
         
-        # Initialize components
-        self.usgs_collector = USGSEarthquakeCollector(self.config)
-        self.noaa_tides_collector = NOAATidesCollector(self.config)
-        self.noaa_buoys_collector = NOAABuoysCollector(self.config)
-        self.incois_collector = INCOISCollector(self.config)
-        self.bathymetry_loader = BathymetryLoader(self.config)
-        
-        # Load bathymetry data
-        logger.info("Loading bathymetry data...")
-        self.bathymetry_loader.load_gebco_data()
+        # Initialize components (one pooled HTTP client for every source)
+        self.http_client = get_shared_client(self.config)
+        self.usgs_collector = USGSEarthquakeCollector(self.config, self.http_client)
+        # Shared background USGS snapshot (also serves the API endpoints)
+        self.usgs_poller = get_shared_poller(self.config, self.http_client)
+        self.noaa_tides_collector = NOAATidesCollector(self.config, self.http_client)
+        self.noaa_buoys_collector = NOAABuoysCollector(self.config, self.http_client)
+        self.incois_collector = INCOISCollector(self.config, self.http_client)
         
         # Initialize model
         self.model = TsunamiPredictionModel(self.config)
-        self.preprocessor = DataPreprocessor(self.config)
+        
+        # Versioned models (models/registry/<version>/), falling back to model_path
+        registry_config = self.config.get('serving', {}).get('model_registry', {})
+        self.model_registry = ModelRegistry(
+            root=registry_config.get('path') or 'models/registry',
+            artifact=Path(model_path).name,
+            load_fn=self._load_model_version,
+            on_swap=self._on_model_swap,
+            fallback_dir=Path(model_path).parent,
+            poll_interval_seconds=registry_config.get('poll_interval_seconds', 10),
+            settle_seconds=registry_config.get('settle_seconds', 5),
+            name='inference-engine'
+        )
+        self.watch_model_registry = registry_config.get('watch', True)
+        # Seed each event's pattern noise from its id, as /live-data does
+        self.seeded_patterns = bool(self.config.get('serving', {}).get('seeded_patterns', True))
         
         # Load trained model
         try:
-            self.model.load_model(model_path)
-            self.preprocessor.load_scalers('models/scalers')
-            logger.success("Model and scalers loaded successfully")
+            self.model_registry.publish(self.model_registry.load(), warmup=False)
+            logger.success("Model loaded successfully")
         except Exception as e:
             logger.warning(f"Could not load model: {e}. Will need to train first.")
         
@@ -72,43 +109,137 @@ class RealTimeInferenceEngine:
         self.monitoring_thread = None
         self.current_assessment = None
         self.last_check_time = None
-        self.check_interval = 300  # 5 minutes
+        self.check_interval = 300  # at most 5 minutes between full re-assessments
+        self._stop_event = threading.Event()
+        
+        # Incremental monitoring: the earthquake feed is polled often, the
+        # expensive stages only run for new or revised events
+        monitoring_config = self.config['system'].get('monitoring', {})
+        self.poll_interval = float(monitoring_config.get('poll_interval_seconds', 15))
+        self.assessed_events: Dict[str, object] = {}  # event id -> USGS revision ('updated') assessed
+        self._event_assessments: Dict[str, Dict] = {}
+        self._events_lock = threading.Lock()
+        
+        # Escalation: shorter per-source intervals through a significant event's arrival window
+        # (baseline: the USGS poller interval and each ocean source's refresh cadence)
+        escalation_config = monitoring_config.get('escalation', {})
+        self.escalation = EscalationScheduler(
+            baseline_seconds={
+                'usgs': self.usgs_poller.interval,
+                'noaa_tides': self.noaa_tides_collector.refresh_policy.cadence_seconds,
+                'noaa_buoys': self.noaa_buoys_collector.refresh_policy.cadence_seconds,
+                'incois': self.incois_collector.refresh_policy.cadence_seconds
+            },
+            escalated_seconds=escalation_config.get('intervals_seconds') or {},
+            arrival_margin_hours=escalation_config.get('arrival_margin_hours', 1),
+            default_window_hours=escalation_config.get('default_window_hours', 3),
+            decay_minutes=escalation_config.get('decay_minutes', 60),
+            enabled=escalation_config.get('enabled', True)
+        )
+        
+        # Acquisition deadlines (every source is fetched concurrently)
+        acquisition_config = self.config['system'].get('acquisition', {})
+        self.acquisition_timeout = float(acquisition_config.get('total_timeout_seconds', 20))
+        self.source_timeouts = dict(DEFAULT_SOURCE_TIMEOUTS, **(acquisition_config.get('source_timeouts') or {}))
+        
+        # Every source refreshes on its own cadence into the latest-value store;
+        # checks read the store instead of calling the collectors
+        self.store = LatestValueStore()
+        self.source_scheduler = SourceScheduler(self.store, cadence_fn=self._source_cadence,
+                                                name='inference-engine')
+        self.source_scheduler.register(
+            'usgs', lambda: self.get_recent_earthquakes(hours=2),
+            self.usgs_collector.refresh_policy, self.source_timeouts['usgs'])
+        self.source_scheduler.register(
+            'noaa_tides', lambda: self._fetch_stations('noaa_tides', self.noaa_tides_collector.fetch_water_levels,
+                                                       self.noaa_tides_collector.indian_stations, 6),
+            self.noaa_tides_collector.refresh_policy, self.source_timeouts['noaa_tides'])
+        self.source_scheduler.register(
+            'noaa_buoys', lambda: self._fetch_stations('noaa_buoys', self.noaa_buoys_collector.fetch_buoy_data,
+                                                       self.noaa_buoys_collector.stations),
+            self.noaa_buoys_collector.refresh_policy, self.source_timeouts['noaa_buoys'])
+        self.source_scheduler.register(
+            'incois', lambda: self.incois_collector.fetch_current_advisories(timeout=self.source_timeouts['incois']),
+            self.incois_collector.refresh_policy, self.source_timeouts['incois'])
     
-    def start_monitoring(self, interval_seconds: int = 300):
+    def start_monitoring(self, interval_seconds: int = 300, poll_interval_seconds: Optional[float] = None):
         """
         Start real-time monitoring
         
         Args:
-            interval_seconds: Check interval in seconds
+            interval_seconds: Longest interval between full re-assessments of
+                every active event (they also run whenever new ocean or INCOIS
+                data arrives in the store)
+            poll_interval_seconds: Earthquake feed poll interval (default from
+                system.monitoring.poll_interval_seconds)
         """
         if self.is_running:
             logger.warning("Monitoring already running")
             return
         
         self.check_interval = interval_seconds
+        if poll_interval_seconds is not None:
+            self.poll_interval = float(poll_interval_seconds)
         self.is_running = True
+        self._stop_event.clear()
         
+        self.source_scheduler.start()
         self.monitoring_thread = threading.Thread(target=self._monitoring_loop)
         self.monitoring_thread.daemon = True
         self.monitoring_thread.start()
         
-        logger.success(f"Real-time monitoring started (interval: {interval_seconds}s)")
+        if self.watch_model_registry:
+            self.model_registry.start()
+        
+        logger.success(f"Real-time monitoring started (poll: {self.poll_interval:g}s, "
+                       f"full re-assessment: {interval_seconds}s)")
     
     def stop_monitoring(self):
         """Stop real-time monitoring"""
         self.is_running = False
+        self._stop_event.set()
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=10)
+        self.source_scheduler.stop()
+        self.usgs_poller.set_interval(self.escalation.baseline['usgs'])
+        self.model_registry.stop()
         logger.info("Monitoring stopped")
     
+    def _load_model_version(self, version_dir: Path) -> TsunamiPredictionModel:
+        """Load one registry version into a new model instance"""
+        model = TsunamiPredictionModel(self.config)
+        model.load_model(str(Path(version_dir) / self.model_registry.artifact))
+        return model
+    
+    def _on_model_swap(self, served, previous):
+        """Point self.model at the newly served version"""
+        self.model = served.model
+    
     def _monitoring_loop(self):
-        """Main monitoring loop"""
+        """
+        Main monitoring loop
+        
+        Polls run on a fixed schedule (poll n starts at start + n * interval,
+        whatever each poll took); polls missed while a slow check ran are
+        skipped rather than run back to back. A poll assesses new or revised
+        earthquakes; once the source scheduler has stored new ocean or INCOIS
+        data since the last full re-assessment (or ``check_interval`` has
+        passed) the poll is a full re-assessment instead. Both only read the
+        store. The USGS poller follows the escalated USGS cadence.
+        """
+        next_poll = next_full = time.monotonic()
+        assessed_versions = None
         while self.is_running:
+            self.usgs_poller.set_interval(self.escalation.interval('usgs'))
+            versions = self.store.versions(OCEAN_SOURCES)
+            full = versions != assessed_versions or time.monotonic() >= next_full
             try:
-                logger.info("Running tsunami check...")
-                assessment = self.run_tsunami_check()
+                logger.debug(f"Running {'full' if full else 'incremental'} tsunami check...")
+                assessment = self.run_tsunami_check(incremental=not full)
                 
-                if assessment and assessment['india_at_risk']:
+                if assessment is None:
+                    logger.debug("No new or revised earthquakes")
+                elif assessment['india_at_risk']:
                     logger.warning(f"⚠️ TSUNAMI RISK DETECTED: {assessment['alert_level']}")
                     self._handle_alert(assessment)
                 else:
@@ -119,113 +250,169 @@ class RealTimeInferenceEngine:
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
             
-            # Wait for next interval
-            time.sleep(self.check_interval)
+            if full:
+                assessed_versions = versions
+                next_full = self._next_slot(min(next_full, time.monotonic()), self.check_interval)
+            next_poll = self._next_slot(next_poll, self.poll_interval)
+            
+            # Wait for the next poll or full re-assessment (returns at once when stopped)
+            self._stop_event.wait(max(0.0, min(next_poll, next_full) - time.monotonic()))
+    
+    @staticmethod
+    def _next_slot(previous: float, interval: float) -> float:
+        """Next slot of a fixed schedule after ``previous``, skipping slots already past"""
+        slot = previous + interval
+        now = time.monotonic()
+        if slot <= now:
+            slot += ((now - slot) // interval + 1) * interval
+        return slot
+    
+    def _source_cadence(self, source: str) -> Optional[float]:
+        """Current refresh cadence of a source (None: its policy cadence)"""
+        if source == 'usgs':
+            # A local read of the shared poller's snapshot, once per monitoring poll
+            return self.poll_interval
+        if source in OCEAN_SOURCES:
+            return self.escalation.interval(source)
+        return None
+    
+    def _fetch_stations(self, source: str, fetch, stations: List[str], *args) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch every station of a source concurrently (a source's refresh function)
+        
+        Args:
+            source: Source name (its deadline is system.acquisition.source_timeouts)
+            fetch: Collector method taking the station id first
+            stations: Station ids
+            *args: Passed to ``fetch`` after the station id
+            
+        Returns:
+            {station_id: DataFrame} of the stations with data
+            
+        Raises:
+            TimeoutError: If no station answered by the deadline
+        """
+        acquisition = ParallelAcquisition({source: self.source_timeouts[source]}, self.source_timeouts[source])
+        for station_id in stations:
+            acquisition.submit(source, station_id, fetch, station_id, *args, timeout=acquisition.timeout(source))
+        results = acquisition.collect(source)
+        acquisition.close()
+        if stations and not results:
+            raise TimeoutError(f"No {source} station answered within {acquisition.timeout(source):g}s")
+        return {station_id: df for station_id, df in results.items() if not df.empty}
+    
+    def _source_status(self) -> Dict[str, Dict]:
+        """Status of every assessment source's latest value (status, age, version, last error)"""
+        return self.store.describe(ASSESSMENT_SOURCES)
+    
+    def get_source_data(self, names) -> Dict:
+        """
+        Latest value of each source from the store
+        
+        Values that are missing or expired (or, while monitoring is stopped,
+        older than their cadence) are refreshed first.
+        
+        Args:
+            names: Source names (usgs, noaa_tides, noaa_buoys, incois)
+            
+        Returns:
+            {source: value, or None if it could not be refreshed in time}
+        """
+        values = self.source_scheduler.ensure_fresh(names, timeout=self.acquisition_timeout)
+        return {name: entry.value if entry is not None else None for name, entry in values.items()}
     
-    def run_tsunami_check(self) -> Optional[Dict]:
+    def run_tsunami_check(self, incremental: bool = False) -> Optional[Dict]:
         """
         Run complete tsunami check cycle
         
+        Args:
+            incremental: Only run the ocean, model and assessment
+                stages for significant earthquakes that are new or revised
+                (USGS 'updated') since they were last assessed
+        
         Returns:
-            Risk assessment dictionary or None
+            Risk assessment dictionary, or None on error or when an
+            incremental check found nothing new
         """
         try:
-            # Step 1: Fetch recent earthquakes
-            logger.info("Fetching earthquake data...")
-            earthquakes = self.usgs_collector.fetch_recent_earthquakes(hours=2)
-            
-            if earthquakes.empty:
-                logger.info("No recent earthquakes detected")
-                return self._create_no_threat_assessment()
+            # Step 1: Read recent earthquakes from the store (a full check also brings
+            # the other sources up to date at the same time, an incremental one only
+            # once there is something to assess)
+            logger.info("Reading earthquake data...")
+            start = time.monotonic()
+            if not incremental:
+                self.source_scheduler.prefetch(ASSESSMENT_SOURCES)
+            usgs = self.source_scheduler.ensure_fresh(['usgs'], timeout=self.acquisition_timeout)['usgs']
+            if usgs is None:
+                raise TimeoutError(f"USGS earthquakes did not arrive within {self.source_timeouts['usgs']:g}s")
+            earthquakes = usgs.value
             
             # Step 2: Check for significant earthquakes
-            significant = earthquakes[earthquakes['magnitude'] >= 6.5]
+            significant = earthquakes[earthquakes['magnitude'] >= 6.5] if not earthquakes.empty else earthquakes
+            significant = self._complete_events(significant)
+            expired = self._forget_events(significant)
             
             if significant.empty:
-                logger.info("No significant earthquakes (M≥6.5)")
-                return self._create_no_threat_assessment()
+                if incremental and not expired and self.current_assessment is not None:
+                    return None
+                logger.info("No recent earthquakes detected" if earthquakes.empty
+                            else "No significant earthquakes (M≥6.5)")
+                self.current_assessment = self._create_no_threat_assessment(self._source_status())
+                return self.current_assessment
             
-            logger.info(f"Found {len(significant)} significant earthquake(s)")
+            # Step 3: Assess every new or revised significant earthquake (all of them on a full check)
+            pending = self._pending_events(significant) if incremental else significant
+            if pending.empty:
+                # Nothing to assess; re-rank only if an event has left the window
+                return self._combined_assessment(significant, self._source_status()) if expired else None
             
-            # Step 3: Analyze most recent/significant earthquake
-            latest_eq = significant.iloc[0]
+            logger.info(f"Found {len(significant)} significant earthquake(s), assessing {len(pending)}")
             
-            earthquake_data = {
-                'id': latest_eq['id'],
-                'magnitude': latest_eq['magnitude'],
-                'depth': latest_eq['depth'],
-                'latitude': latest_eq['latitude'],
-                'longitude': latest_eq['longitude'],
-                'time': latest_eq['time'].isoformat() if hasattr(latest_eq['time'], 'isoformat') else str(latest_eq['time']),
-                'place': latest_eq['place']
-            }
+            events = [self._earthquake_data(row) for _, row in pending.iterrows()]
+            for earthquake_data in events:
+                logger.info(f"Analyzing earthquake: M{earthquake_data['magnitude']} at {earthquake_data['place']}")
             
-            logger.info(f"Analyzing earthquake: M{earthquake_data['magnitude']} at {earthquake_data['place']}")
-            
-            # Step 4: Fetch ocean conditions
-            logger.info("Fetching ocean conditions...")
-            tide_data = self.noaa_tides_collector.fetch_all_stations(hours=6)
-            buoy_data = self.noaa_buoys_collector.fetch_all_buoys()
+            # Steps 4-5: Read ocean conditions and INCOIS advisories (refreshed first
+            # only if missing or expired, bounded by their deadlines)
+            logger.info("Reading ocean conditions and INCOIS advisories...")
+            values = self.source_scheduler.ensure_fresh(
+                OCEAN_SOURCES,
+                timeout=max(0.0, self.acquisition_timeout - (time.monotonic() - start))
+            )
+            tide_data = values['noaa_tides'].value if values['noaa_tides'] is not None else {}
+            buoy_data = values['noaa_buoys'].value if values['noaa_buoys'] is not None else {}
+            incois_advisories = values['incois'].value if values['incois'] is not None else []
             
             # Analyze ocean conditions
             ocean_conditions = self._analyze_ocean_conditions(tide_data, buoy_data)
             
-            # Step 5: Fetch INCOIS advisories
-            logger.info("Checking INCOIS advisories...")
-            incois_advisories = self.incois_collector.fetch_current_advisories()
+            source_status = self._source_status()
+            logger.info(f"Sources read in {(time.monotonic() - start) * 1000:.0f} ms: "
+                        + ', '.join(f"{source} {entry['status']}" for source, entry in source_status.items()))
             
-            # Step 6: Prepare model inputs
-            logger.info("Preprocessing data for model...")
-            eq_input = self.preprocessor.preprocess_earthquake_data(
-                earthquakes[earthquakes['magnitude'] >= 6.0]
-            )
-            ocean_input = self.preprocessor.preprocess_ocean_data(
-                tide_data, buoy_data
-            )
-            spatial_input = self.preprocessor.preprocess_spatial_data(
-                self.bathymetry_loader.bathymetry_data,
-                (earthquake_data['latitude'], earthquake_data['longitude'])
-            )
+            # Steps 6-7: One seismic pattern per event, then one batched model call
+            logger.info(f"Running model prediction for {len(events)} event(s)...")
+            probabilities, model_version = self._score_events(pending)
             
-            # Reshape for single prediction
-            eq_input = eq_input.reshape(1, *eq_input.shape[1:])
-            ocean_input = ocean_input.reshape(1, *ocean_input.shape[1:])
-            spatial_input = spatial_input.reshape(1, *spatial_input.shape)
+            # Steps 8-9: India filter and risk assessment per event; an event that
+            # fails is logged and retried on the next poll, the others are published
+            assessed, assessments = [], []
+            for position, (earthquake_data, probability) in enumerate(zip(events, probabilities)):
+                model_prediction = self._model_prediction(probability, model_version)
+                logger.info(f"Model prediction for {earthquake_data['id']}: "
+                           f"Risk={model_prediction['risk_probability']:.3f}, "
+                           f"Confidence={model_prediction['confidence']:.3f}")
+                try:
+                    assessments.append(self._assess_event(
+                        earthquake_data, model_prediction, ocean_conditions, incois_advisories
+                    ))
+                except Exception as e:
+                    logger.error(f"Could not assess earthquake {earthquake_data['id']}: {e}")
+                    continue
+                assessed.append(position)
             
-            # Step 7: Run model prediction
-            logger.info("Running model prediction...")
-            risk_prob, confidence, risk_class = self.model.predict(
-                eq_input, ocean_input, spatial_input
-            )
-            
-            model_prediction = {
-                'risk_probability': float(risk_prob[0][0]),
-                'confidence': float(confidence[0][0]),
-                'risk_class': risk_class[0].tolist()
-            }
-            
-            logger.info(f"Model prediction: Risk={model_prediction['risk_probability']:.3f}, "
-                       f"Confidence={model_prediction['confidence']:.3f}")
-            
-            # Step 8: Apply India-specific filter
-            logger.info("Applying India impact filter...")
-            india_filter_result = self.india_filter.assess_india_risk(
-                earthquake_data, model_prediction
-            )
-            
-            # Step 9: Generate comprehensive assessment
-            logger.info("Generating risk assessment...")
-            assessment = self.risk_assessor.generate_comprehensive_assessment(
-                earthquake_data,
-                model_prediction,
-                india_filter_result,
-                ocean_conditions,
-                incois_advisories
-            )
-            
-            self.current_assessment = assessment
-            
-            return assessment
+            self._record_events(pending.iloc[assessed], assessments)
+            return self._combined_assessment(significant, source_status)
             
         except Exception as e:
             logger.error(f"Error during tsunami check: {e}")
@@ -233,33 +420,258 @@ class RealTimeInferenceEngine:
             traceback.print_exc()
             return None
     
-    def _analyze_ocean_conditions(self, tide_data: Dict, buoy_data: Dict) -> Dict:
-        """Analyze ocean conditions for anomalies"""
-        conditions = {
-            'sea_level_anomaly': 'normal',
-            'wave_height_anomaly': 'normal',
-            'tsunami_indicators': []
+    @staticmethod
+    def _complete_events(events: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop earthquakes missing their magnitude, depth or coordinates
+        
+        Their seismic patterns would be all NaN, so they are logged and left
+        out of the check until USGS publishes the missing values.
+        """
+        if events.empty:
+            return events
+        complete = catalog_complete_mask(events)
+        if complete.all():
+            return events
+        
+        logger.warning(f"Skipping {int((~complete).sum())} earthquake(s) missing magnitude, depth or "
+                       f"coordinates: {', '.join(map(str, events['id'][~complete]))}")
+        return events[complete]
+    
+    def _score_events(self, events: pd.DataFrame):
+        """
+        Score a batch of earthquakes in one model call
+        
+        Every event gets its own (24, 32) seismic pattern built from its
+        magnitude, depth and epicenter (the input /live-data scores), so
+        each row of the batch is anchored on that event.
+        
+        Args:
+            events: Earthquake catalog rows
+            
+        Returns:
+            Tuple of (tsunami probability per event, model version or None)
+        """
+        patterns = patterns_from_catalog(events, seeded=self.seeded_patterns)
+        
+        # One version for the whole batch, even if a new one is swapped in meanwhile
+        served = self.model_registry.active
+        if served is not None:
+            return np.asarray(served.run(patterns)).reshape(-1), served.version
+        return np.asarray(self.model.predict(patterns)).reshape(-1), None
+    
+    @staticmethod
+    def _model_prediction(probability: float, model_version: Optional[str]) -> Dict:
+        """
+        Model prediction fields read by the India filter and risk assessor
+        
+        The binary model only outputs the tsunami probability; confidence is
+        the probability of the predicted class and risk_class the
+        [no tsunami, tsunami] probabilities.
+        """
+        probability = float(probability)
+        return {
+            'risk_probability': probability,
+            'confidence': max(probability, 1.0 - probability),
+            'risk_class': [1.0 - probability, probability],
+            'model_version': model_version
         }
+    
+    def _assess_event(self, earthquake_data: Dict, model_prediction: Dict,
+                      ocean_conditions: Dict, incois_advisories: List) -> Dict:
+        """India filter and comprehensive risk assessment of one earthquake"""
+        india_filter_result = self.india_filter.assess_india_risk(
+            earthquake_data, model_prediction
+        )
+        assessment = self.risk_assessor.generate_comprehensive_assessment(
+            earthquake_data,
+            model_prediction,
+            india_filter_result,
+            ocean_conditions,
+            incois_advisories
+        )
+        assessment['earthquake_id'] = earthquake_data['id']
+        assessment['model_prediction'] = model_prediction
+        return assessment
+    
+    def get_recent_earthquakes(self, hours: int = 24, min_magnitude: Optional[float] = None) -> pd.DataFrame:
+        """
+        Recent earthquakes in the configured region
         
-        # Analyze tide data
-        for station_id, df in tide_data.items():
-            if not df.empty:
-                anomaly_score = self.noaa_tides_collector.calculate_sea_level_anomaly(df)
-                if anomaly_score > 2.0:
-                    conditions['sea_level_anomaly'] = 'elevated'
-                    conditions['tsunami_indicators'].append('sea_level_anomaly')
-        
-        # Analyze buoy data
-        for station_id, df in buoy_data.items():
-            if not df.empty:
-                signature = self.noaa_buoys_collector.detect_tsunami_signature(df)
-                if signature['detected']:
-                    conditions['wave_height_anomaly'] = 'anomalous'
-                    conditions['tsunami_indicators'].extend(signature['indicators'])
-        
-        return conditions
+        Served from the shared USGS snapshot with the region, magnitude and
+        time filters applied locally; falls back to a direct USGS request
+        when the snapshot does not cover the request.
+        
+        Args:
+            hours: Lookback period in hours
+            min_magnitude: Minimum magnitude (default from config)
+            
+        Returns:
+            DataFrame with earthquake data
+        """
+        min_magnitude = self.usgs_collector.min_magnitude if min_magnitude is None else min_magnitude
+        
+        try:
+            snapshot = self.usgs_poller.get_snapshot()
+        except RuntimeError as e:
+            logger.warning(f"{e}; querying USGS directly")
+            snapshot = None
+        
+        if snapshot is None or not snapshot.covers(hours=hours, min_magnitude=min_magnitude):
+            earthquakes = self.usgs_collector.fetch_recent_earthquakes(hours=hours)
+            if earthquakes.empty:
+                return earthquakes
+            return earthquakes[earthquakes['magnitude'] >= min_magnitude]
+        
+        return snapshot.to_dataframe(
+            region=self.usgs_collector.region,
+            min_magnitude=min_magnitude,
+            hours=hours
+        )
+    
+    @staticmethod
+    def _revision(row: pd.Series):
+        """USGS revision of an event (its 'updated' time, else its origin time)"""
+        return row['updated'] if 'updated' in row.index else row['time']
+    
+    def _pending_events(self, significant: pd.DataFrame) -> pd.DataFrame:
+        """Events not assessed yet, or revised since they were"""
+        with self._events_lock:
+            pending = [self.assessed_events.get(row['id']) != self._revision(row)
+                       for _, row in significant.iterrows()]
+        return significant[pending]
+    
+    def _record_events(self, assessed: pd.DataFrame, assessments: List[Dict]):
+        """Remember the revision and assessment of every assessed event"""
+        with self._events_lock:
+            for (_, row), assessment in zip(assessed.iterrows(), assessments):
+                self.assessed_events[row['id']] = self._revision(row)
+                self._event_assessments[row['id']] = assessment
+        
+        # Every significant event escalates polling through its predicted arrival window
+        escalated = False
+        for (_, row), assessment in zip(assessed.iterrows(), assessments):
+            event_time = pd.Timestamp(row['time'])
+            if event_time.tzinfo is not None:
+                event_time = event_time.tz_convert(None)
+            escalated |= self.escalation.trigger(row['id'], event_time.to_pydatetime(),
+                                                 parse_arrival_times(assessment.get('estimated_arrival_times')))
+        if escalated:
+            # Sources overdue at the escalated cadence refresh at once
+            self.source_scheduler.reschedule()
+    
+    def _forget_events(self, significant: pd.DataFrame) -> bool:
+        """
+        Drop events that are no longer significant or have left the lookback window
+        
+        Returns:
+            True if any event was dropped
+        """
+        current = set(significant['id']) if not significant.empty else set()
+        with self._events_lock:
+            expired = [event_id for event_id in self.assessed_events if event_id not in current]
+            for event_id in expired:
+                self.assessed_events.pop(event_id, None)
+                self._event_assessments.pop(event_id, None)
+        return bool(expired)
+    
+    def _combined_assessment(self, significant: pd.DataFrame, source_status: Dict) -> Dict:
+        """
+        Rank the latest assessment of every current significant event and publish it
+        
+        Raises:
+            RuntimeError: If none of the significant events has an assessment
+        """
+        with self._events_lock:
+            assessments = [self._event_assessments[event_id] for event_id in significant['id']
+                           if event_id in self._event_assessments]
+        if not assessments:
+            raise RuntimeError("No significant earthquake could be assessed")
+        
+        assessment = self._rank_assessments(assessments)
+        assessment['model_version'] = assessment['model_prediction']['model_version']
+        assessment['source_status'] = source_status
+        self._version_assessment(assessment)
+        
+        self.current_assessment = assessment
+        return assessment
+    
+    @staticmethod
+    def _earthquake_data(row: pd.Series) -> Dict:
+        """Earthquake fields used by the filter and assessor, from one catalog row"""
+        return {
+            'id': row['id'],
+            'magnitude': row['magnitude'],
+            'depth': row['depth'],
+            'latitude': row['latitude'],
+            'longitude': row['longitude'],
+            'time': row['time'].isoformat() if hasattr(row['time'], 'isoformat') else str(row['time']),
+            'place': row['place']
+        }
+    
+    @staticmethod
+    def _rank_assessments(assessments: List[Dict]) -> Dict:
+        """
+        Combine per-event assessments, most dangerous first
+        
+        Events are ranked by alert level, then India risk score, then
+        magnitude. The top event's assessment is the cycle's assessment (so
+        alert_level, india_at_risk etc. reflect the worst event), with every
+        ranked event under 'events'. The caller gives the combined
+        assessment its own assessment_id and timestamp.
+        
+        Args:
+            assessments: One assessment per significant earthquake
+            
+        Returns:
+            Multi-event assessment
+        """
+        ranked = sorted(assessments, key=lambda a: (
+            ALERT_LEVEL_RANK.get(a['alert_level'], len(ALERT_LEVEL_RANK)),
+            -a['india_risk_score'],
+            -a['earthquake_info']['magnitude']
+        ))
+        for rank, event in enumerate(ranked, 1):
+            event['rank'] = rank
+        
+        assessment = dict(ranked[0])
+        assessment['event_count'] = len(ranked)
+        assessment['events'] = ranked
+        return assessment
+    
+    def _version_assessment(self, assessment: Dict):
+        """
+        Give a combined assessment its own assessment_id and timestamp
+        
+        The id is a hash of the ranked events' assessments and the source
+        versions, so it changes whenever an event is added, re-assessed or
+        dropped, or a source is refreshed. The timestamp is when that id
+        was first published.
+        """
+        assessment['assessment_id'] = self._combined_assessment_id(
+            assessment['events'], assessment['source_status'])
+        previous = self.current_assessment
+        if previous is not None and previous.get('assessment_id') == assessment['assessment_id']:
+            assessment['timestamp'] = previous['timestamp']
+        else:
+            assessment['timestamp'] = datetime.utcnow().isoformat()
+    
+    @staticmethod
+    def _combined_assessment_id(events: List[Dict], source_status: Dict) -> str:
+        """Id of a combined assessment: its ranked event assessments and source versions"""
+        parts = (
+            [(event['earthquake_id'], event['assessment_id'], event['timestamp']) for event in events],
+            sorted((source, entry.get('version')) for source, entry in source_status.items())
+        )
+        digest = hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=8).hexdigest()
+        return f"TSUNAMI_{digest}"
+    
+    def _analyze_ocean_conditions(self, tide_data: Dict, buoy_data: Dict) -> Dict:
+        """Analyze ocean conditions for anomalies"""
+        return analyze_ocean_conditions(self.noaa_tides_collector, self.noaa_buoys_collector,
+                                        tide_data, buoy_data)
     
-    def _create_no_threat_assessment(self) -> Dict:
+    def _create_no_threat_assessment(self, source_status: Optional[Dict] = None) -> Dict:
         """Create assessment for no threat scenario"""
         return {
             'assessment_id': f"NO_THREAT_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
@@ -271,7 +683,8 @@ class RealTimeInferenceEngine:
             'system_status': {
                 'model_operational': True,
                 'last_update': datetime.utcnow().isoformat()
-            }
+            },
+            'source_status': source_status or {}
         }
     
     def _handle_alert(self, assessment: Dict):
@@ -292,7 +705,15 @@ class RealTimeInferenceEngine:
             'is_monitoring': self.is_running,
             'last_check': self.last_check_time.isoformat() if self.last_check_time else None,
             'check_interval_seconds': self.check_interval,
+            'poll_interval_seconds': self.poll_interval,
+            'assessed_events': len(self.assessed_events),
+            'escalation': self.escalation.get_stats(),
+            'sources': self.source_scheduler.get_stats(),
             'model_loaded': self.model.model is not None,
+            'model_version': self.model_registry.active.version if self.model_registry.active else None,
+            'model_registry': self.model_registry.get_stats(),
             'current_assessment': self.current_assessment,
+            'usgs_poller': self.usgs_poller.get_stats(),
+            'http_client': self.http_client.get_stats(),
             'system_time': datetime.utcnow().isoformat()
         }
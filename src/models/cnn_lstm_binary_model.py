@@ -7,8 +7,11 @@ import tensorflow as tf
 from tensorflow import keras
 from tensorflow.keras import layers, Model
 import keras.backend as K
+import numpy as np
 from typing import Dict, Tuple
 
+from ..serving.inference_runner import InferenceRunner, DEFAULT_BUCKETS
+
 
 def focal_loss(gamma=2.0, alpha=0.25):
     """
@@ -58,6 +61,7 @@ class TsunamiPredictionBinaryModel:
         self.config = config['model']
         self.architecture_config = self.config['architecture']
         self.model = None
+        self.runner = None
         
     def build_model(self, 
                    input_shape: Tuple) -> Model:
@@ -152,3 +156,36 @@ class TsunamiPredictionBinaryModel:
     def get_model(self) -> Model:
         """Get compiled model"""
         return self.model
+    
+    def load_model(self, filepath: str, buckets=DEFAULT_BUCKETS):
+        """
+        Load trained model for inference
+        
+        The focal loss is not deserialized (compile=False); the model is
+        wrapped in a bucketed InferenceRunner and warmed up immediately.
+        
+        Args:
+            filepath: Path to saved .keras model
+            buckets: Batch sizes to trace the inference path for
+        """
+        self.model = keras.models.load_model(filepath, compile=False)
+        self.runner = InferenceRunner(self.model, buckets=buckets)
+        print(f"Model loaded from {filepath}")
+    
+    def predict(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Predict tsunami probability
+        
+        Args:
+            samples: Input windows of shape (batch, timesteps, features)
+            
+        Returns:
+            Array of shape (batch, 1) with tsunami probabilities
+        """
+        if self.model is None:
+            raise ValueError("Model must be built or loaded before prediction")
+        
+        if self.runner is None:
+            self.runner = InferenceRunner(self.model)
+        
+        return self.runner.predict(samples)
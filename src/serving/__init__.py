@@ -0,0 +1,56 @@
+"""
+Serving Module
+Low-latency inference helpers for the binary tsunami detection API
+
+Exports are imported on first access, so importing one submodule (the
+model's inference runner, say) does not pull in the others and their
+web-only dependencies such as Flask.
+"""
+
+from importlib import import_module
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'MicroBatcher': 'micro_batcher',
+    'InferenceRunner': 'inference_runner',
+    'DEFAULT_BUCKETS': 'inference_runner',
+    'load_backend': 'backends',
+    'compare_backends': 'backends',
+    'BACKENDS': 'backends',
+    'BackgroundModelLoader': 'model_loader',
+    'ModelNotReady': 'model_loader',
+    'ModelLoadError': 'model_loader',
+    'create_seismic_patterns': 'seismic_patterns',
+    'patterns_from_catalog': 'seismic_patterns',
+    'complete_mask': 'seismic_patterns',
+    'catalog_complete_mask': 'seismic_patterns',
+    'PredictionCache': 'prediction_cache',
+    'ContentAddressedCache': 'content_cache',
+    'content_key': 'content_cache',
+    'init_http_caching': 'http_caching',
+    'make_etag': 'http_caching',
+    'etag_matches': 'http_caching',
+    'not_modified': 'http_caching',
+    'match_etag': 'http_caching',
+    'choose_encoding': 'http_caching',
+    'compress': 'http_caching',
+    'caching_options': 'http_caching',
+    'resolve_worker_settings': 'workers',
+    'FORK_SAFE_BACKENDS': 'workers',
+    'ModelRegistry': 'model_registry',
+    'ServedModel': 'model_registry'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
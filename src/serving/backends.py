@@ -0,0 +1,324 @@
+"""
+Inference Backends
+Interchangeable Keras, ONNX Runtime and TFLite runtimes for the binary model
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+from .inference_runner import DEFAULT_BUCKETS
+
+
+BACKENDS = ('keras', 'onnx', 'tflite')
+
+# Artifact suffix per backend; exports sit next to the .keras model
+BACKEND_SUFFIXES = {
+    'keras': '.keras',
+    'onnx': '.onnx',
+    'tflite': '.tflite'
+}
+
+
+def backend_model_path(model_path, backend: str, variant: Optional[str] = None) -> Path:
+    """
+    Get the artifact path for a backend
+
+    Args:
+        model_path: Path to the Keras model (or any sibling artifact)
+        backend: Backend name
+        variant: Optional artifact variant (e.g. 'int8'), appended to the stem
+
+    Returns:
+        Path with the backend's file suffix
+    """
+    if backend not in BACKEND_SUFFIXES:
+        raise ValueError(f"Unknown inference backend '{backend}'. Choose from {BACKENDS}")
+    model_path = Path(model_path)
+    stem = f"{model_path.stem}_{variant}" if variant else model_path.stem
+    return model_path.with_name(stem + BACKEND_SUFFIXES[backend])
+
+
+class KerasBackend:
+    """Keras model served through the bucketed tf.function InferenceRunner"""
+
+    name = 'keras'
+
+    def __init__(self, model_path, buckets: Sequence[int] = DEFAULT_BUCKETS,
+                 intra_op_threads: Optional[int] = None, inter_op_threads: Optional[int] = None,
+                 warmup: bool = True, **_):
+        """
+        Load Keras model
+
+        Args:
+            model_path: Path to .keras model
+            buckets: Batch sizes to trace the inference path for
+            intra_op_threads: Threads used inside an op (None = TensorFlow default)
+            inter_op_threads: Threads used across ops (None = TensorFlow default)
+            warmup: Trace every bucket now (otherwise call warmup() later)
+        """
+        import tensorflow as tf
+        from tensorflow import keras
+        from .inference_runner import InferenceRunner
+
+        # Thread pools are fixed once the TF runtime starts; later calls are ignored
+        try:
+            if intra_op_threads:
+                tf.config.threading.set_intra_op_parallelism_threads(int(intra_op_threads))
+            if inter_op_threads:
+                tf.config.threading.set_inter_op_parallelism_threads(int(inter_op_threads))
+        except RuntimeError as e:
+            logger.warning(f"TensorFlow thread pools already initialized: {e}")
+
+        self.model_path = Path(model_path)
+        # The focal loss is only needed for training, so skip deserializing it
+        self.model = keras.models.load_model(str(model_path), compile=False)
+        self.runner = InferenceRunner(self.model, buckets=buckets, warmup=warmup)
+        self.input_shape = self.runner.input_shape
+
+    def warmup(self):
+        """Trace and run every bucket once"""
+        self.runner.warmup()
+
+    def predict(self, samples: np.ndarray) -> np.ndarray:
+        """Score a (batch, timesteps, features) array, returns (batch, 1)"""
+        return self.runner.predict(samples)
+
+    def get_stats(self) -> Dict:
+        """Get backend statistics"""
+        return {'backend': self.name, 'model_path': str(self.model_path), **self.runner.get_stats()}
+
+
+class OnnxBackend:
+    """ONNX Runtime session on the CPU execution provider"""
+
+    name = 'onnx'
+
+    def __init__(self, model_path, intra_op_threads: Optional[int] = None,
+                 inter_op_threads: Optional[int] = None, warmup: bool = True, **_):
+        """
+        Load ONNX model
+
+        Args:
+            model_path: Path to .onnx model
+            intra_op_threads: Threads used inside an operator (None = runtime default)
+            inter_op_threads: Threads used across operators (None = runtime default)
+            warmup: Run one inference now (otherwise call warmup() later)
+        """
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = int(intra_op_threads)
+        if inter_op_threads:
+            options.inter_op_num_threads = int(inter_op_threads)
+
+        self.model_path = Path(model_path)
+        self.session = ort.InferenceSession(str(model_path), sess_options=options,
+                                            providers=['CPUExecutionProvider'])
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.input_shape = tuple(model_input.shape[1:])
+
+        self._warmup_ms = None
+        if warmup:
+            self.warmup()
+
+    def warmup(self):
+        """Run one inference so the first request does not pay for session setup"""
+        start = time.perf_counter()
+        self.predict(np.zeros((1, *self.input_shape), dtype=np.float32))
+        self._warmup_ms = (time.perf_counter() - start) * 1000.0
+
+    def predict(self, samples: np.ndarray) -> np.ndarray:
+        """Score a (batch, timesteps, features) array, returns (batch, 1)"""
+        samples = np.ascontiguousarray(samples, dtype=np.float32)
+        if len(samples) == 0:
+            return np.zeros((0, 1), dtype=np.float32)
+        return self.session.run(None, {self.input_name: samples})[0]
+
+    def get_stats(self) -> Dict:
+        """Get backend statistics"""
+        return {
+            'backend': self.name,
+            'model_path': str(self.model_path),
+            'warmup_ms': round(self._warmup_ms, 2) if self._warmup_ms is not None else None
+        }
+
+
+class TFLiteBackend:
+    """
+    TFLite interpreter (tflite-runtime when installed, otherwise tf.lite)
+
+    TFLite bakes the batch dimension into the graph, so the exported model
+    has a fixed batch size (normally 1) and larger batches are scored in
+    slices of that size.
+    """
+
+    name = 'tflite'
+
+    def __init__(self, model_path, num_threads: Optional[int] = None, warmup: bool = True, **_):
+        """
+        Load TFLite model
+
+        Args:
+            model_path: Path to .tflite model
+            num_threads: Interpreter threads (None = runtime default)
+            warmup: Run one inference now (otherwise call warmup() later)
+        """
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+            Interpreter = tf.lite.Interpreter
+
+        self.model_path = Path(model_path)
+        self.interpreter = Interpreter(model_path=str(model_path), num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self.batch_size = int(self._input['shape'][0])
+        self.input_shape = tuple(int(d) for d in self._input['shape'][1:])
+
+        # The interpreter holds its tensors internally and is not thread-safe
+        self._lock = threading.Lock()
+
+        self._warmup_ms = None
+        if warmup:
+            self.warmup()
+
+    def warmup(self):
+        """Run one inference so the first request does not pay for delegate setup"""
+        start = time.perf_counter()
+        self.predict(np.zeros((1, *self.input_shape), dtype=np.float32))
+        self._warmup_ms = (time.perf_counter() - start) * 1000.0
+
+    def predict(self, samples: np.ndarray) -> np.ndarray:
+        """Score a (batch, timesteps, features) array, returns (batch, 1)"""
+        samples = np.asarray(samples, dtype=np.float32)
+        count = len(samples)
+        outputs = np.zeros((count, int(self._output['shape'][-1])), dtype=np.float32)
+
+        with self._lock:
+            for start in range(0, count, self.batch_size):
+                chunk = samples[start:start + self.batch_size]
+                size = len(chunk)
+                if size < self.batch_size:
+                    padded = np.zeros((self.batch_size, *self.input_shape), dtype=np.float32)
+                    padded[:size] = chunk
+                    chunk = padded
+                self.interpreter.set_tensor(self._input['index'], np.ascontiguousarray(chunk))
+                self.interpreter.invoke()
+                outputs[start:start + size] = self.interpreter.get_tensor(self._output['index'])[:size]
+
+        return outputs
+
+    def get_stats(self) -> Dict:
+        """Get backend statistics"""
+        return {
+            'backend': self.name,
+            'model_path': str(self.model_path),
+            'batch_size': self.batch_size,
+            'warmup_ms': round(self._warmup_ms, 2) if self._warmup_ms is not None else None
+        }
+
+
+_BACKEND_CLASSES = {
+    'keras': KerasBackend,
+    'onnx': OnnxBackend,
+    'tflite': TFLiteBackend
+}
+
+
+def load_backend(backend: str, model_path, variant: Optional[str] = None, **options):
+    """
+    Load the binary model with the requested runtime
+
+    Args:
+        backend: One of 'keras', 'onnx', 'tflite'
+        model_path: Path to the Keras model; other backends load the
+            sibling artifact with their own suffix
+        variant: Optional artifact variant, e.g. 'int8' for the quantized
+            TFLite model written by scripts/quantize_model.py
+        **options: Backend options (buckets, intra_op_threads, num_threads,
+            warmup, ...)
+
+    Returns:
+        Backend instance exposing predict(samples), warmup() and get_stats()
+    """
+    backend = (backend or 'keras').lower()
+    path = backend_model_path(model_path, backend, variant)
+
+    if not path.exists():
+        script = 'scripts/quantize_model.py' if variant else 'scripts/export_model.py'
+        raise FileNotFoundError(f"No {backend} model at {path}. "
+                                f"Run {script} to create it.")
+
+    start = time.perf_counter()
+    instance = _BACKEND_CLASSES[backend](path, **options)
+    logger.info(f"Loaded {backend} inference backend from {path} "
+                f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return instance
+
+
+def compare_backends(backends: Dict[str, object],
+                     reference: np.ndarray,
+                     threshold: float = 0.1,
+                     baseline: str = 'keras',
+                     tolerance: float = 1e-4) -> Dict:
+    """
+    Compare probabilities of several backends on a reference set
+
+    Args:
+        backends: Mapping of backend name to loaded backend
+        reference: Reference windows (n, timesteps, features)
+        threshold: Alert threshold used to compare alert decisions
+        baseline: Backend the others are compared against
+        tolerance: Maximum allowed absolute probability difference
+
+    Returns:
+        Report with per-backend differences, alert agreement and pass/fail
+    """
+    if baseline not in backends:
+        raise ValueError(f"Baseline backend '{baseline}' was not loaded")
+
+    baseline_probs = np.asarray(backends[baseline].predict(reference)).reshape(-1)
+    baseline_alerts = baseline_probs > threshold
+
+    report = {
+        'baseline': baseline,
+        'samples': int(len(reference)),
+        'threshold': threshold,
+        'tolerance': tolerance,
+        'backends': {},
+        'passed': True
+    }
+
+    for name, backend in backends.items():
+        if name == baseline:
+            continue
+
+        start = time.perf_counter()
+        probs = np.asarray(backend.predict(reference)).reshape(-1)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+        diff = np.abs(probs - baseline_probs)
+        alert_mismatches = int(np.sum((probs > threshold) != baseline_alerts))
+        passed = bool(diff.max() <= tolerance and alert_mismatches == 0)
+
+        report['backends'][name] = {
+            'max_abs_diff': float(diff.max()),
+            'mean_abs_diff': float(diff.mean()),
+            'alert_mismatches': alert_mismatches,
+            'alert_agreement': 1.0 - alert_mismatches / max(len(reference), 1),
+            'batch_ms': round(elapsed_ms, 2),
+            'passed': passed
+        }
+        report['passed'] = report['passed'] and passed
+
+    return report
@@ -0,0 +1,234 @@
+"""
+Content-Addressed Prediction Cache
+Model outputs keyed by a hash of the input bytes and the model version
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+
+def content_key(data, model_version: str, kind: str = 'tensor') -> str:
+    """
+    Hash input bytes together with the model version
+
+    Args:
+        data: Bytes (request body) or array (hashed as contiguous float32)
+        model_version: Identifier of the model that produced the output
+        kind: Namespace so body and tensor keys never collide
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f'{kind}\0{model_version}\0'.encode('utf-8'))
+    if isinstance(data, np.ndarray):
+        array = np.ascontiguousarray(data, dtype='<f4')
+        digest.update(str(array.shape).encode('ascii'))
+        digest.update(memoryview(array).cast('B'))
+    else:
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class ContentAddressedCache:
+    """
+    LRU cache of model outputs keyed by input content
+
+    Entries are (probabilities, threshold) pairs where the threshold is the
+    one carried inside the request body (None when it comes from the query
+    string). The in-memory tier is bounded by entry count and bytes; an
+    optional on-disk tier (one .npz per key, shared by every worker on the
+    host) is bounded by file count and serves memory misses.
+    """
+
+    def __init__(self, max_entries: int = 50000, max_memory_mb: float = 64.0,
+                 disk_dir: Optional[str] = None, max_disk_entries: int = 200000,
+                 name: str = 'predict'):
+        """
+        Initialize content-addressed cache
+
+        Args:
+            max_entries: Maximum in-memory entries
+            max_memory_mb: Maximum in-memory size of the cached arrays
+            disk_dir: Directory for the on-disk tier (None disables it)
+            max_disk_entries: Maximum files kept in the on-disk tier
+            name: Name used in log messages
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = int(float(max_memory_mb) * 1024 * 1024)
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_disk_entries = max(1, int(max_disk_entries))
+        self.name = name
+
+        self._entries: 'OrderedDict[str, Tuple[np.ndarray, Optional[float]]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+        self._disk_writes = 0
+
+        # Statistics
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._disk_errors = 0
+
+    @staticmethod
+    def _entry_size(key: str, probabilities: np.ndarray) -> int:
+        """Approximate memory held by one entry"""
+        return probabilities.nbytes + len(key) + 200
+
+    def _path(self, key: str) -> Path:
+        """On-disk location of a key (two-level fan-out)"""
+        return self.disk_dir / key[:2] / f'{key}.npz'
+
+    def _remember(self, key: str, value: Tuple[np.ndarray, Optional[float]]):
+        """Insert into the memory tier and evict beyond the bounds (caller holds the lock)"""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= self._entry_size(key, previous[0])
+
+        self._entries[key] = value
+        self._bytes += self._entry_size(key, value[0])
+
+        while len(self._entries) > self.max_entries or (self._bytes > self.max_bytes and len(self._entries) > 1):
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._bytes -= self._entry_size(evicted_key, evicted[0])
+            self._evictions += 1
+
+    def _read_disk(self, key: str) -> Optional[Tuple[np.ndarray, Optional[float]]]:
+        """Load an entry from the disk tier"""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as stored:
+                probabilities = stored['probabilities']
+                threshold = float(stored['threshold'])
+            os.utime(path)  # LRU order on disk follows access time
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._disk_errors += 1
+            logger.warning(f"Unreadable {self.name} cache file {path.name}: {e}")
+            return None
+        return probabilities, (None if np.isnan(threshold) else threshold)
+
+    def _write_disk(self, key: str, value: Tuple[np.ndarray, Optional[float]]):
+        """Store an entry in the disk tier (atomic rename, so readers never see partial files)"""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            temp_path = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}')
+            with open(temp_path, 'wb') as f:
+                np.savez(f, probabilities=value[0],
+                         threshold=np.float64(np.nan if value[1] is None else value[1]))
+            os.replace(temp_path, path)
+        except Exception as e:
+            self._disk_errors += 1
+            logger.warning(f"Could not write {self.name} cache file: {e}")
+            return
+
+        self._disk_writes += 1
+        if self._disk_writes % 1000 == 0:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        """Remove the least recently used files beyond max_disk_entries"""
+        files = [path for path in self.disk_dir.glob('*/*.npz')]
+        excess = len(files) - self.max_disk_entries
+        if excess <= 0:
+            return
+
+        files.sort(key=lambda path: path.stat().st_mtime)
+        for path in files[:excess]:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        logger.info(f"Pruned {excess} files from the {self.name} disk cache")
+
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, Optional[float]]]:
+        """
+        Look up a key in memory, then on disk
+
+        Args:
+            key: Key from content_key
+
+        Returns:
+            (probabilities, body threshold) or None on a miss
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._memory_hits += 1
+                return value
+
+        if self.disk_dir is not None:
+            value = self._read_disk(key)
+            if value is not None:
+                with self._lock:
+                    self._remember(key, value)
+                    self._disk_hits += 1
+                return value
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, key: str, probabilities: np.ndarray, threshold: Optional[float] = None):
+        """
+        Store a model output
+
+        Args:
+            key: Key from content_key
+            probabilities: Model output for the request
+            threshold: Threshold carried in the request body (None if not)
+        """
+        # Copy so a later in-place change by the caller cannot corrupt the cache
+        value = (np.array(probabilities, dtype=np.float32), threshold)
+        value[0].setflags(write=False)
+
+        with self._lock:
+            self._remember(key, value)
+
+        if self.disk_dir is not None:
+            self._write_disk(key, value)
+
+    def clear(self):
+        """Drop the memory tier (disk entries are keyed by model version and need no purge)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with sizes and per-tier hit rates
+        """
+        with self._lock:
+            lookups = self._memory_hits + self._disk_hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'memory_mb': round(self._bytes / (1024 * 1024), 3),
+                'max_memory_mb': round(self.max_bytes / (1024 * 1024), 3),
+                'disk_tier': str(self.disk_dir) if self.disk_dir is not None else None,
+                'memory_hits': self._memory_hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'hit_rate': round((self._memory_hits + self._disk_hits) / lookups, 4) if lookups else None,
+                'memory_hit_rate': round(self._memory_hits / lookups, 4) if lookups else None,
+                'evictions': self._evictions,
+                'disk_errors': self._disk_errors
+            }
@@ -0,0 +1,227 @@
+"""
+HTTP Response Caching
+Compression, strong ETags and conditional responses for the JSON API
+"""
+
+import gzip
+import hashlib
+from typing import Dict, Optional
+
+from flask import Flask, Response, request
+from werkzeug.datastructures import ETags
+from werkzeug.http import parse_accept_header, parse_etags
+
+try:
+    import brotli
+except ImportError:  # brotli encoding is optional
+    brotli = None
+
+
+# Media types worth compressing (NDJSON streams are generators and skipped)
+COMPRESSIBLE_TYPES = (
+    'application/json', 'text/html', 'text/css', 'text/plain',
+    'text/javascript', 'application/javascript'
+)
+
+# A compressed body is a different representation, so its strong ETag differs
+ENCODING_ETAG_SUFFIXES = {'br': '-br', 'gzip': '-gzip'}
+
+# send_file responses up to this size are buffered so they can be compressed
+MAX_BUFFERED_FILE_BYTES = 2 * 1024 * 1024
+
+
+def make_etag(*parts) -> str:
+    """
+    Strong ETag for a resource version
+
+    Args:
+        *parts: Values identifying the version (snapshot time, page, model, ...)
+
+    Returns:
+        Unquoted ETag value
+    """
+    return hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _base_etag(etag: str) -> str:
+    """ETag without the content-encoding suffix"""
+    for suffix in ENCODING_ETAG_SUFFIXES.values():
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)]
+    return etag
+
+
+def _match(if_none_match: ETags, etag: str) -> Optional[str]:
+    """The parsed If-None-Match entry naming this ETag in any encoding, if any"""
+    if not if_none_match:
+        return None
+    if if_none_match.star_tag:
+        return etag
+    for tag in if_none_match.as_set(include_weak=True):
+        if _base_etag(tag) == etag:
+            return tag
+    return None
+
+
+def match_etag(if_none_match: Optional[str], etag: str) -> Optional[str]:
+    """
+    The If-None-Match entry naming this ETag in any encoding, if any
+
+    Framework-free form for servers that do not go through Flask.
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Unquoted ETag of the current version (without encoding suffix)
+
+    Returns:
+        The matching (unquoted) tag to echo in the 304, or None
+    """
+    return _match(parse_etags(if_none_match), etag)
+
+
+def _matching_tag(etag: str) -> Optional[str]:
+    """The If-None-Match entry naming this ETag in any encoding, if any"""
+    return _match(request.if_none_match, etag)
+
+
+def etag_matches(etag: str) -> bool:
+    """Whether the request's If-None-Match names this ETag (in any encoding)"""
+    return _matching_tag(etag) is not None
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for a matching ETag (echoing the client's encoding variant)"""
+    response = Response(status=304)
+    response.set_etag(_matching_tag(etag) or etag)
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Best encoding a client accepts (brotli only if installed)
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+
+    Returns:
+        'br', 'gzip' or None
+    """
+    offered = (['br'] if brotli is not None else []) + ['gzip']
+    encoding = parse_accept_header(accept_encoding).best_match(offered)
+    return encoding if encoding in offered else None
+
+
+def compress(data: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 5) -> bytes:
+    """Encode a body with 'br' or 'gzip'"""
+    if encoding == 'br':
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level)
+
+
+def finalize_response(response: Response, compression: bool = True, min_size: int = 1024,
+                      gzip_level: int = 6, brotli_quality: int = 5) -> Response:
+    """
+    Add ETags, answer conditional requests and compress a response
+
+    Responses without an ETag get one hashed from the body (JSON only), so
+    every API poll can be revalidated; handlers that know their snapshot
+    version set the ETag themselves and may answer 304 before doing any
+    work. A request whose If-None-Match matches gets an empty 304.
+    Otherwise compressible bodies of at least ``min_size`` bytes are
+    brotli- or gzip-encoded according to Accept-Encoding.
+
+    Args:
+        response: Outgoing response
+        compression: Whether to compress at all
+        min_size: Smallest body (bytes) worth compressing
+        gzip_level: gzip compression level (1-9)
+        brotli_quality: brotli quality (0-11)
+
+    Returns:
+        The response (possibly converted to 304 or compressed)
+    """
+    if request.method not in ('GET', 'HEAD') or response.status_code != 200:
+        return response
+    if 'Content-Encoding' in response.headers:
+        return response
+
+    if response.direct_passthrough:
+        # send_file: buffer small files so they can be revalidated and compressed
+        if response.content_length is None or response.content_length > MAX_BUFFERED_FILE_BYTES:
+            return response
+        response.direct_passthrough = False
+    elif response.is_streamed:
+        return response
+
+    etag, _ = response.get_etag()
+    if etag is None and response.mimetype == 'application/json':
+        etag = hashlib.blake2b(response.get_data(), digest_size=16).hexdigest()
+        response.set_etag(etag)
+
+    matched = _matching_tag(_base_etag(etag)) if etag is not None else None
+    if matched is not None:
+        # Keep the handler's headers (Cache-Control, CORS, ...) but drop the body
+        response.status_code = 304
+        response.response = []
+        for header in ('Content-Length', 'Content-Type'):
+            response.headers.pop(header, None)
+        response.set_etag(matched)
+        response.vary.add('Accept-Encoding')
+        return response
+
+    if not compression or response.mimetype not in COMPRESSIBLE_TYPES:
+        return response
+
+    data = response.get_data()
+    if len(data) < min_size:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(request.headers.get('Accept-Encoding'))
+    if encoding is None:
+        return response
+
+    response.set_data(compress(data, encoding, gzip_level, brotli_quality))
+    response.headers['Content-Encoding'] = encoding
+    if etag is not None:
+        response.set_etag(_base_etag(etag) + ENCODING_ETAG_SUFFIXES[encoding])
+    return response
+
+
+def caching_options(config: Optional[Dict] = None) -> Dict:
+    """
+    finalize_response keyword arguments from the serving.http_caching block
+
+    Args:
+        config: Options: compression, min_size_bytes, gzip_level, brotli_quality
+
+    Returns:
+        Dictionary with compression, min_size, gzip_level and brotli_quality
+    """
+    config = config or {}
+    return {
+        'compression': bool(config.get('compression', True)),
+        'min_size': int(config.get('min_size_bytes', 1024)),
+        'gzip_level': int(config.get('gzip_level', 6)),
+        'brotli_quality': int(config.get('brotli_quality', 5))
+    }
+
+
+def init_http_caching(app: Flask, config: Optional[Dict] = None):
+    """
+    Register compression and ETag handling on a Flask app
+
+    Args:
+        app: Flask application
+        config: Options (serving.http_caching): compression, min_size_bytes,
+            gzip_level, brotli_quality
+    """
+    options = caching_options(config)
+
+    # Polling clients pay for every byte: never pretty-print
+    app.json.compact = True
+
+    @app.after_request
+    def _finalize(response):
+        return finalize_response(response, **options)
@@ -0,0 +1,233 @@
+"""
+Micro-batching Scheduler
+Coalesces concurrent prediction requests into a single model forward pass
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+
+# Upper bounds of the batch-size histogram buckets (last bucket is open-ended)
+HISTOGRAM_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128]
+
+
+class _PendingRequest:
+    """A queued prediction request waiting to be batched"""
+
+    __slots__ = ('samples', 'future', 'enqueued_at')
+
+    def __init__(self, samples: np.ndarray):
+        self.samples = samples
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class MicroBatcher:
+    """
+    Dynamic micro-batching queue in front of a model
+
+    Requests submitted from concurrent threads are collected for at most
+    ``max_wait_ms`` (or until ``max_batch_size`` samples are queued), scored
+    with one call to ``predict_fn`` and each caller receives its own slice
+    of the output.
+    """
+
+    def __init__(self,
+                 predict_fn: Callable[[np.ndarray], np.ndarray],
+                 max_batch_size: int = 32,
+                 max_wait_ms: float = 3.0,
+                 name: str = 'model',
+                 result_timeout_ms: Optional[float] = None):
+        """
+        Initialize micro-batcher
+
+        Args:
+            predict_fn: Function mapping a (batch, ...) array to predictions
+            max_batch_size: Maximum number of samples per forward pass
+            max_wait_ms: Maximum time to hold the first request of a batch
+            name: Name used for the worker thread and log messages
+            result_timeout_ms: Default time predict() waits for a result
+                (None waits indefinitely)
+        """
+        self.predict_fn = predict_fn
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.name = name
+        self.result_timeout = float(result_timeout_ms) / 1000.0 if result_timeout_ms is not None else None
+
+        self._queue = queue.Queue()
+        self._carry_over: Optional[_PendingRequest] = None
+        self._running = True
+
+        # Statistics
+        self._stats_lock = threading.Lock()
+        self._batch_histogram = {bucket: 0 for bucket in HISTOGRAM_BUCKETS}
+        self._batch_histogram['>128'] = 0
+        self._wait_times_ms = deque(maxlen=1000)
+        self._batch_count = 0
+        self._request_count = 0
+        self._sample_count = 0
+        self._error_count = 0
+
+        self._worker = threading.Thread(
+            target=self._worker_loop,
+            name=f'micro-batcher-{name}',
+            daemon=True
+        )
+        self._worker.start()
+
+        logger.info(f"Micro-batcher '{name}' started "
+                    f"(max_batch_size={self.max_batch_size}, max_wait_ms={max_wait_ms})")
+
+    def submit(self, samples: np.ndarray) -> Future:
+        """
+        Queue samples for batched prediction
+
+        Args:
+            samples: Array of shape (n, ...) to score
+
+        Returns:
+            Future resolving to the predictions for these samples
+        """
+        if not self._running:
+            raise RuntimeError(f"Micro-batcher '{self.name}' is stopped")
+
+        request = _PendingRequest(np.asarray(samples))
+        self._queue.put(request)
+        return request.future
+
+    def predict(self, samples: np.ndarray, timeout: Optional[float] = None) -> np.ndarray:
+        """
+        Score samples through the batching queue and wait for the result
+
+        Args:
+            samples: Array of shape (n, ...) to score
+            timeout: Maximum seconds to wait for the result (default:
+                result_timeout_ms)
+
+        Returns:
+            Predictions for the submitted samples
+
+        Raises:
+            concurrent.futures.TimeoutError: If no result arrived in time
+        """
+        return self.submit(samples).result(timeout=self.result_timeout if timeout is None else timeout)
+
+    def stop(self):
+        """Stop the worker thread after draining queued requests"""
+        self._running = False
+        self._worker.join(timeout=5)
+
+    def _next_request(self, timeout: Optional[float]) -> Optional[_PendingRequest]:
+        """Take the carried-over request or the next queued one"""
+        if self._carry_over is not None:
+            request, self._carry_over = self._carry_over, None
+            return request
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _worker_loop(self):
+        """Collect requests into batches and run them"""
+        while self._running or not self._queue.empty() or self._carry_over is not None:
+            first = self._next_request(timeout=0.1)
+            if first is None:
+                continue
+
+            batch = [first]
+            batch_size = len(first.samples)
+            deadline = first.enqueued_at + self.max_wait
+
+            while batch_size < self.max_batch_size:
+                # Once the window has closed, only drain what is already queued
+                remaining = max(0.0, deadline - time.perf_counter())
+                request = self._next_request(timeout=remaining)
+                if request is None:
+                    break
+                if batch_size + len(request.samples) > self.max_batch_size:
+                    self._carry_over = request
+                    break
+                batch.append(request)
+                batch_size += len(request.samples)
+
+            self._run_batch(batch, batch_size)
+
+    def _run_batch(self, batch: List[_PendingRequest], batch_size: int):
+        """Run one forward pass and fan the results back out"""
+        dispatched_at = time.perf_counter()
+
+        try:
+            if len(batch) == 1:
+                inputs = batch[0].samples
+            else:
+                inputs = np.concatenate([request.samples for request in batch], axis=0)
+            outputs = np.asarray(self.predict_fn(inputs))
+        except Exception as e:
+            logger.error(f"Micro-batcher '{self.name}' prediction failed: {e}")
+            with self._stats_lock:
+                self._error_count += 1
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        offset = 0
+        for request in batch:
+            count = len(request.samples)
+            request.future.set_result(outputs[offset:offset + count])
+            offset += count
+
+        self._record_batch(batch, batch_size, dispatched_at)
+
+    def _record_batch(self, batch: List[_PendingRequest], batch_size: int, dispatched_at: float):
+        """Update queue statistics for a completed batch"""
+        with self._stats_lock:
+            self._batch_count += 1
+            self._request_count += len(batch)
+            self._sample_count += batch_size
+
+            for bucket in HISTOGRAM_BUCKETS:
+                if batch_size <= bucket:
+                    self._batch_histogram[bucket] += 1
+                    break
+            else:
+                self._batch_histogram['>128'] += 1
+
+            for request in batch:
+                self._wait_times_ms.append((dispatched_at - request.enqueued_at) * 1000.0)
+
+    def get_stats(self) -> Dict:
+        """
+        Get batching statistics
+
+        Returns:
+            Dictionary with queue depth, batch-size histogram and wait times
+        """
+        with self._stats_lock:
+            wait_times = np.array(self._wait_times_ms) if self._wait_times_ms else np.zeros(1)
+            return {
+                'queue_depth': self._queue.qsize() + (1 if self._carry_over is not None else 0),
+                'max_batch_size': self.max_batch_size,
+                'max_wait_ms': self.max_wait * 1000.0,
+                'batches': self._batch_count,
+                'requests': self._request_count,
+                'samples': self._sample_count,
+                'errors': self._error_count,
+                'mean_batch_size': self._sample_count / self._batch_count if self._batch_count else 0.0,
+                'batch_size_histogram': {
+                    (f'<={bucket}' if isinstance(bucket, int) else bucket): count
+                    for bucket, count in self._batch_histogram.items()
+                },
+                'wait_ms': {
+                    'mean': float(wait_times.mean()),
+                    'p95': float(np.percentile(wait_times, 95)),
+                    'max': float(wait_times.max())
+                }
+            }
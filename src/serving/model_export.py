@@ -0,0 +1,127 @@
+"""
+Model Export
+Convert the binary Keras model to ONNX and TFLite for TensorFlow-free serving
+"""
+
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+from loguru import logger
+
+
+# Post-training quantization modes supported by export_tflite
+QUANTIZATION_MODES = ('dynamic', 'int8')
+
+
+def _serving_function(model, batch_size=None):
+    """Inference-mode tf.function with a (batch, timesteps, features) signature"""
+    import tensorflow as tf
+
+    spec = tf.TensorSpec((batch_size, *model.input_shape[1:]), tf.float32, name='combined_input')
+
+    @tf.function(input_signature=[spec])
+    def serve(combined_input):
+        return model(combined_input, training=False)
+
+    return serve, spec
+
+
+def export_onnx(model, output_path, opset: int = 17) -> Path:
+    """
+    Export model to ONNX with a dynamic batch dimension
+
+    Args:
+        model: Loaded Keras model
+        output_path: Destination .onnx file
+        opset: ONNX opset version
+
+    Returns:
+        Path to the exported model
+    """
+    import tf2onnx
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    serve, spec = _serving_function(model)
+    tf2onnx.convert.from_function(
+        serve,
+        input_signature=[spec],
+        opset=opset,
+        output_path=str(output_path)
+    )
+
+    logger.success(f"ONNX model exported to {output_path} ({output_path.stat().st_size / 1024:.0f} KB)")
+    return output_path
+
+
+def representative_dataset(windows: np.ndarray, batch_size: int = 1,
+                           max_samples: int = 500) -> Callable[[], Iterable]:
+    """
+    Build a TFLite representative dataset from training windows
+
+    Args:
+        windows: Training windows (n, timesteps, features)
+        batch_size: Batch size of the exported graph
+        max_samples: Maximum number of windows used for calibration
+
+    Returns:
+        Generator function yielding single-input lists
+    """
+    windows = np.asarray(windows, dtype=np.float32)[:max_samples]
+
+    def generate():
+        for start in range(0, len(windows) - batch_size + 1, batch_size):
+            yield [np.ascontiguousarray(windows[start:start + batch_size])]
+
+    return generate
+
+
+def export_tflite(model, output_path, batch_size: int = 1,
+                  quantization: Optional[str] = None,
+                  calibration_windows: Optional[np.ndarray] = None) -> Path:
+    """
+    Export model to TFLite
+
+    The LSTM layers only lower to builtin TFLite ops with a static batch
+    dimension, so the graph is frozen at ``batch_size`` (1 by default).
+
+    Args:
+        model: Loaded Keras model
+        output_path: Destination .tflite file
+        batch_size: Fixed batch size of the exported graph
+        quantization: None for float32, 'dynamic' for dynamic-range int8
+            weights, or 'int8' for full-integer weights and activations
+        calibration_windows: Representative windows, required for 'int8'
+
+    Returns:
+        Path to the exported model
+    """
+    import tensorflow as tf
+    from tensorflow.python.framework.convert_to_constants import convert_variables_to_constants_v2
+
+    if quantization is not None and quantization not in QUANTIZATION_MODES:
+        raise ValueError(f"Unknown quantization '{quantization}'. Choose from {QUANTIZATION_MODES}")
+    if quantization == 'int8' and calibration_windows is None:
+        raise ValueError("Full-integer quantization needs calibration_windows")
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    serve, spec = _serving_function(model, batch_size=batch_size)
+    # Freeze weights into constants (resource variables are not readable by the interpreter)
+    frozen = convert_variables_to_constants_v2(serve.get_concrete_function())
+
+    converter = tf.lite.TFLiteConverter.from_concrete_functions([frozen])
+    if quantization:
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if quantization == 'int8':
+        # Input/output stay float32 so every backend keeps the same interface
+        converter.representative_dataset = representative_dataset(calibration_windows, batch_size)
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    output_path.write_bytes(converter.convert())
+
+    label = f"{quantization} quantized " if quantization else ""
+    logger.success(f"TFLite {label}model exported to {output_path} ({output_path.stat().st_size / 1024:.0f} KB)")
+    return output_path
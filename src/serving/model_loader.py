@@ -0,0 +1,177 @@
+"""
+Background Model Loader
+Loads and warms the model off the request path and reports readiness
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+
+# Readiness states in the order they are reached ('failed' can replace any of them)
+LOADING = 'loading'
+WARMING = 'warming'
+READY = 'ready'
+FAILED = 'failed'
+
+
+class ModelNotReady(TimeoutError):
+    """Raised when the model is not ready within the wait timeout"""
+
+    def __init__(self, state: str, timeout: float):
+        super().__init__(f"Model is still {state} after waiting {timeout:.1f}s")
+        self.state = state
+
+
+class ModelLoadError(RuntimeError):
+    """Raised when the background load failed"""
+
+
+class BackgroundModelLoader:
+    """
+    Load a model on a background thread
+
+    The web server can bind and answer health checks straight away while
+    the model is loaded (``loading``) and run through a warm-up inference
+    (``warming``). Request handlers call :meth:`wait`, which blocks until
+    the model is ``ready`` or the timeout expires, so requests that arrive
+    during start-up are held rather than rejected.
+    """
+
+    def __init__(self,
+                 load_fn: Callable[[], Any],
+                 warmup_fn: Optional[Callable[[Any], None]] = None,
+                 name: str = 'model'):
+        """
+        Initialize background loader
+
+        Args:
+            load_fn: Function returning the loaded model
+            warmup_fn: Function running warm-up inference on the loaded model
+            name: Name used for the loader thread and log messages
+        """
+        self.load_fn = load_fn
+        self.warmup_fn = warmup_fn
+        self.name = name
+
+        self.state = LOADING
+        self.error: Optional[str] = None
+        self.model = None
+
+        self._ready = threading.Event()
+        self._started_at: Optional[float] = None
+        self._timings_ms: Dict[str, float] = {}
+        self._started_time: Optional[str] = None
+        self._ready_time: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._waiting = 0
+        self._lock = threading.Lock()
+
+    def start(self) -> 'BackgroundModelLoader':
+        """Start loading on a daemon thread (no-op if already started)"""
+        if self._thread is not None:
+            return self
+
+        self._started_at = time.perf_counter()
+        self._started_time = datetime.now().isoformat()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f'model-loader-{self.name}',
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def _run(self):
+        """Load, warm up and mark the model ready"""
+        try:
+            start = time.perf_counter()
+            model = self.load_fn()
+            self._timings_ms[LOADING] = (time.perf_counter() - start) * 1000.0
+
+            self.state = WARMING
+            start = time.perf_counter()
+            if self.warmup_fn is not None:
+                self.warmup_fn(model)
+            self._timings_ms[WARMING] = (time.perf_counter() - start) * 1000.0
+
+            self.model = model
+            self.state = READY
+            self._ready_time = datetime.now().isoformat()
+            logger.info(f"Model '{self.name}' ready in {self._elapsed_ms():.0f} ms "
+                        f"(load {self._timings_ms[LOADING]:.0f} ms, "
+                        f"warm-up {self._timings_ms[WARMING]:.0f} ms)")
+
+        except Exception as e:
+            self.error = str(e)
+            self.state = FAILED
+            logger.error(f"Model '{self.name}' failed to load: {e}")
+
+        finally:
+            # Wake up waiting requests whether the load succeeded or not
+            self._ready.set()
+
+    def _elapsed_ms(self) -> float:
+        """Time since start() in milliseconds"""
+        if self._started_at is None:
+            return 0.0
+        return (time.perf_counter() - self._started_at) * 1000.0
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the model is loaded and warmed up"""
+        return self.state == READY
+
+    def wait(self, timeout: Optional[float] = None):
+        """
+        Block until the model is ready
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            The loaded model
+
+        Raises:
+            ModelNotReady: If the model is still loading after the timeout
+            ModelLoadError: If loading failed
+        """
+        if not self._ready.is_set():
+            with self._lock:
+                self._waiting += 1
+            try:
+                self._ready.wait(timeout)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+
+        if self.state == READY:
+            return self.model
+        if self.state == FAILED:
+            raise ModelLoadError(self.error)
+        raise ModelNotReady(self.state, timeout or 0.0)
+
+    def status(self) -> Dict:
+        """
+        Get loader status
+
+        Returns:
+            Dictionary with state, stage timings, waiting requests and error
+        """
+        timings = {f'{stage}_ms': round(ms, 1) for stage, ms in self._timings_ms.items()}
+        if self.state in (LOADING, WARMING):
+            timings['elapsed_ms'] = round(self._elapsed_ms(), 1)
+        elif self.state == READY:
+            timings['total_ms'] = round(sum(self._timings_ms.values()), 1)
+
+        return {
+            'state': self.state,
+            'started_at': self._started_time,
+            'ready_at': self._ready_time,
+            'timings': timings,
+            'waiting_requests': self._waiting,
+            'error': self.error
+        }
@@ -0,0 +1,471 @@
+"""
+Model Registry
+Versioned model artifacts with background hot reload and instant rollback
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+
+# Name of the pin file: when present, its content is the version to serve
+PIN_FILE = 'ACTIVE'
+METADATA_FILE = 'model_metadata.json'
+
+
+def _natural_key(name: str):
+    """Sort key so that v2 < v10 and timestamps sort chronologically"""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+
+class ServedModel:
+    """
+    One loaded model version
+
+    Immutable apart from its micro-batcher, so a request that took a
+    reference keeps scoring on the version it started with even if a new
+    one is swapped in meanwhile.
+    """
+
+    __slots__ = ('version', 'path', 'metadata', 'model', 'batcher', 'loaded_at', 'load_ms')
+
+    def __init__(self, version: str, path: Path, model: Any, metadata: Optional[Dict] = None,
+                 load_ms: float = 0.0):
+        self.version = version
+        self.path = Path(path)
+        self.model = model
+        self.metadata = metadata
+        self.batcher = None
+        self.loaded_at = datetime.utcnow()
+        self.load_ms = load_ms
+
+    def predict(self, samples):
+        """Score a batch directly on this version's model"""
+        return self.model.predict(samples)
+
+    def run(self, samples):
+        """
+        Score through this version's micro-batcher when it has one
+
+        A request whose batch has not finished within the batcher's
+        result_timeout_ms (a stalled or stopped worker) is scored directly.
+        """
+        batcher = self.batcher
+        if batcher is not None:
+            try:
+                return batcher.predict(samples)
+            except RuntimeError:
+                # Batcher stopped after the version was retired: score directly
+                pass
+            except FutureTimeoutError:
+                logger.warning(f"Micro-batcher '{batcher.name}' returned no result within "
+                               f"{batcher.result_timeout:g}s, scoring directly")
+        return self.model.predict(samples)
+
+    def close(self):
+        """Stop the micro-batcher (the model itself is freed with the object)"""
+        batcher, self.batcher = self.batcher, None
+        if batcher is not None:
+            batcher.stop()
+
+    def describe(self) -> Dict:
+        """Version, artifact directory and load details"""
+        return {
+            'version': self.version,
+            'path': str(self.path),
+            'loaded_at': self.loaded_at.isoformat(),
+            'load_ms': round(self.load_ms, 1)
+        }
+
+
+class ModelRegistry:
+    """
+    Serve the newest model version from a registry directory
+
+    Layout::
+
+        models/registry/
+            v1/tsunami_detection_binary_focal.onnx
+            v1/model_metadata.json
+            v2/...
+            ACTIVE          optional pin: the version to serve
+
+    Every subdirectory holding ``artifact`` is a version; versions sort by
+    name (v2 < v10, timestamps chronologically). The target is the pinned
+    version, else the newest one, else the artifact in ``fallback_dir``
+    (the flat models/ layout, versioned as ``base-<hash of size and mtime>``
+    so that an overwritten file is picked up too).
+
+    A watcher thread polls the registry. A new target is loaded and warmed
+    up on that thread while the current version keeps serving, then
+    swapped in with a single reference assignment, so every micro-batch
+    runs entirely on one version. The replaced version stays loaded for
+    :meth:`rollback`, which swaps back without loading anything and pins
+    the version so other workers follow.
+    """
+
+    def __init__(self,
+                 root,
+                 artifact: str,
+                 load_fn: Callable[[Path], Any],
+                 warmup_fn: Optional[Callable[[ServedModel], None]] = None,
+                 batcher_fn: Optional[Callable[[ServedModel], Any]] = None,
+                 on_swap: Optional[Callable[[ServedModel, Optional[ServedModel]], None]] = None,
+                 fallback_dir=None,
+                 poll_interval_seconds: float = 10.0,
+                 settle_seconds: float = 5.0,
+                 name: str = 'model'):
+        """
+        Initialize model registry
+
+        Args:
+            root: Registry directory (need not exist yet)
+            artifact: File name a version directory must contain
+            load_fn: Function loading the model from a version directory
+            warmup_fn: Function warming up a loaded version before it is served
+            batcher_fn: Function returning a micro-batcher for a version (or None)
+            on_swap: Called with (new, previous) after every swap
+            fallback_dir: Directory served when the registry has no version
+            poll_interval_seconds: Watcher poll interval
+            settle_seconds: Minimum age of a version's newest file, so that
+                versions still being copied are not loaded
+            name: Name used for the watcher thread and log messages
+        """
+        self.root = Path(root)
+        self.artifact = artifact
+        self.load_fn = load_fn
+        self.warmup_fn = warmup_fn
+        self.batcher_fn = batcher_fn
+        self.on_swap = on_swap
+        self.fallback_dir = Path(fallback_dir) if fallback_dir is not None else None
+        self.interval = max(0.5, float(poll_interval_seconds))
+        self.settle = max(0.0, float(settle_seconds))
+        self.name = name
+
+        self._active: Optional[ServedModel] = None
+        self._previous: Optional[ServedModel] = None
+        # version -> file signature of a load that failed (retried once the files change)
+        self._failed: Dict[str, tuple] = {}
+        self._ignored_pin: Optional[str] = None
+        self._swap_lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self._swaps = 0
+        self._rollbacks = 0
+        self._load_failures = 0
+        self._last_error: Optional[str] = None
+        self._last_check: Optional[datetime] = None
+
+    @property
+    def active(self) -> Optional[ServedModel]:
+        """Version currently served (None until the first load)"""
+        return self._active
+
+    @property
+    def previous(self) -> Optional[ServedModel]:
+        """Version kept loaded for rollback"""
+        return self._previous
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the watcher thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _signature(self, path: Path) -> Optional[tuple]:
+        """(size, mtime_ns, newest mtime) of a version, None if its artifact is missing"""
+        try:
+            artifact = (path / self.artifact).stat()
+        except OSError:
+            return None
+        newest = artifact.st_mtime
+        try:
+            newest = max(newest, (path / METADATA_FILE).stat().st_mtime)
+        except OSError:
+            pass
+        return artifact.st_size, artifact.st_mtime_ns, newest
+
+    def _settled(self, signature: tuple) -> bool:
+        """Whether a version's files have stopped changing"""
+        return time.time() - signature[2] >= self.settle
+
+    def versions(self) -> List[str]:
+        """Complete version directories, oldest first"""
+        if not self.root.is_dir():
+            return []
+        names = [path.name for path in self.root.iterdir()
+                 if path.is_dir() and not path.name.startswith('.') and
+                 self._signature(path) is not None]
+        return sorted(names, key=_natural_key)
+
+    def fallback_version(self) -> Optional[str]:
+        """Version label of the fallback artifact (changes when the file is replaced)"""
+        if self.fallback_dir is None:
+            return None
+        signature = self._signature(self.fallback_dir)
+        if signature is None:
+            return None
+        digest = hashlib.blake2b(repr(signature[:2]).encode('utf-8'), digest_size=4).hexdigest()
+        return f"base-{digest}"
+
+    def pinned(self) -> Optional[str]:
+        """Version named by the pin file, if any"""
+        try:
+            return (self.root / PIN_FILE).read_text().strip() or None
+        except OSError:
+            return None
+
+    def _resolve(self, version: str) -> Optional[Path]:
+        """Directory of a version name (registry or fallback)"""
+        if version in self.versions():
+            return self.root / version
+        if version == self.fallback_version():
+            return self.fallback_dir
+        return None
+
+    def target(self) -> Optional[str]:
+        """Version that should be served: pinned, else newest, else the fallback"""
+        pinned = self.pinned()
+        if pinned is not None:
+            loaded = {served.version for served in (self._active, self._previous) if served is not None}
+            if pinned in loaded or pinned in self.versions() or pinned == self.fallback_version():
+                return pinned
+            if pinned != self._ignored_pin:
+                logger.warning(f"Model registry '{self.name}': pinned version {pinned!r} not found, ignoring pin")
+                self._ignored_pin = pinned
+
+        versions = self.versions()
+        if versions:
+            return versions[-1]
+        return self.fallback_version()
+
+    def load(self, version: Optional[str] = None) -> ServedModel:
+        """
+        Load a version without serving it
+
+        Args:
+            version: Version to load (default: the current target)
+
+        Returns:
+            Loaded, not yet warmed up ServedModel
+
+        Raises:
+            FileNotFoundError: If the version (or any version) does not exist
+        """
+        version = version or self.target()
+        path = self._resolve(version) if version is not None else None
+        if path is None:
+            raise FileNotFoundError(f"No model version {version!r} in {self.root}"
+                                    f"{' or ' + str(self.fallback_dir) if self.fallback_dir else ''}")
+
+        metadata = None
+        try:
+            with open(path / METADATA_FILE, 'r') as f:
+                metadata = json.load(f)
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            logger.warning(f"Unreadable metadata for model version {version}: {e}")
+
+        start = time.perf_counter()
+        model = self.load_fn(path)
+        return ServedModel(version, path, model, metadata, (time.perf_counter() - start) * 1000.0)
+
+    def publish(self, served: ServedModel, warmup: bool = True) -> ServedModel:
+        """
+        Warm up a loaded version and swap it in
+
+        Args:
+            served: Version returned by :meth:`load`
+            warmup: Run ``warmup_fn`` before serving
+
+        Returns:
+            The now active version
+        """
+        if self.batcher_fn is not None:
+            served.batcher = self.batcher_fn(served)
+        if warmup and self.warmup_fn is not None:
+            try:
+                self.warmup_fn(served)
+            except Exception:
+                served.close()
+                raise
+        self._swap(served)
+        return served
+
+    def _swap(self, served: ServedModel, rollback: bool = False):
+        """Make a version active, keep the replaced one for rollback"""
+        with self._swap_lock:
+            previous, retired = self._active, self._previous
+            if served is retired:
+                retired = None
+            self._active = served
+            self._previous = previous
+            if rollback:
+                self._rollbacks += 1
+            else:
+                self._swaps += 1
+
+        # In-flight requests hold their own reference, so only the version
+        # from two swaps ago is dropped
+        if retired is not None and retired is not previous:
+            retired.close()
+
+        if previous is not None:
+            logger.info(f"Model '{self.name}' {'rolled back' if rollback else 'swapped'}: "
+                        f"{previous.version} -> {served.version}")
+        else:
+            logger.info(f"Model '{self.name}' version {served.version} active")
+        if self.on_swap is not None:
+            self.on_swap(served, previous)
+
+    def check(self) -> bool:
+        """
+        One watcher pass: load and swap in the target version if it changed
+
+        Returns:
+            Whether a different version was swapped in
+        """
+        self._last_check = datetime.utcnow()
+        target = self.target()
+        if target is None or (self._active is not None and target == self._active.version):
+            return False
+
+        # Returning to the kept version needs no load
+        if self._previous is not None and target == self._previous.version:
+            self._swap(self._previous, rollback=target == self.pinned())
+            return True
+
+        path = self._resolve(target)
+        signature = self._signature(path) if path is not None else None
+        if signature is None or not self._settled(signature) or self._failed.get(target) == signature:
+            return False
+
+        with self._load_lock:
+            if self._active is not None and target == self._active.version:
+                return False
+            logger.info(f"Loading model '{self.name}' version {target} in the background")
+            try:
+                self.publish(self.load(target))
+            except Exception as e:
+                self._failed[target] = signature
+                self._load_failures += 1
+                self._last_error = f"{target}: {e}"
+                logger.error(f"Model '{self.name}' version {target} failed to load, "
+                             f"still serving {self._active.version if self._active else 'nothing'}: {e}")
+                return False
+        return True
+
+    def rollback(self) -> ServedModel:
+        """
+        Swap the previous version back in (no load) and pin it
+
+        Returns:
+            The now active version
+
+        Raises:
+            RuntimeError: If no previous version is loaded
+        """
+        previous = self._previous
+        if previous is None:
+            raise RuntimeError(f"Model '{self.name}' has no previous version to roll back to")
+        self.pin(previous.version)
+        self._swap(previous, rollback=True)
+        return previous
+
+    def pin(self, version: str):
+        """Write the pin file (every process watching the registry follows it)"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f'.{PIN_FILE}.tmp'
+        tmp.write_text(version + '\n')
+        tmp.replace(self.root / PIN_FILE)
+
+    def unpin(self):
+        """Remove the pin file, so the newest version is served again"""
+        try:
+            (self.root / PIN_FILE).unlink()
+        except FileNotFoundError:
+            pass
+
+    def resume_batchers(self):
+        """Recreate the micro-batchers closed by :meth:`stop` (e.g. in a forked worker)"""
+        if self.batcher_fn is None:
+            return
+        for served in (self._active, self._previous):
+            if served is not None and served.batcher is None:
+                served.batcher = self.batcher_fn(served)
+
+    def start(self) -> 'ModelRegistry':
+        """
+        Start the watcher thread (no-op if already running)
+
+        Batchers that were stopped (see :meth:`stop`) are recreated first.
+        """
+        self.resume_batchers()
+        if self.is_running:
+            return self
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._watch_loop, name=f'model-registry-{self.name}',
+                                        daemon=True)
+        self._thread.start()
+        logger.info(f"Watching {self.root} for new '{self.name}' versions (every {self.interval:.0f}s)")
+        return self
+
+    def stop(self):
+        """
+        Stop the watcher thread and the micro-batchers (e.g. before fork)
+
+        Versions stay loaded; :meth:`resume_batchers` or :meth:`start` brings
+        the batchers back.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        self._thread = None
+        for served in (self._active, self._previous):
+            if served is not None:
+                served.close()
+
+    def _watch_loop(self):
+        """Poll the registry until stopped"""
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                self._last_error = str(e)
+                logger.error(f"Model registry '{self.name}' check failed: {e}")
+
+    def get_stats(self) -> Dict:
+        """
+        Get registry status
+
+        Returns:
+            Dictionary with the active and previous versions, available
+            versions, pin, swap/rollback counters and the last error
+        """
+        active, previous = self._active, self._previous
+        return {
+            'root': str(self.root),
+            'active': active.describe() if active is not None else None,
+            'previous': previous.describe() if previous is not None else None,
+            'available': self.versions(),
+            'pinned': self.pinned(),
+            'watching': self.is_running,
+            'poll_interval_seconds': self.interval,
+            'swaps': self._swaps,
+            'rollbacks': self._rollbacks,
+            'load_failures': self._load_failures,
+            'last_error': self._last_error,
+            'last_check': self._last_check.isoformat() if self._last_check else None
+        }
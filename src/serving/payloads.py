@@ -0,0 +1,239 @@
+"""
+Tensor Payload Encodings
+Compact binary request/response bodies for the prediction endpoints
+"""
+
+import io
+import struct
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    import msgpack
+except ImportError:  # msgpack payloads are optional
+    msgpack = None
+
+
+JSON_CONTENT_TYPE = 'application/json'
+RAW_CONTENT_TYPE = 'application/octet-stream'
+NPY_CONTENT_TYPE = 'application/x-npy'
+MSGPACK_CONTENT_TYPE = 'application/x-msgpack'
+
+# Accepted aliases for each binary encoding
+CONTENT_TYPE_ALIASES = {
+    'application/octet-stream': RAW_CONTENT_TYPE,
+    'application/x-float32': RAW_CONTENT_TYPE,
+    'application/x-npy': NPY_CONTENT_TYPE,
+    'application/npy': NPY_CONTENT_TYPE,
+    'application/x-msgpack': MSGPACK_CONTENT_TYPE,
+    'application/msgpack': MSGPACK_CONTENT_TYPE,
+    'application/vnd.msgpack': MSGPACK_CONTENT_TYPE,
+}
+
+BINARY_CONTENT_TYPES = set(CONTENT_TYPE_ALIASES)
+
+# Offered response types in order of preference (JSON stays the default)
+RESPONSE_CONTENT_TYPES = [JSON_CONTENT_TYPE, RAW_CONTENT_TYPE, NPY_CONTENT_TYPE, MSGPACK_CONTENT_TYPE]
+
+# Raw float32 header: little-endian uint32 ndim followed by ndim uint32 dims
+_RAW_NDIM = struct.Struct('<I')
+_FLOAT32_LE = np.dtype('<f4')
+
+# Element kinds that convert to float32 without loss of meaning (bool, ints, floats)
+_NUMERIC_KINDS = 'biuf'
+
+
+class PayloadError(ValueError):
+    """Raised when a binary request body cannot be decoded"""
+
+
+def canonical_content_type(mimetype: Optional[str]) -> Optional[str]:
+    """Map a request mimetype to its canonical binary encoding (None for JSON/other)"""
+    if not mimetype:
+        return None
+    return CONTENT_TYPE_ALIASES.get(mimetype.split(';')[0].strip().lower())
+
+
+def _check_dtype(dtype: np.dtype):
+    """Reject element types that are not plain real numbers"""
+    if dtype.kind not in _NUMERIC_KINDS:
+        raise PayloadError(f'Unsupported tensor dtype: {dtype}')
+
+
+def _as_float32(array: np.ndarray) -> np.ndarray:
+    """Return the array as little-endian float32, copying only when required"""
+    if array.dtype == _FLOAT32_LE:
+        return array
+    return array.astype(_FLOAT32_LE)
+
+
+def decode_raw(body: bytes) -> np.ndarray:
+    """
+    Decode a raw little-endian float32 tensor with a shape header
+
+    Layout: uint32 ndim, ndim x uint32 dims, then prod(dims) float32 values.
+    """
+    buffer = memoryview(body)
+    if len(buffer) < _RAW_NDIM.size:
+        raise PayloadError('Raw payload is missing its shape header')
+
+    (ndim,) = _RAW_NDIM.unpack_from(buffer, 0)
+    if ndim < 1 or ndim > 8:
+        raise PayloadError(f'Invalid number of dimensions in raw payload: {ndim}')
+
+    header_size = _RAW_NDIM.size * (1 + ndim)
+    if len(buffer) < header_size:
+        raise PayloadError('Raw payload shape header is truncated')
+    shape = struct.unpack_from(f'<{ndim}I', buffer, _RAW_NDIM.size)
+
+    count = int(np.prod(shape))
+    if len(buffer) - header_size != count * _FLOAT32_LE.itemsize:
+        raise PayloadError(f'Raw payload size does not match shape {tuple(shape)}')
+
+    return np.frombuffer(buffer, dtype=_FLOAT32_LE, count=count, offset=header_size).reshape(shape)
+
+
+def encode_raw(array: np.ndarray) -> bytes:
+    """Encode an array as raw little-endian float32 with a shape header"""
+    array = np.ascontiguousarray(_as_float32(np.asarray(array)))
+    header = struct.pack(f'<{1 + array.ndim}I', array.ndim, *array.shape)
+    return header + array.tobytes()
+
+
+def decode_npy(body: bytes) -> np.ndarray:
+    """Decode a .npy file body without copying the data section"""
+    stream = io.BytesIO(body)
+    try:
+        version = np.lib.format.read_magic(stream)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    except ValueError as e:
+        raise PayloadError(f'Invalid .npy payload: {e}')
+
+    _check_dtype(dtype)
+
+    count = int(np.prod(shape))
+    offset = stream.tell()
+    if len(body) - offset != count * dtype.itemsize:
+        raise PayloadError(f'.npy payload size does not match shape {tuple(shape)}')
+
+    array = np.frombuffer(body, dtype=dtype, count=count, offset=offset)
+    array = array.reshape(shape, order='F' if fortran_order else 'C')
+    return _as_float32(array)
+
+
+def encode_npy(array: np.ndarray) -> bytes:
+    """Encode an array as a .npy file body"""
+    stream = io.BytesIO()
+    np.save(stream, _as_float32(np.asarray(array)), allow_pickle=False)
+    return stream.getvalue()
+
+
+def _msgpack_decode_hook(obj):
+    """Rebuild msgpack-numpy encoded arrays as zero-copy views"""
+    # msgpack-numpy writes its keys as bin (bytes); accept str keys as well
+    fields = {key.decode() if isinstance(key, bytes) else key: value for key, value in obj.items()}
+    if fields.get('nd') is not True:
+        return obj
+
+    descr = fields['type']
+    dtype = np.dtype(descr.decode() if isinstance(descr, bytes) else descr)
+    _check_dtype(dtype)
+    return np.frombuffer(fields['data'], dtype=dtype).reshape(fields['shape'])
+
+
+def _msgpack_encode_hook(obj):
+    """Encode numpy arrays in msgpack-numpy's wire format"""
+    if isinstance(obj, np.ndarray):
+        array = np.ascontiguousarray(obj)
+        return {b'nd': True, b'type': array.dtype.str, b'kind': b'',
+                b'shape': list(array.shape), b'data': array.tobytes()}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return obj
+
+
+def decode_msgpack(body: bytes):
+    """Decode a msgpack(-numpy) body"""
+    if msgpack is None:
+        raise PayloadError('msgpack payloads require the msgpack package')
+    try:
+        return msgpack.unpackb(body, object_hook=_msgpack_decode_hook, raw=False,
+                               strict_map_key=False)
+    except PayloadError:
+        raise
+    except Exception as e:
+        raise PayloadError(f'Invalid msgpack payload: {e}')
+
+
+def encode_msgpack(obj) -> bytes:
+    """Encode an object (arrays included) as msgpack-numpy"""
+    if msgpack is None:
+        raise PayloadError('msgpack payloads require the msgpack package')
+    return msgpack.packb(obj, default=_msgpack_encode_hook, use_bin_type=True)
+
+
+def decode_tensor_request(body: bytes, content_type: str, field: str = 'data') -> Tuple[np.ndarray, Dict]:
+    """
+    Decode a binary prediction request
+
+    Args:
+        body: Raw request body
+        content_type: Canonical content type (see canonical_content_type)
+        field: Key holding the tensor when a msgpack map is sent
+
+    Returns:
+        Tuple of (float32 tensor, extra request options such as threshold)
+    """
+    if content_type == RAW_CONTENT_TYPE:
+        return decode_raw(body), {}
+
+    if content_type == NPY_CONTENT_TYPE:
+        return decode_npy(body), {}
+
+    if content_type == MSGPACK_CONTENT_TYPE:
+        payload = decode_msgpack(body)
+        options = {}
+        if isinstance(payload, dict):
+            options = {key: value for key, value in payload.items() if key != field}
+            if field not in payload:
+                raise PayloadError(f'Missing "{field}" field')
+            payload = payload[field]
+        if not isinstance(payload, np.ndarray):
+            try:
+                payload = np.asarray(payload, dtype=_FLOAT32_LE)
+            except (TypeError, ValueError) as e:
+                raise PayloadError(f'"{field}" is not a numeric tensor: {e}')
+        return _as_float32(payload), options
+
+    raise PayloadError(f'Unsupported content type: {content_type}')
+
+
+def encode_prediction_response(probabilities: np.ndarray, alerts: np.ndarray,
+                               threshold: float, content_type: str) -> bytes:
+    """
+    Encode prediction results for a binary response
+
+    Raw and .npy responses carry only the probability vector (the threshold is
+    sent as a header by the caller); msgpack responses carry the full result.
+    """
+    probabilities = _as_float32(np.asarray(probabilities).reshape(-1))
+
+    if content_type == RAW_CONTENT_TYPE:
+        return encode_raw(probabilities)
+
+    if content_type == NPY_CONTENT_TYPE:
+        return encode_npy(probabilities)
+
+    if content_type == MSGPACK_CONTENT_TYPE:
+        return encode_msgpack({
+            'success': True,
+            'probabilities': probabilities,
+            'alerts': _as_float32(np.asarray(alerts)),
+            'threshold': float(threshold)
+        })
+
+    raise PayloadError(f'Unsupported content type: {content_type}')
@@ -0,0 +1,118 @@
+"""
+Event Prediction Cache
+In-process LRU/TTL cache of per-event model outputs
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+from loguru import logger
+
+
+class PredictionCache:
+    """
+    LRU cache with a time-to-live for per-event predictions
+
+    Entries are keyed by event id plus the event's last-update timestamp,
+    so a revised event (e.g. a magnitude revision) misses the cache and is
+    re-scored while unchanged events are served from memory.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 3600.0, name: str = 'predictions'):
+        """
+        Initialize prediction cache
+
+        Args:
+            max_entries: Maximum number of cached events (least recently used are evicted)
+            ttl_seconds: Maximum age of an entry (0 disables expiry)
+            name: Name used in log messages
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.ttl = max(0.0, float(ttl_seconds))
+        self.name = name
+
+        self._entries: 'OrderedDict[Hashable, Tuple[float, object]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get_many(self, keys: Iterable[Hashable]) -> Tuple[Dict[Hashable, object], List[Hashable]]:
+        """
+        Look up several keys at once
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Tuple of (hits as {key: value}, list of missing keys)
+        """
+        now = time.monotonic()
+        hits = {}
+        misses = []
+
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and self.ttl and now - entry[0] > self.ttl:
+                    del self._entries[key]
+                    self._expirations += 1
+                    entry = None
+
+                if entry is None:
+                    misses.append(key)
+                    self._misses += 1
+                else:
+                    self._entries.move_to_end(key)
+                    hits[key] = entry[1]
+                    self._hits += 1
+
+        return hits, misses
+
+    def put_many(self, items: Dict[Hashable, object]):
+        """Store several entries, evicting the least recently used beyond max_entries"""
+        now = time.monotonic()
+        with self._lock:
+            for key, value in items.items():
+                self._entries[key] = (now, value)
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, reason: str = ''):
+        """Drop every entry (e.g. after the model was reloaded)"""
+        with self._lock:
+            dropped = len(self._entries)
+            self._entries.clear()
+            self._invalidations += 1
+        logger.info(f"Prediction cache '{self.name}' invalidated ({dropped} entries)"
+                    f"{': ' + reason if reason else ''}")
+
+    def get_stats(self) -> Dict:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with size, hit/miss counters and hit rate
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else None,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'invalidations': self._invalidations
+            }
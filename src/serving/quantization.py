@@ -0,0 +1,142 @@
+"""
+Quantization Evaluation
+Accuracy, size and latency comparison of quantized models against the float model
+"""
+
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+
+def classification_metrics(probabilities: np.ndarray, labels: np.ndarray, threshold: float) -> Dict:
+    """
+    Alert metrics at the operating threshold
+
+    Args:
+        probabilities: Tsunami probabilities (n,)
+        labels: Binary ground truth (n,)
+        threshold: Alert threshold
+
+    Returns:
+        Dictionary with AUC, recall, precision and alert counts
+    """
+    from sklearn.metrics import roc_auc_score
+
+    probabilities = np.asarray(probabilities).reshape(-1)
+    labels = np.asarray(labels).reshape(-1).astype(bool)
+    alerts = probabilities > threshold
+
+    positives = int(labels.sum())
+    true_alerts = int(np.sum(alerts & labels))
+
+    return {
+        'auc': float(roc_auc_score(labels, probabilities)) if 0 < positives < len(labels) else None,
+        'recall': true_alerts / positives if positives else None,
+        'precision': true_alerts / int(alerts.sum()) if alerts.any() else None,
+        'positives': positives,
+        'missed_positives': positives - true_alerts,
+        'false_alarms': int(np.sum(alerts & ~labels))
+    }
+
+
+def measure_latency(backend, samples: np.ndarray, runs: int = 200) -> Dict:
+    """
+    Per-sample CPU latency at batch size 1
+
+    Args:
+        backend: Loaded backend exposing predict(samples)
+        samples: Windows to cycle through (n, timesteps, features)
+        runs: Number of timed single-sample calls
+
+    Returns:
+        Dictionary with p50, p95 and mean latency in milliseconds
+    """
+    samples = np.asarray(samples, dtype=np.float32)
+    backend.predict(samples[:1])
+
+    timings = []
+    for i in range(runs):
+        window = samples[i % len(samples)][np.newaxis]
+        start = time.perf_counter()
+        backend.predict(window)
+        timings.append((time.perf_counter() - start) * 1000.0)
+
+    return {
+        'p50_ms': round(float(np.percentile(timings, 50)), 4),
+        'p95_ms': round(float(np.percentile(timings, 95)), 4),
+        'mean_ms': round(float(np.mean(timings)), 4)
+    }
+
+
+def evaluate_model(backend, model_path, X: np.ndarray, y: np.ndarray,
+                   threshold: float, latency_runs: int = 200) -> Dict:
+    """
+    Evaluate one model artifact
+
+    Args:
+        backend: Loaded backend for the artifact
+        model_path: Artifact path (for the size measurement)
+        X: Evaluation windows
+        y: Evaluation labels
+        threshold: Alert threshold
+        latency_runs: Number of timed single-sample calls
+
+    Returns:
+        Evaluation dictionary; the raw probabilities are kept under
+        'probabilities' for regression checks and dropped from reports
+    """
+    probabilities = np.asarray(backend.predict(X)).reshape(-1)
+    return {
+        'model_path': str(model_path),
+        'size_kb': round(Path(model_path).stat().st_size / 1024, 1),
+        **classification_metrics(probabilities, y, threshold),
+        'latency': measure_latency(backend, X, runs=latency_runs),
+        'probabilities': probabilities
+    }
+
+
+def check_regression(reference: Dict, candidate: Dict, y: np.ndarray,
+                     threshold: float, max_recall_drop: float = 0.0) -> Dict:
+    """
+    Compare a quantized model against the float reference
+
+    The gate is recall on tsunami positives: the candidate passes only if
+    its recall drops by at most ``max_recall_drop`` and, with the default of
+    zero, it misses no positive that the float model catches.
+
+    Args:
+        reference: evaluate_model result for the float model
+        candidate: evaluate_model result for the quantized model
+        y: Evaluation labels
+        threshold: Alert threshold
+        max_recall_drop: Allowed absolute recall drop
+
+    Returns:
+        Dictionary with deltas against the reference and pass/fail
+    """
+    labels = np.asarray(y).reshape(-1).astype(bool)
+    reference_alerts = reference['probabilities'] > threshold
+    candidate_alerts = candidate['probabilities'] > threshold
+
+    newly_missed = int(np.sum(labels & reference_alerts & ~candidate_alerts))
+    recall_drop = (reference['recall'] or 0.0) - (candidate['recall'] or 0.0)
+    diff = np.abs(candidate['probabilities'] - reference['probabilities'])
+
+    passed = recall_drop <= max_recall_drop + 1e-12
+    if max_recall_drop == 0:
+        passed = passed and newly_missed == 0
+
+    return {
+        'recall_drop': round(recall_drop, 6),
+        'auc_drop': (round(reference['auc'] - candidate['auc'], 6)
+                     if reference['auc'] is not None and candidate['auc'] is not None else None),
+        'newly_missed_positives': newly_missed,
+        'alert_mismatches': int(np.sum(reference_alerts != candidate_alerts)),
+        'max_abs_diff': float(diff.max()) if len(diff) else 0.0,
+        'size_ratio': round(candidate['size_kb'] / reference['size_kb'], 3),
+        'latency_speedup': round(reference['latency']['p50_ms'] / candidate['latency']['p50_ms'], 2),
+        'max_recall_drop': max_recall_drop,
+        'passed': bool(passed)
+    }
@@ -0,0 +1,161 @@
+"""
+Seismic Pattern Generator
+Vectorized (24, 32) model inputs built from earthquake parameters
+"""
+
+import hashlib
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+
+PATTERN_SHAPE = (24, 32)
+
+# Amplitude of the additive Gaussian noise
+NOISE_SCALE = 0.05
+
+# Depth at which the surface impact factor bottoms out (km)
+MAX_DEPTH_KM = 700.0
+
+# Catalog columns a pattern is built from
+PARAMETER_COLUMNS = ('magnitude', 'depth', 'latitude', 'longitude')
+
+_TIMESTEPS = np.arange(PATTERN_SHAPE[0], dtype=np.float64)
+_FREQUENCIES = np.arange(PATTERN_SHAPE[1], dtype=np.float64)
+
+# (24, 32) shape template shared by every event: 0.3 + 0.5 * time evolution
+# (waves build up over the window) + 0.2 * frequency component
+_TEMPLATE = (
+    0.3
+    + 0.5 * (np.sin(_TIMESTEPS * np.pi / 24) * (_TIMESTEPS / 24))[:, np.newaxis]
+    + 0.2 * np.cos(2 * np.pi * _FREQUENCIES / 32)[np.newaxis, :]
+)
+
+
+def event_seed(event_id) -> int:
+    """
+    Stable 64-bit seed for an event
+
+    Uses blake2b rather than hash() so the seed is identical across
+    processes and Python versions.
+    """
+    digest = hashlib.blake2b(str(event_id).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def _event_noise(event_ids: Sequence, noise_scale: float) -> np.ndarray:
+    """Per-event noise that depends only on the event id"""
+    noise = np.empty((len(event_ids), *PATTERN_SHAPE), dtype=np.float64)
+    for i, event_id in enumerate(event_ids):
+        noise[i] = np.random.default_rng(event_seed(event_id)).standard_normal(PATTERN_SHAPE)
+    return noise * noise_scale
+
+
+def complete_mask(magnitude, depth, latitude, longitude) -> np.ndarray:
+    """
+    Flag events that have every pattern parameter
+
+    Args:
+        magnitude, depth, latitude, longitude: Scalars or arrays of N values;
+            None and NaN count as missing
+
+    Returns:
+        Boolean array of N, True where all four values are finite
+    """
+    values = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(column, dtype=np.float64))
+          for column in (magnitude, depth, latitude, longitude))
+    )
+    return np.logical_and.reduce([np.isfinite(column) for column in values])
+
+
+def catalog_complete_mask(catalog) -> np.ndarray:
+    """complete_mask for the rows of an earthquake catalog DataFrame"""
+    return complete_mask(*(catalog[column].to_numpy(dtype=np.float64, na_value=np.nan)
+                           for column in PARAMETER_COLUMNS))
+
+
+def create_seismic_patterns(magnitude, depth, latitude, longitude,
+                            event_ids: Optional[Sequence] = None,
+                            rng: Union[np.random.Generator, int, None] = None,
+                            noise_scale: float = NOISE_SCALE) -> np.ndarray:
+    """
+    Create synthetic seismic patterns for N earthquakes at once
+
+    Args:
+        magnitude: Magnitudes (scalar or array of N)
+        depth: Depths in km (scalar or array of N)
+        latitude: Latitudes (scalar or array of N)
+        longitude: Longitudes (scalar or array of N)
+        event_ids: Optional event ids; when given, each event's noise is
+            seeded from its id so the same event always yields the same
+            tensor, whatever batch it is generated in
+        rng: Generator or integer seed for the unseeded mode (one draw
+            for the whole batch)
+        noise_scale: Standard deviation of the additive noise
+
+    Returns:
+        Float32 array of shape (N, 24, 32) with values clipped to [0, 1]
+
+    Raises:
+        ValueError: If an event is missing its magnitude, depth or
+            coordinates (filter with complete_mask first)
+    """
+    magnitude, depth, latitude, longitude = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(values, dtype=np.float64))
+          for values in (magnitude, depth, latitude, longitude))
+    )
+    count = len(magnitude)
+
+    # A NaN parameter would yield an all-NaN pattern that still gets scored
+    incomplete = int(count - complete_mask(magnitude, depth, latitude, longitude).sum())
+    if incomplete:
+        raise ValueError(f"{incomplete} of {count} earthquakes are missing their magnitude, "
+                         f"depth or coordinates")
+
+    # Magnitude sets the amplitude, shallow events have more surface impact
+    magnitude_factor = magnitude / 10.0
+    depth_factor = np.maximum(0.1, 1.0 - depth / MAX_DEPTH_KM)
+    base = (magnitude_factor * depth_factor)[:, np.newaxis, np.newaxis]
+
+    patterns = base * _TEMPLATE
+
+    if noise_scale:
+        if event_ids is not None:
+            if len(event_ids) != count:
+                raise ValueError(f"Got {len(event_ids)} event ids for {count} earthquakes")
+            patterns += _event_noise(event_ids, noise_scale)
+        else:
+            generator = rng if isinstance(rng, np.random.Generator) else np.random.default_rng(rng)
+            patterns += generator.standard_normal((count, *PATTERN_SHAPE)) * noise_scale
+
+    return np.clip(patterns, 0, 1.0).astype(np.float32)
+
+
+def patterns_from_catalog(catalog, seeded: bool = True,
+                          id_column: str = 'id', **kwargs) -> np.ndarray:
+    """
+    Create patterns for every event of an earthquake catalog
+
+    Args:
+        catalog: DataFrame with magnitude, depth, latitude and longitude
+            columns (as returned by USGSCollector)
+        seeded: Seed each event's noise from its id (needs id_column)
+        id_column: Column holding the event id
+        **kwargs: Passed to create_seismic_patterns
+
+    Returns:
+        Float32 array of shape (len(catalog), 24, 32)
+
+    Raises:
+        ValueError: If a row is missing a parameter (drop those rows with
+            catalog_complete_mask first)
+    """
+    return create_seismic_patterns(
+        catalog['magnitude'].to_numpy(),
+        catalog['depth'].to_numpy(),
+        catalog['latitude'].to_numpy(),
+        catalog['longitude'].to_numpy(),
+        event_ids=catalog[id_column].tolist() if seeded else None,
+        **kwargs
+    )
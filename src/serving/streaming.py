@@ -0,0 +1,140 @@
+"""
+Streaming Batch Scoring
+Incremental readers and writers for chunked /batch-predict jobs
+"""
+
+import json
+import struct
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .payloads import PayloadError, decode_raw, encode_raw
+
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+FRAMES_CONTENT_TYPE = 'application/x-tensor-frames'
+
+STREAM_CONTENT_TYPE_ALIASES = {
+    'application/x-ndjson': NDJSON_CONTENT_TYPE,
+    'application/ndjson': NDJSON_CONTENT_TYPE,
+    'application/jsonlines': NDJSON_CONTENT_TYPE,
+    'application/x-tensor-frames': FRAMES_CONTENT_TYPE,
+    'application/octet-stream': FRAMES_CONTENT_TYPE,
+}
+
+# Each binary frame is a little-endian uint32 byte length followed by a raw
+# float32 tensor (see payloads.encode_raw) holding one or more samples
+_FRAME_LENGTH = struct.Struct('<I')
+
+# A zero-length frame marks a complete stream
+END_OF_STREAM_FRAME = _FRAME_LENGTH.pack(0)
+
+# Refuse frames above this size so one frame cannot defeat the memory bound
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+
+def canonical_stream_type(mimetype: Optional[str]) -> Optional[str]:
+    """Map a request mimetype to a streaming encoding (None if unsupported)"""
+    if not mimetype:
+        return None
+    return STREAM_CONTENT_TYPE_ALIASES.get(mimetype.split(';')[0].strip().lower())
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    """Read exactly size bytes (b'' at a clean end of stream)"""
+    parts = []
+    remaining = size
+    while remaining > 0:
+        data = stream.read(remaining)
+        if not data:
+            break
+        parts.append(data)
+        remaining -= len(data)
+
+    if remaining and remaining != size:
+        raise PayloadError('Stream ended in the middle of a frame')
+    return b''.join(parts)
+
+
+def iter_ndjson_samples(stream: BinaryIO, field: str = 'sample') -> Iterator[np.ndarray]:
+    """
+    Yield sample arrays from an NDJSON stream
+
+    Each line is either a nested list or an object with the tensor under
+    ``field``; a line may hold one sample or a small batch of samples.
+    """
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise PayloadError(f'Invalid JSON on line {line_number}: {e}')
+        if isinstance(record, dict):
+            if field not in record:
+                raise PayloadError(f'Missing "{field}" field on line {line_number}')
+            record = record[field]
+        yield np.asarray(record, dtype=np.float32)
+
+
+def iter_frame_samples(stream: BinaryIO) -> Iterator[np.ndarray]:
+    """Yield sample arrays from length-prefixed raw float32 frames until EOF or an empty frame"""
+    while True:
+        header = _read_exact(stream, _FRAME_LENGTH.size)
+        if not header:
+            return
+        (length,) = _FRAME_LENGTH.unpack(header)
+        if length == 0:
+            return
+        if length > MAX_FRAME_BYTES:
+            raise PayloadError(f'Frame of {length} bytes exceeds the {MAX_FRAME_BYTES} byte limit')
+        body = _read_exact(stream, length)
+        if len(body) != length:
+            raise PayloadError('Stream ended in the middle of a frame')
+        yield decode_raw(body)
+
+
+def iter_chunks(samples: Iterator[np.ndarray],
+                chunk_size: int,
+                sample_shape: Tuple[int, ...]) -> Iterator[np.ndarray]:
+    """
+    Group incoming samples into fixed-size chunks
+
+    A single (chunk_size, *sample_shape) buffer is reused for every chunk, so
+    memory stays bounded by the chunk size regardless of job length. Each
+    yielded view is only valid until the next chunk is requested.
+    """
+    buffer = np.empty((chunk_size, *sample_shape), dtype=np.float32)
+    filled = 0
+
+    for array in samples:
+        if array.shape == sample_shape:
+            array = array[np.newaxis]
+        if array.shape[1:] != sample_shape:
+            raise PayloadError(f'Expected samples of shape {sample_shape}, got {array.shape}')
+
+        offset = 0
+        while offset < len(array):
+            take = min(chunk_size - filled, len(array) - offset)
+            buffer[filled:filled + take] = array[offset:offset + take]
+            filled += take
+            offset += take
+            if filled == chunk_size:
+                yield buffer
+                filled = 0
+
+    if filled:
+        yield buffer[:filled]
+
+
+def encode_ndjson_line(record: dict) -> bytes:
+    """Encode one NDJSON output record"""
+    return (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def encode_frame(array: np.ndarray) -> bytes:
+    """Encode an array as one length-prefixed raw float32 frame"""
+    body = encode_raw(array)
+    return _FRAME_LENGTH.pack(len(body)) + body
@@ -0,0 +1,63 @@
+"""
+Worker Settings
+Process, thread and model thread-pool sizing for the pre-fork server
+"""
+
+import os
+from typing import Dict, Optional
+
+
+# Runtimes whose loaded models survive fork(). TensorFlow's thread pools do
+# not: a Keras model loaded in the gunicorn master deadlocks in the workers,
+# so it is loaded in each worker instead.
+FORK_SAFE_BACKENDS = ('onnx', 'tflite')
+
+
+def _count(value, default: int) -> int:
+    """Positive integer from a config or env value ('auto'/None -> default)"""
+    if value is None or str(value).strip().lower() in ('', 'auto'):
+        return default
+    return max(1, int(value))
+
+
+def resolve_worker_settings(config: Optional[Dict] = None, workers: Optional[int] = None,
+                            cpu_count: Optional[int] = None) -> Dict:
+    """
+    Resolve the serving.workers block
+
+    Worker processes default to one per core, and each worker's model gets
+    an even share of the cores for its intra-op pool, so N workers never
+    run more than N x intra_op_threads compute threads. WORKERS, THREADS
+    and ASGI environment variables override the config.
+
+    Args:
+        config: serving.workers options: count, threads, worker_class,
+            timeout_seconds, preload, intra_op_threads, inter_op_threads, asgi
+        workers: Worker count to size the thread pools for (default: resolved
+            from the config; pass 1 for a single-process server)
+        cpu_count: Cores to plan for (default: os.cpu_count())
+
+    Returns:
+        Dictionary with workers, threads, worker_class, timeout, preload,
+        intra_op_threads, inter_op_threads and asgi (serve asgi.py on uvicorn
+        workers instead of the WSGI app)
+    """
+    config = config or {}
+    cores = cpu_count or os.cpu_count() or 1
+
+    if workers is None:
+        workers = _count(os.environ.get('WORKERS') or config.get('count'), cores)
+    threads = _count(os.environ.get('THREADS') or config.get('threads'), 4)
+    asgi = os.environ.get('ASGI')
+    asgi = config.get('asgi', False) if asgi is None else asgi.strip().lower() in ('1', 'true', 'yes')
+
+    return {
+        'workers': workers,
+        'threads': threads,
+        'worker_class': config.get('worker_class', 'gthread'),
+        'timeout': int(config.get('timeout_seconds', 120)),
+        'preload': bool(config.get('preload', True)),
+        'intra_op_threads': _count(config.get('intra_op_threads'), max(1, cores // workers)),
+        'inter_op_threads': _count(config.get('inter_op_threads'), 1),
+        'asgi': bool(asgi)
+    }
@@ -99,6 +99,38 @@ def create_sample_dataset(output_dir: str = 'data/raw', n_samples: int = 1000):
     logger.success(f"Created synthetic dataset: {output_file}")
 
 
+def create_synthetic_windows(n_samples: int = 2000,
+                             n_timesteps: int = 24,
+                             n_features: int = 32,
+                             positive_ratio: float = 0.4,
+                             seed: int = 42):
+    """
+    Create synthetic (timesteps, features) windows for the binary model
+    
+    Mirrors the training notebook: Gaussian windows with positive (tsunami)
+    samples amplified by 1.5. Used as a reference/representative set when
+    exporting, quantizing or comparing inference backends.
+    
+    Args:
+        n_samples: Number of windows
+        n_timesteps: Timesteps per window
+        n_features: Features per timestep
+        positive_ratio: Fraction of positive samples
+        seed: Random seed
+        
+    Returns:
+        Tuple of (X float32 array (n, timesteps, features), y float32 array (n, 1))
+    """
+    import numpy as np
+    
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((n_samples, n_timesteps, n_features)).astype(np.float32)
+    y = (rng.random(n_samples) < positive_ratio).astype(np.float32).reshape(-1, 1)
+    X[y.flatten() == 1] *= 1.5
+    
+    return X, y
+
+
 def download_gebco_bathymetry_info():
     """
     Provide information about downloading GEBCO bathymetry data
@@ -9,6 +9,8 @@ from datetime import datetime
 import threading
 
 from ..inference_engine import RealTimeInferenceEngine
+from ..data_collection.ocean_conditions import summarize_ocean_conditions
+from ..serving.http_caching import make_etag, etag_matches, not_modified
 
 api_bp = Blueprint('api', __name__)
 
@@ -73,10 +75,18 @@ def get_current_assessment():
                 }
             }), 200
         
-        return jsonify({
+        # A published assessment gets a new id (and timestamp) whenever its events or
+        # sources change, so the id is the version
+        etag = make_etag('assessment', assessment.get('assessment_id'), assessment.get('timestamp'))
+        if etag_matches(etag):
+            return not_modified(etag)
+        
+        response = jsonify({
             'success': True,
             'data': assessment
-        }), 200
+        })
+        response.set_etag(etag)
+        return response
     except Exception as e:
         logger.error(f"Error getting current assessment: {e}")
         return jsonify({
@@ -173,7 +183,7 @@ def stop_monitoring():
 @api_bp.route('/earthquake/recent', methods=['GET'])
 def get_recent_earthquakes():
     """
-    Get recent earthquakes from USGS
+    Get recent earthquakes from the shared USGS snapshot
     
     Query parameters:
         hours: Lookback period (default 24)
@@ -187,7 +197,7 @@ def get_recent_earthquakes():
         min_mag = request.args.get('min_magnitude', default=5.5, type=float)
         
         engine = get_inference_engine()
-        earthquakes = engine.usgs_collector.fetch_recent_earthquakes(hours=hours)
+        earthquakes = engine.get_recent_earthquakes(hours=hours, min_magnitude=min_mag)
         
         if earthquakes.empty:
             return jsonify({
@@ -198,14 +208,12 @@ def get_recent_earthquakes():
                 }
             }), 200
         
-        # Filter by magnitude
-        earthquakes = earthquakes[earthquakes['magnitude'] >= min_mag]
-        
         # Convert to JSON-serializable format
         eq_list = earthquakes.to_dict('records')
         for eq in eq_list:
-            if 'time' in eq and hasattr(eq['time'], 'isoformat'):
-                eq['time'] = eq['time'].isoformat()
+            for key in ('time', 'updated'):
+                if key in eq and hasattr(eq[key], 'isoformat'):
+                    eq[key] = eq[key].isoformat()
         
         return jsonify({
             'success': True,
@@ -233,39 +241,15 @@ def get_ocean_conditions():
     try:
         engine = get_inference_engine()
         
-        # Fetch tide data
-        tide_data = engine.noaa_tides_collector.fetch_all_stations(hours=6)
-        
-        # Fetch buoy data
-        buoy_data = engine.noaa_buoys_collector.fetch_all_buoys()
-        
-        # Analyze conditions
-        conditions = engine._analyze_ocean_conditions(tide_data, buoy_data)
-        
-        # Format response
-        tide_summary = {}
-        for station_id, df in tide_data.items():
-            if not df.empty:
-                tide_summary[station_id] = {
-                    'latest_reading': df.iloc[-1].to_dict(),
-                    'anomaly_score': engine.noaa_tides_collector.calculate_sea_level_anomaly(df)
-                }
-        
-        buoy_summary = {}
-        for station_id, df in buoy_data.items():
-            if not df.empty:
-                buoy_summary[station_id] = {
-                    'latest_reading': df.iloc[-1].to_dict(),
-                    'tsunami_signature': engine.noaa_buoys_collector.detect_tsunami_signature(df)
-                }
+        # Latest tide and buoy data from the engine's store (shared with monitoring)
+        data = engine.get_source_data(['noaa_tides', 'noaa_buoys'])
+        tide_data = data['noaa_tides'] or {}
+        buoy_data = data['noaa_buoys'] or {}
         
         return jsonify({
             'success': True,
-            'data': {
-                'conditions': conditions,
-                'tide_stations': tide_summary,
-                'buoy_stations': buoy_summary
-            }
+            'data': summarize_ocean_conditions(engine.noaa_tides_collector, engine.noaa_buoys_collector,
+                                               tide_data, buoy_data)
         }), 200
     except Exception as e:
         logger.error(f"Error fetching ocean conditions: {e}")
@@ -285,8 +269,8 @@ def get_incois_advisories():
     """
     try:
         engine = get_inference_engine()
-        advisories = engine.incois_collector.fetch_current_advisories()
-        risk_info = engine.incois_collector.get_india_specific_risk()
+        advisories = engine.get_source_data(['incois'])['incois'] or []
+        risk_info = engine.incois_collector.get_india_specific_risk(advisories)
         
         return jsonify({
             'success': True,
@@ -320,13 +304,21 @@ def get_alert_history():
         engine = get_inference_engine()
         history = engine.risk_assessor.get_alert_history(hours=hours)
         
-        return jsonify({
+        # History is append-only: the window's first and last alert identify it
+        etag = make_etag('alert-history', hours, len(history),
+                         [alert.get('timestamp') for alert in history[:1] + history[-1:]])
+        if etag_matches(etag):
+            return not_modified(etag)
+        
+        response = jsonify({
             'success': True,
             'data': {
                 'count': len(history),
                 'alerts': history
             }
-        }), 200
+        })
+        response.set_etag(etag)
+        return response
     except Exception as e:
         logger.error(f"Error fetching alert history: {e}")
         return jsonify({
@@ -10,6 +10,9 @@ from loguru import logger
 import sys
 from datetime import datetime
 
+from ..serving.http_caching import init_http_caching
+from ..utils import load_config
+
 # Configure loguru
 logger.remove()
 logger.add(sys.stdout, level="INFO")
@@ -40,6 +43,14 @@ def create_app(config_path='config/config.yaml'):
     # Allow all origins for /api endpoints and healthcheck.railway.app for /health
     CORS(app, resources={r"/api/*": {"origins": "*"}, r"/health": {"origins": "*"}})
     
+    # Compression and ETag revalidation for the polled API
+    try:
+        http_caching_config = load_config(config_path).get('serving', {}).get('http_caching', {})
+    except Exception as e:
+        logger.warning(f"Using default HTTP caching settings: {e}")
+        http_caching_config = {}
+    init_http_caching(app, http_caching_config)
+    
     logger.success("Flask application created successfully")
     
     return app
@@ -0,0 +1,27 @@
+"""
+Shared fixtures
+"""
+
+import pytest
+
+
+@pytest.fixture(scope='session')
+def tiny_keras_model(tmp_path_factory):
+    """
+    Small LSTM classifier with the binary model's (24, 32) input, saved as .keras
+
+    Returns:
+        Tuple of (model, path to the saved .keras file)
+    """
+    pytest.importorskip('tensorflow')
+    from tensorflow import keras
+
+    keras.utils.set_random_seed(7)
+    inputs = keras.Input((24, 32), name='combined_input')
+    hidden = keras.layers.LSTM(8)(inputs)
+    outputs = keras.layers.Dense(1, activation='sigmoid')(hidden)
+    model = keras.Model(inputs, outputs)
+
+    path = tmp_path_factory.mktemp('model') / 'tsunami_binary.keras'
+    model.save(path)
+    return model, path
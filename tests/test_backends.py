@@ -0,0 +1,67 @@
+"""
+Parity of the Keras, TFLite and ONNX inference backends
+"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('loguru')
+
+from src.serving.backends import backend_model_path, compare_backends, load_backend
+from src.serving.model_export import export_onnx, export_tflite
+
+
+def windows(count, seed=0):
+    return np.random.default_rng(seed).normal(size=(count, 24, 32)).astype(np.float32)
+
+
+@pytest.fixture(scope='module')
+def exported(tiny_keras_model):
+    """Backends loaded from the tiny model and its exports (ONNX only when installed)"""
+    model, path = tiny_keras_model
+    export_tflite(model, backend_model_path(path, 'tflite'))
+    names = ['keras', 'tflite']
+
+    try:
+        import onnxruntime  # noqa: F401
+        import tf2onnx  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        export_onnx(model, backend_model_path(path, 'onnx'))
+        names.append('onnx')
+
+    return {name: load_backend(name, path, buckets=(1, 4, 8)) for name in names}
+
+
+def test_tflite_agrees_with_keras(exported):
+    report = compare_backends({name: exported[name] for name in ('keras', 'tflite')}, windows(5))
+
+    assert report['passed'], report
+
+
+def test_onnx_agrees_with_keras(exported):
+    pytest.importorskip('onnxruntime')
+    pytest.importorskip('tf2onnx')
+
+    report = compare_backends({name: exported[name] for name in ('keras', 'onnx')}, windows(5))
+
+    assert report['passed'], report
+
+
+def test_backends_score_every_batch_size(exported):
+    # Sizes below, at and above the TFLite graph's batch and the Keras buckets
+    for count in (1, 3, 9):
+        reference = windows(count, seed=count)
+        expected = exported['keras'].predict(reference)
+        for name, backend in exported.items():
+            scores = backend.predict(reference)
+            assert scores.shape == (count, 1), name
+            np.testing.assert_allclose(scores, expected, atol=1e-4, err_msg=name)
+
+
+def test_missing_artifact_points_to_the_export_script(tmp_path):
+    with pytest.raises(FileNotFoundError, match='export_model.py'):
+        load_backend('onnx', tmp_path / 'missing.keras')
+    with pytest.raises(FileNotFoundError, match='quantize_model.py'):
+        load_backend('tflite', tmp_path / 'missing.keras', variant='int8')
@@ -0,0 +1,150 @@
+"""
+Tests for the escalated polling cadence around significant earthquakes
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip('loguru')
+
+from src import escalation
+from src.escalation import EscalationScheduler, parse_arrival_times
+
+NOW = datetime(2026, 10, 18, 12, 0)
+
+
+class Clock:
+    """Stands in for datetime in the escalation module with a settable utcnow()"""
+
+    def __init__(self, now):
+        self.now = now
+
+    def utcnow(self):
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock(NOW)
+    monkeypatch.setattr(escalation, 'datetime', clock)
+    return clock
+
+
+def make_scheduler(**kwargs):
+    return EscalationScheduler(
+        baseline_seconds={'usgs': 60.0, 'noaa_tides': 600.0},
+        escalated_seconds={'usgs': 10.0, 'noaa_tides': 60.0},
+        arrival_margin_hours=1, default_window_hours=3, decay_minutes=60, **kwargs
+    )
+
+
+def test_trigger_escalates_every_source_until_the_last_arrival(clock):
+    scheduler = make_scheduler()
+    assert scheduler.interval('usgs') == 60.0
+
+    assert scheduler.trigger('us_a', NOW, [NOW + timedelta(hours=1), NOW + timedelta(hours=2)])
+
+    assert scheduler.interval('usgs') == 10.0
+    assert scheduler.interval('noaa_tides') == 60.0
+    stats = scheduler.get_stats()
+    assert stats['state'] == 'escalated'
+    # Last arrival plus the one-hour margin
+    assert stats['escalated_until'] == (NOW + timedelta(hours=3)).isoformat()
+
+
+def test_trigger_without_arrivals_uses_the_default_window_from_origin_time(clock):
+    scheduler = make_scheduler()
+
+    assert scheduler.trigger('us_a', NOW - timedelta(hours=1))
+    assert scheduler.get_stats()['escalated_until'] == (NOW + timedelta(hours=2)).isoformat()
+
+    # An event whose window has already passed does not escalate
+    assert not scheduler.trigger('us_old', NOW - timedelta(hours=4))
+    assert 'us_old' not in scheduler.get_stats()['windows']
+
+
+def test_disabled_scheduler_never_escalates(clock):
+    scheduler = make_scheduler(enabled=False)
+
+    assert not scheduler.trigger('us_a', NOW)
+    assert scheduler.interval('usgs') == 60.0
+
+
+def test_revised_event_extends_its_window_but_never_shortens_it(clock):
+    scheduler = make_scheduler()
+    scheduler.trigger('us_a', NOW, [NOW + timedelta(hours=1)])
+    clock.advance(minutes=30)
+
+    assert scheduler.trigger('us_a', NOW, [NOW + timedelta(hours=4)])
+    window = scheduler.get_stats()['windows']['us_a']
+    assert window['start'] == NOW.isoformat()
+    assert window['end'] == (NOW + timedelta(hours=5)).isoformat()
+
+    assert not scheduler.trigger('us_a', NOW, [NOW + timedelta(hours=2)])
+    assert scheduler.get_stats()['windows']['us_a']['end'] == (NOW + timedelta(hours=5)).isoformat()
+
+
+def test_cadence_decays_linearly_back_to_baseline(clock):
+    scheduler = make_scheduler()
+    scheduler.trigger('us_a', NOW, [NOW])  # window closes at NOW + 1h
+
+    clock.advance(minutes=59)
+    assert scheduler.interval('usgs') == 10.0
+
+    clock.advance(minutes=1 + 15)
+    assert scheduler.interval('usgs') == pytest.approx(10.0 + 0.25 * 50.0)
+    clock.advance(minutes=15)
+    assert scheduler.interval('usgs') == pytest.approx(35.0)
+    assert scheduler.interval('noaa_tides') == pytest.approx(330.0)
+    assert scheduler.get_stats()['state'] == 'decaying'
+
+    clock.advance(minutes=30)
+    assert scheduler.interval('usgs') == 60.0
+    assert scheduler.get_stats()['windows'] == {}
+    assert scheduler.get_stats()['state'] == 'baseline'
+
+
+def test_parse_arrival_times_skips_unreadable_estimates():
+    arrivals = parse_arrival_times({'chennai': '2026-10-18 14:30 UTC', 'andaman': 'unknown', 'kochi': None})
+
+    assert arrivals == [datetime(2026, 10, 18, 14, 30)]
+
+
+@pytest.fixture
+def honolulu_time(monkeypatch):
+    """Run in a local timezone far from UTC (UTC-10)"""
+    if not hasattr(time, 'tzset'):
+        pytest.skip('time.tzset is not available')
+    monkeypatch.setenv('TZ', 'Pacific/Honolulu')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_usgs_event_times_are_utc_and_escalate_in_any_local_timezone(honolulu_time):
+    pytest.importorskip('pandas')
+    from src.data_collection.usgs_collector import features_to_dataframe
+
+    origin = datetime.utcnow().replace(microsecond=0) - timedelta(hours=1)
+    millis = int((origin - datetime(1970, 1, 1)).total_seconds() * 1000)
+    feature = {
+        'id': 'us_a',
+        'properties': {'mag': 7.5, 'time': millis, 'updated': millis + 60000,
+                       'place': 'Andaman Islands', 'type': 'earthquake'},
+        'geometry': {'coordinates': [92.7, 11.7, 20.0]}
+    }
+
+    row = features_to_dataframe([feature]).iloc[0]
+
+    assert row['time'].to_pydatetime() == origin
+    assert row['updated'].to_pydatetime() == origin + timedelta(minutes=1)
+    # One hour into a three-hour default window: escalated, measured against utcnow()
+    scheduler = make_scheduler()
+    assert scheduler.trigger('us_a', row['time'].to_pydatetime())
+    assert scheduler.interval('usgs') == 10.0
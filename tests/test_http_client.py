@@ -0,0 +1,271 @@
+"""
+Tests for the pooled HTTP client
+
+The requests session is replaced by a stub that plays back scripted
+responses, so retries, backoff and the per-host limits run offline.
+"""
+
+import io
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+requests = pytest.importorskip('requests')
+pytest.importorskip('loguru')
+http_client = pytest.importorskip('src.data_collection.http_client')
+
+HTTPClient = http_client.HTTPClient
+
+URL = 'https://earthquake.usgs.gov/fdsnws/event/1/query'
+
+
+def make_response(status=200, body=b'{}', headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.raw = io.BytesIO(body)
+    response.headers.update(headers or {})
+    response.elapsed = timedelta(milliseconds=5)
+    return response
+
+
+class StubSession:
+    """
+    requests.Session stand-in answering from a script
+
+    Each script item is a response or an exception to raise; calls past the
+    end of the script get the last item again.
+    """
+
+    def __init__(self, *script, delay=0.0):
+        self.script = list(script)
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None, headers=None, **kwargs):
+        with self._lock:
+            self.calls.append({'url': url, 'params': params, 'headers': dict(headers or {})})
+            item = self.script[min(len(self.calls), len(self.script)) - 1]
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            if isinstance(item, Exception):
+                raise item
+            return item
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Backoff delays the client slept for (without actually sleeping)"""
+    recorded = []
+    monkeypatch.setattr(http_client.time, 'sleep', recorded.append)
+    return recorded
+
+
+def make_client(session, **http_config):
+    client = HTTPClient({'system': {'max_api_retries': 3, 'http': {
+        'backoff_base_seconds': 0.5, 'backoff_max_seconds': 4.0, **http_config
+    }}})
+    client.session = session
+    return client
+
+
+def test_transient_failures_are_retried_with_backoff(sleeps):
+    session = StubSession(requests.exceptions.ConnectionError('reset'), make_response(503),
+                          make_response(200, b'ok'))
+    client = make_client(session)
+
+    response = client.get(URL)
+
+    assert response.status_code == 200
+    assert len(session.calls) == 3
+    # Full jitter: each delay is drawn from [0, base * 2^attempt]
+    assert len(sleeps) == 2
+    assert 0.0 <= sleeps[0] <= 0.5
+    assert 0.0 <= sleeps[1] <= 1.0
+
+    stats = client.get_stats()['hosts']['earthquake.usgs.gov']
+    assert stats['requests'] == 3
+    assert stats['retries'] == 2
+    assert stats['errors'] == 2
+
+
+def test_backoff_is_capped_and_honours_retry_after(monkeypatch):
+    client = make_client(StubSession())
+    monkeypatch.setattr(http_client.random, 'uniform', lambda low, high: high)
+
+    assert client._backoff(0) == 0.5
+    assert client._backoff(2) == 2.0
+    assert client._backoff(10) == 4.0
+    assert client._backoff(0, make_response(429, headers={'Retry-After': '3'})) == 3.0
+    assert client._backoff(0, make_response(429, headers={'Retry-After': '120'})) == 4.0
+
+
+def test_retry_budget_is_respected(sleeps):
+    session = StubSession(make_response(502))
+    client = make_client(session)
+
+    assert client.get(URL, max_retries=1).status_code == 502
+    assert len(session.calls) == 2
+
+    session.script = [requests.exceptions.ReadTimeout('slow')]
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        client.get(URL, max_retries=0)
+    assert len(session.calls) == 3
+
+
+def test_client_errors_are_not_retried(sleeps):
+    session = StubSession(make_response(404))
+    client = make_client(session)
+
+    assert client.get(URL).status_code == 404
+    assert len(session.calls) == 1
+    assert sleeps == []
+
+
+def test_concurrent_requests_per_host_are_capped():
+    session = StubSession(make_response(200), delay=0.05)
+    client = make_client(session, per_host_concurrency=2)
+
+    threads = [threading.Thread(target=client.get, args=(URL,)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(session.calls) == 6
+    assert session.max_active == 2
+    assert client.get_stats()['hosts']['earthquake.usgs.gov']['in_flight'] == 0
+
+
+def test_other_hosts_are_not_held_up_by_a_busy_one():
+    session = StubSession(make_response(200), delay=0.2)
+    client = make_client(session, per_host_concurrency=1)
+
+    busy = threading.Thread(target=client.get, args=(URL,))
+    busy.start()
+    time.sleep(0.05)
+    start = time.monotonic()
+    client.get('https://www.ndbc.noaa.gov/data/realtime2/23401.txt')
+    busy.join()
+
+    assert time.monotonic() - start < 0.35
+    assert session.max_active == 2
+
+
+def test_waiting_for_a_host_slot_times_out():
+    session = StubSession(make_response(200), delay=0.5)
+    client = make_client(session, per_host_concurrency=1)
+
+    busy = threading.Thread(target=client.get, args=(URL,))
+    busy.start()
+    time.sleep(0.05)
+    try:
+        with pytest.raises(requests.exceptions.ConnectTimeout, match='connection slot'):
+            client.get(URL, timeout=0.05)
+    finally:
+        busy.join()
+
+    assert len(session.calls) == 1
+
+
+class CountingParser:
+    """parse callback recording how often it ran"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, response):
+        self.calls += 1
+        return {'body': response.content.decode(), 'parse': self.calls}
+
+
+def test_not_modified_reuses_the_parse_via_etag(sleeps):
+    session = StubSession(make_response(200, b'feed-v1', {'ETag': '"v1"'}), make_response(304))
+    client = make_client(session)
+    parse = CountingParser()
+
+    first = client.get_conditional(URL, parse, params={'minmagnitude': 4}, source='usgs')
+    second = client.get_conditional(URL, parse, params={'minmagnitude': 4}, source='usgs')
+
+    assert second is first
+    assert parse.calls == 1
+    assert 'If-None-Match' not in session.calls[0]['headers']
+    assert session.calls[1]['headers']['If-None-Match'] == '"v1"'
+    assert 'If-Modified-Since' not in session.calls[1]['headers']
+
+    stats = client.get_stats()['conditional']['usgs']
+    assert stats['not_modified'] == 1
+    assert stats['bytes_saved'] == len(b'feed-v1')
+
+
+def test_not_modified_reuses_the_parse_via_last_modified(sleeps):
+    modified = 'Sun, 18 Oct 2026 12:00:00 GMT'
+    session = StubSession(make_response(200, b'buoy', {'Last-Modified': modified}), make_response(304))
+    client = make_client(session)
+    parse = CountingParser()
+
+    first = client.get_conditional(URL, parse)
+    second = client.get_conditional(URL, parse)
+
+    assert second is first
+    assert parse.calls == 1
+    assert session.calls[1]['headers']['If-Modified-Since'] == modified
+    assert 'If-None-Match' not in session.calls[1]['headers']
+
+
+def test_validators_are_kept_per_url_and_parameters(sleeps):
+    session = StubSession(make_response(200, b'a', {'ETag': '"a"'}), make_response(200, b'b', {'ETag': '"b"'}))
+    client = make_client(session)
+    parse = CountingParser()
+
+    client.get_conditional(URL, parse, params={'minmagnitude': 4})
+    client.get_conditional(URL, parse, params={'minmagnitude': 6})
+
+    assert parse.calls == 2
+    assert 'If-None-Match' not in session.calls[1]['headers']
+
+
+def test_unchanged_body_skips_parsing_without_validators(sleeps):
+    session = StubSession(make_response(200, b'same'), make_response(200, b'same'),
+                          make_response(200, b'changed'))
+    client = make_client(session)
+    parse = CountingParser()
+
+    first = client.get_conditional(URL, parse, source='ioc')
+    second = client.get_conditional(URL, parse, source='ioc')
+    third = client.get_conditional(URL, parse, source='ioc')
+
+    assert second is first
+    assert third == {'body': 'changed', 'parse': 2}
+    assert parse.calls == 2
+
+    stats = client.get_stats()['conditional']['ioc']
+    assert stats['unchanged'] == 1
+    assert stats['parsed'] == 2
+
+
+def test_error_status_raises_and_keeps_the_previous_entry(sleeps):
+    session = StubSession(make_response(200, b'v1', {'ETag': '"v1"'}), make_response(404), make_response(304))
+    client = make_client(session)
+    parse = CountingParser()
+
+    first = client.get_conditional(URL, parse)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get_conditional(URL, parse)
+
+    assert client.get_conditional(URL, parse) is first
+    assert session.calls[2]['headers']['If-None-Match'] == '"v1"'
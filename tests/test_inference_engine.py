@@ -0,0 +1,218 @@
+"""
+Tests for the multi-event tsunami check in RealTimeInferenceEngine
+
+The engine is built without its collectors, model files or threads: the
+store, scheduler, model version, India filter and risk assessor are stubs,
+so each check runs the real batching, ranking and publishing code.
+"""
+
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pd = pytest.importorskip('pandas')
+inference_engine = pytest.importorskip('src.inference_engine')
+
+RealTimeInferenceEngine = inference_engine.RealTimeInferenceEngine
+
+
+class StubServed:
+    """Model version that scores each pattern by its mean and records every batch"""
+
+    version = 'v-test'
+
+    def __init__(self):
+        self.batches = []
+
+    def run(self, samples):
+        self.batches.append(samples)
+        return samples.mean(axis=(1, 2)).reshape(-1, 1)
+
+
+class StubScheduler:
+    """Source scheduler answering from fixed values"""
+
+    def __init__(self, values):
+        self.values = values
+
+    def prefetch(self, names):
+        return {}
+
+    def ensure_fresh(self, names, timeout=None):
+        return {name: SimpleNamespace(value=self.values[name]) for name in names}
+
+    def reschedule(self):
+        pass
+
+
+class StubStore:
+    """Latest-value store reporting one version per source"""
+
+    def __init__(self):
+        self.version = 1
+
+    def describe(self, names):
+        return {name: {'status': 'ok', 'version': self.version} for name in names}
+
+
+class StubIndiaFilter:
+    def assess_india_risk(self, earthquake_data, model_prediction):
+        return {'india_risk_score': earthquake_data['magnitude'] / 10.0}
+
+
+class StubRiskAssessor:
+    """Alert level by magnitude; raises for events listed in ``failing``"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = 0
+
+    def generate_comprehensive_assessment(self, earthquake_data, model_prediction, india_filter_result,
+                                          ocean_conditions, incois_advisories):
+        if earthquake_data['id'] in self.failing:
+            raise ValueError('assessor failure')
+        self.calls += 1
+        magnitude = earthquake_data['magnitude']
+        return {
+            'assessment_id': f"TSUNAMI_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+            'timestamp': (datetime.utcnow() + timedelta(microseconds=self.calls)).isoformat(),
+            'alert_level': 'WARNING' if magnitude >= 8.0 else 'WATCH',
+            'india_at_risk': magnitude >= 8.0,
+            'india_risk_score': india_filter_result['india_risk_score'],
+            'earthquake_info': {'magnitude': magnitude}
+        }
+
+
+def make_engine(earthquakes, failing=()):
+    engine = RealTimeInferenceEngine.__new__(RealTimeInferenceEngine)
+    engine.served = StubServed()
+    engine.model_registry = SimpleNamespace(active=engine.served)
+    engine.seeded_patterns = True
+    engine.store = StubStore()
+    engine.source_scheduler = StubScheduler({
+        'usgs': earthquakes, 'noaa_tides': {}, 'noaa_buoys': {}, 'incois': []
+    })
+    engine.acquisition_timeout = 20.0
+    engine.source_timeouts = dict(inference_engine.DEFAULT_SOURCE_TIMEOUTS)
+    engine.escalation = SimpleNamespace(trigger=lambda *args: False)
+    engine.india_filter = StubIndiaFilter()
+    engine.risk_assessor = StubRiskAssessor(failing)
+    engine._analyze_ocean_conditions = lambda tide_data, buoy_data: {}
+    engine.assessed_events = {}
+    engine._event_assessments = {}
+    engine._events_lock = threading.Lock()
+    engine.current_assessment = None
+    return engine
+
+
+def catalog(*events):
+    """USGS-style catalog rows from (id, magnitude, latitude, longitude, depth) tuples"""
+    now = pd.Timestamp.now('UTC')
+    return pd.DataFrame([{
+        'id': event_id, 'magnitude': magnitude, 'latitude': latitude, 'longitude': longitude,
+        'depth': depth, 'time': now, 'updated': now, 'place': event_id
+    } for event_id, magnitude, latitude, longitude, depth in events])
+
+
+TWO_EVENTS = catalog(('us_a', 7.0, 3.3, 95.9, 30.0), ('us_b', 8.6, 2.3, 93.1, 20.0))
+
+
+def test_check_scores_every_event_in_one_batch():
+    engine = make_engine(TWO_EVENTS)
+
+    assessment = engine.run_tsunami_check()
+
+    assert len(engine.served.batches) == 1
+    batch = engine.served.batches[0]
+    assert batch.shape == (2, 24, 32)
+    # Each row is anchored on its own event, not one shared sequence
+    assert not np.allclose(batch[0], batch[1])
+
+    assert assessment['event_count'] == 2
+    assert [event['earthquake_id'] for event in assessment['events']] == ['us_b', 'us_a']
+    assert [event['rank'] for event in assessment['events']] == [1, 2]
+    assert assessment['alert_level'] == 'WARNING'
+    assert assessment['model_version'] == 'v-test'
+
+    prediction = assessment['events'][1]['model_prediction']
+    assert prediction['risk_probability'] == pytest.approx(float(batch[0].mean()), rel=1e-6)
+    assert prediction['confidence'] == max(prediction['risk_probability'], 1.0 - prediction['risk_probability'])
+    assert prediction['risk_class'] == pytest.approx([1.0 - prediction['risk_probability'],
+                                                      prediction['risk_probability']])
+
+
+def test_rank_assessments_orders_by_alert_level_score_then_magnitude():
+    def event(event_id, alert_level, score, magnitude):
+        return {'earthquake_id': event_id, 'alert_level': alert_level, 'india_risk_score': score,
+                'earthquake_info': {'magnitude': magnitude}}
+
+    assessment = RealTimeInferenceEngine._rank_assessments([
+        event('watch', 'WATCH', 0.9, 9.0),
+        event('warning_low', 'WARNING', 0.5, 8.0),
+        event('warning_high', 'WARNING', 0.7, 7.0),
+        event('warning_low_big', 'WARNING', 0.5, 8.5)
+    ])
+
+    assert [e['earthquake_id'] for e in assessment['events']] == [
+        'warning_high', 'warning_low_big', 'warning_low', 'watch'
+    ]
+    assert assessment['earthquake_id'] == 'warning_high'
+    assert assessment['event_count'] == 4
+
+
+def test_failed_event_does_not_block_the_others():
+    engine = make_engine(TWO_EVENTS, failing={'us_b'})
+
+    assessment = engine.run_tsunami_check()
+
+    assert assessment['event_count'] == 1
+    assert assessment['events'][0]['earthquake_id'] == 'us_a'
+    # The failed event is not recorded, so the next incremental poll retries it
+    assert 'us_b' not in engine.assessed_events
+    assert list(engine._pending_events(TWO_EVENTS)['id']) == ['us_b']
+
+
+def test_check_fails_when_no_event_can_be_assessed():
+    engine = make_engine(TWO_EVENTS, failing={'us_a', 'us_b'})
+
+    assert engine.run_tsunami_check() is None
+    assert engine.current_assessment is None
+
+
+def test_combined_assessment_id_changes_with_its_events_and_sources():
+    first = catalog(('us_a', 7.0, 3.3, 95.9, 30.0))
+    engine = make_engine(first)
+    single = engine.run_tsunami_check()
+
+    # Nothing changed: the same id and timestamp are republished
+    republished = engine._combined_assessment(first, engine._source_status())
+    assert republished['assessment_id'] == single['assessment_id']
+    assert republished['timestamp'] == single['timestamp']
+
+    # A new, lower-ranked event keeps the top event but changes the assessment
+    second = catalog(('us_a', 7.0, 3.3, 95.9, 30.0), ('us_c', 6.6, -5.0, 100.0, 40.0))
+    second['time'] = second['updated'] = first['time'].iloc[0]
+    engine.source_scheduler.values['usgs'] = second
+    multi = engine.run_tsunami_check(incremental=True)
+    assert multi['earthquake_id'] == 'us_a'
+    assert multi['event_count'] == 2
+    assert multi['assessment_id'] != single['assessment_id']
+
+    # A refreshed source changes it too
+    engine.store.version += 1
+    refreshed = engine._combined_assessment(second, engine._source_status())
+    assert refreshed['assessment_id'] != multi['assessment_id']
+
+
+def test_events_missing_parameters_are_skipped():
+    earthquakes = catalog(('us_a', 7.0, 3.3, 95.9, 30.0), ('us_b', 8.6, 2.3, 93.1, None))
+
+    engine = make_engine(earthquakes)
+    assessment = engine.run_tsunami_check()
+
+    assert engine.served.batches[0].shape == (1, 24, 32)
+    assert not np.isnan(engine.served.batches[0]).any()
+    assert [event['earthquake_id'] for event in assessment['events']] == ['us_a']
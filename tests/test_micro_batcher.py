@@ -0,0 +1,120 @@
+"""
+Tests for the micro-batching queue in front of the binary model
+"""
+
+import threading
+import time
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('loguru')
+
+from src.serving.micro_batcher import MicroBatcher
+
+
+class RecordingModel:
+    """predict_fn doubling its input and recording every batch it was called with"""
+
+    def __init__(self, error=None):
+        self.batches = []
+        self.error = error
+        self.lock = threading.Lock()
+
+    def __call__(self, inputs):
+        with self.lock:
+            self.batches.append(inputs.copy())
+        if self.error is not None:
+            raise self.error
+        return inputs * 2.0
+
+
+@pytest.fixture
+def batchers():
+    created = []
+
+    def make(predict_fn, **kwargs):
+        batcher = MicroBatcher(predict_fn, name='test', **kwargs)
+        created.append(batcher)
+        return batcher
+
+    yield make
+    for batcher in created:
+        batcher.stop()
+
+
+def samples(count, value=1.0):
+    return np.full((count, 2), value, dtype=np.float32)
+
+
+def test_full_batch_is_flushed_without_waiting_for_the_window(batchers):
+    model = RecordingModel()
+    batcher = batchers(model, max_batch_size=4, max_wait_ms=10000)
+
+    start = time.perf_counter()
+    futures = [batcher.submit(samples(1, i)) for i in range(4)]
+    for future in futures:
+        future.result(timeout=5)
+
+    assert time.perf_counter() - start < 5
+    assert [len(batch) for batch in model.batches] == [4]
+
+
+def test_partial_batch_is_flushed_when_the_window_closes(batchers):
+    model = RecordingModel()
+    batcher = batchers(model, max_batch_size=32, max_wait_ms=20)
+
+    result = batcher.predict(samples(3), timeout=5)
+
+    assert result.shape == (3, 2)
+    assert [len(batch) for batch in model.batches] == [3]
+    assert batcher.get_stats()['batches'] == 1
+
+
+def test_request_over_the_size_limit_is_carried_to_the_next_batch(batchers):
+    model = RecordingModel()
+    batcher = batchers(model, max_batch_size=4, max_wait_ms=200)
+
+    futures = [batcher.submit(samples(3)), batcher.submit(samples(3))]
+    for future in futures:
+        future.result(timeout=5)
+
+    assert [len(batch) for batch in model.batches] == [3, 3]
+
+
+def test_each_request_gets_its_own_slice_of_the_batch(batchers):
+    model = RecordingModel()
+    batcher = batchers(model, max_batch_size=32, max_wait_ms=500)
+
+    inputs = [samples(1, 1.0), samples(2, 2.0), samples(3, 3.0)]
+    futures = [batcher.submit(batch) for batch in inputs]
+    results = [future.result(timeout=5) for future in futures]
+
+    assert [len(batch) for batch in model.batches] == [6]
+    for batch, result in zip(inputs, results):
+        np.testing.assert_array_equal(result, batch * 2.0)
+
+
+def test_failed_batch_fails_every_request_in_it(batchers):
+    model = RecordingModel(error=ValueError('model exploded'))
+    batcher = batchers(model, max_batch_size=32, max_wait_ms=500)
+
+    futures = [batcher.submit(samples(count)) for count in (1, 2, 3)]
+
+    for future in futures:
+        with pytest.raises(ValueError, match='model exploded'):
+            future.result(timeout=5)
+    assert len(model.batches) == 1
+    assert batcher.get_stats()['errors'] == 1
+
+    # The worker keeps serving after a failed batch
+    model.error = None
+    np.testing.assert_array_equal(batcher.predict(samples(1), timeout=5), samples(1) * 2.0)
+
+
+def test_submit_after_stop_is_rejected(batchers):
+    batcher = batchers(RecordingModel(), max_wait_ms=1)
+    batcher.stop()
+
+    with pytest.raises(RuntimeError):
+        batcher.submit(samples(1))
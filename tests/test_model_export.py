@@ -0,0 +1,41 @@
+"""
+Tests for the TFLite export of the binary model
+"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('loguru')
+
+from src.serving.backends import TFLiteBackend
+from src.serving.model_export import export_tflite, representative_dataset
+
+
+def test_tflite_export_freezes_a_larger_batch(tiny_keras_model, tmp_path):
+    model, _ = tiny_keras_model
+    path = export_tflite(model, tmp_path / 'batch4.tflite', batch_size=4)
+
+    backend = TFLiteBackend(path)
+    assert backend.batch_size == 4
+    assert backend.input_shape == (24, 32)
+
+    # Two full batches and a padded partial one
+    samples = np.random.default_rng(1).normal(size=(10, 24, 32)).astype(np.float32)
+    np.testing.assert_allclose(backend.predict(samples), model.predict(samples, verbose=0), atol=1e-5)
+
+
+def test_int8_export_needs_calibration_windows(tiny_keras_model, tmp_path):
+    model, _ = tiny_keras_model
+
+    with pytest.raises(ValueError, match='calibration_windows'):
+        export_tflite(model, tmp_path / 'int8.tflite', quantization='int8')
+    with pytest.raises(ValueError, match='Unknown quantization'):
+        export_tflite(model, tmp_path / 'fp16.tflite', quantization='fp16')
+
+
+def test_representative_dataset_yields_whole_batches():
+    windows = np.zeros((10, 24, 32), dtype=np.float32)
+
+    batches = list(representative_dataset(windows, batch_size=4)())
+
+    assert [batch[0].shape for batch in batches] == [(4, 24, 32), (4, 24, 32)]
@@ -0,0 +1,170 @@
+"""
+Tests for versioned model serving: swaps, rollback, the pin file and the
+micro-batcher lifecycle around a pre-fork
+"""
+
+import threading
+import time
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('loguru')
+
+from src.serving.micro_batcher import MicroBatcher
+from src.serving.model_registry import PIN_FILE, ModelRegistry
+
+ARTIFACT = 'model.onnx'
+
+
+class FakeModel:
+    """Scores every sample with a constant that identifies its version"""
+
+    def __init__(self, score):
+        self.score = score
+        self.calls = 0
+
+    def predict(self, samples):
+        self.calls += 1
+        return np.full((len(samples), 1), self.score, dtype=np.float32)
+
+
+def add_version(root, name, score):
+    version_dir = root / name
+    version_dir.mkdir(parents=True)
+    (version_dir / ARTIFACT).write_text(str(score))
+
+
+@pytest.fixture
+def registry(tmp_path):
+    loads = []
+
+    def load_fn(path):
+        loads.append(path.name)
+        return FakeModel(float((path / ARTIFACT).read_text()))
+
+    def batcher_fn(served):
+        return MicroBatcher(served.predict, max_wait_ms=1, name=served.version, result_timeout_ms=1000)
+
+    registry = ModelRegistry(tmp_path / 'registry', ARTIFACT, load_fn, batcher_fn=batcher_fn,
+                             settle_seconds=0, name='test')
+    registry.loads = loads
+    yield registry
+    registry.stop()
+
+
+def samples(count=2):
+    return np.zeros((count, 24, 32), dtype=np.float32)
+
+
+def test_newest_version_is_swapped_in_and_the_replaced_one_kept(registry):
+    add_version(registry.root, 'v1', 0.1)
+    assert registry.check()
+    add_version(registry.root, 'v10', 0.3)
+    add_version(registry.root, 'v2', 0.2)
+
+    assert registry.check()
+    assert registry.active.version == 'v10'
+    assert registry.previous.version == 'v1'
+    assert registry.active.run(samples()).tolist() == [[pytest.approx(0.3)]] * 2
+    # Nothing new: no load, no swap
+    assert not registry.check()
+    assert registry.loads == ['v1', 'v10']
+
+
+def test_version_from_two_swaps_ago_is_closed(registry):
+    add_version(registry.root, 'v1', 0.1)
+    registry.check()
+    first = registry.active
+    for name, score in (('v2', 0.2), ('v3', 0.3)):
+        add_version(registry.root, name, score)
+        registry.check()
+
+    assert registry.active.version == 'v3'
+    assert registry.previous.version == 'v2'
+    assert first.batcher is None
+
+
+def test_rollback_swaps_back_without_loading_and_pins(registry):
+    add_version(registry.root, 'v1', 0.1)
+    registry.check()
+    add_version(registry.root, 'v2', 0.2)
+    registry.check()
+
+    served = registry.rollback()
+
+    assert served.version == 'v1'
+    assert registry.active is served
+    assert registry.previous.version == 'v2'
+    assert registry.loads == ['v1', 'v2']
+    assert (registry.root / PIN_FILE).read_text().strip() == 'v1'
+    # The pin keeps the watcher on v1 although v2 is newer
+    assert not registry.check()
+    assert registry.get_stats()['rollbacks'] == 1
+
+
+def test_rollback_needs_a_previous_version(registry):
+    add_version(registry.root, 'v1', 0.1)
+    registry.check()
+
+    with pytest.raises(RuntimeError, match='no previous version'):
+        registry.rollback()
+
+
+def test_pin_file_selects_the_served_version(registry):
+    add_version(registry.root, 'v1', 0.1)
+    add_version(registry.root, 'v2', 0.2)
+
+    registry.pin('v1')
+    assert registry.target() == 'v1'
+    registry.check()
+    assert registry.active.version == 'v1'
+
+    # Unpinning returns to the newest version
+    registry.unpin()
+    assert registry.check()
+    assert registry.active.version == 'v2'
+
+    # A pin naming a missing version is ignored
+    registry.pin('v9')
+    assert registry.target() == 'v2'
+    assert not registry.check()
+
+
+def test_batchers_are_resumed_after_a_fork_cycle_without_the_watcher(registry):
+    add_version(registry.root, 'v1', 0.1)
+    registry.check()
+    active = registry.active
+    assert active.batcher is not None
+
+    # prepare_fork(): the watcher and every batcher are stopped
+    registry.stop()
+    assert active.batcher is None
+    # Still serves, directly on the model
+    assert active.run(samples(1)).tolist() == [[pytest.approx(0.1)]]
+
+    # after_fork() with registry watching disabled
+    registry.resume_batchers()
+    assert active.batcher is not None
+    assert not registry.is_running
+    assert active.run(samples(3)).shape == (3, 1)
+    assert active.batcher.get_stats()['requests'] == 1
+
+
+def test_run_falls_back_to_the_model_when_the_batch_stalls(registry):
+    add_version(registry.root, 'v1', 0.1)
+    registry.check()
+    active = registry.active
+
+    release = threading.Event()
+    stalled = MicroBatcher(lambda batch: release.wait(5) and active.model.predict(batch),
+                           max_wait_ms=1, name='stalled', result_timeout_ms=50)
+    active.batcher.stop()
+    active.batcher = stalled
+    try:
+        start = time.monotonic()
+        result = active.run(samples(1))
+        assert time.monotonic() - start < 1.0
+        assert result.tolist() == [[pytest.approx(0.1)]]
+    finally:
+        release.set()
@@ -0,0 +1,148 @@
+"""
+Tests for the binary tensor request/response encodings
+"""
+
+import io
+import struct
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from src.serving import payloads
+from src.serving.payloads import (
+    MSGPACK_CONTENT_TYPE, NPY_CONTENT_TYPE, RAW_CONTENT_TYPE, PayloadError,
+    decode_tensor_request, encode_msgpack, encode_npy, encode_prediction_response, encode_raw
+)
+
+
+def batch(shape=(2, 24, 32)):
+    return np.arange(np.prod(shape), dtype=np.float32).reshape(shape) / 7.0
+
+
+def npy_body(array):
+    """A .npy body holding the array in its own dtype (encode_npy always writes float32)"""
+    stream = io.BytesIO()
+    np.save(stream, array, allow_pickle=False)
+    return stream.getvalue()
+
+
+@pytest.fixture
+def with_msgpack():
+    pytest.importorskip('msgpack')
+
+
+def test_raw_round_trip():
+    tensor = batch()
+
+    decoded, options = decode_tensor_request(encode_raw(tensor), RAW_CONTENT_TYPE)
+
+    np.testing.assert_array_equal(decoded, tensor)
+    assert decoded.dtype == np.float32
+    assert options == {}
+
+
+def test_npy_round_trip():
+    tensor = batch()
+
+    decoded, options = decode_tensor_request(encode_npy(tensor), NPY_CONTENT_TYPE)
+
+    np.testing.assert_array_equal(decoded, tensor)
+    assert decoded.dtype == np.float32
+    assert options == {}
+
+
+def test_npy_numeric_dtypes_are_converted_to_float32():
+    tensor = np.arange(24 * 32, dtype=np.int64).reshape(24, 32)
+
+    decoded, _ = decode_tensor_request(npy_body(tensor), NPY_CONTENT_TYPE)
+
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, tensor.astype(np.float32))
+
+
+def test_msgpack_round_trip_keeps_request_options(with_msgpack):
+    tensor = batch()
+
+    body = encode_msgpack({'samples': tensor, 'threshold': 0.3})
+    decoded, options = decode_tensor_request(body, MSGPACK_CONTENT_TYPE, field='samples')
+
+    np.testing.assert_array_equal(decoded, tensor)
+    assert decoded.dtype == np.float32
+    assert options == {'threshold': 0.3}
+
+
+def test_msgpack_prediction_response_round_trip(with_msgpack):
+    probabilities = np.array([0.05, 0.8], dtype=np.float32)
+
+    body = encode_prediction_response(probabilities, probabilities > 0.1, 0.1, MSGPACK_CONTENT_TYPE)
+    response = payloads.decode_msgpack(body)
+
+    np.testing.assert_array_equal(response['probabilities'], probabilities)
+    np.testing.assert_array_equal(response['alerts'], [0.0, 1.0])
+    assert response['threshold'] == pytest.approx(0.1)
+
+
+@pytest.mark.parametrize('array', [
+    np.array(['a', 'b']),
+    np.array([1 + 2j, 3 + 4j]),
+], ids=['unicode', 'complex'])
+def test_npy_rejects_non_numeric_dtype(array):
+    with pytest.raises(PayloadError, match='dtype'):
+        decode_tensor_request(npy_body(array), NPY_CONTENT_TYPE)
+
+
+def test_msgpack_rejects_non_numeric_dtype(with_msgpack):
+    body = encode_msgpack({'data': np.array([1 + 2j], dtype=np.complex64)})
+
+    with pytest.raises(PayloadError, match='dtype'):
+        decode_tensor_request(body, MSGPACK_CONTENT_TYPE)
+
+
+def test_msgpack_rejects_non_numeric_list(with_msgpack):
+    body = encode_msgpack({'data': [['a', 'b']]})
+
+    with pytest.raises(PayloadError, match='numeric'):
+        decode_tensor_request(body, MSGPACK_CONTENT_TYPE)
+
+
+def test_raw_rejects_shape_that_does_not_match_the_data():
+    body = struct.pack('<4I', 3, 2, 24, 31) + batch().tobytes()
+
+    with pytest.raises(PayloadError, match='does not match shape'):
+        decode_tensor_request(body, RAW_CONTENT_TYPE)
+
+
+def test_raw_rejects_invalid_number_of_dimensions():
+    body = struct.pack('<I', 0) + batch().tobytes()
+
+    with pytest.raises(PayloadError, match='dimensions'):
+        decode_tensor_request(body, RAW_CONTENT_TYPE)
+
+
+def test_npy_rejects_shape_that_does_not_match_the_data():
+    body = npy_body(batch())
+    # Keep the header (declaring 2x24x32) but append an extra sample's worth of data
+    body += batch((1, 24, 32)).tobytes()
+
+    with pytest.raises(PayloadError, match='does not match shape'):
+        decode_tensor_request(body, NPY_CONTENT_TYPE)
+
+
+@pytest.mark.parametrize('cut', [2, 10, -4], ids=['ndim', 'shape header', 'data'])
+def test_raw_rejects_truncated_body(cut):
+    with pytest.raises(PayloadError):
+        decode_tensor_request(encode_raw(batch())[:cut], RAW_CONTENT_TYPE)
+
+
+@pytest.mark.parametrize('cut', [4, 40, -4], ids=['magic', 'header', 'data'])
+def test_npy_rejects_truncated_body(cut):
+    with pytest.raises(PayloadError):
+        decode_tensor_request(encode_npy(batch())[:cut], NPY_CONTENT_TYPE)
+
+
+def test_msgpack_rejects_truncated_body(with_msgpack):
+    body = encode_msgpack({'data': batch()})
+
+    with pytest.raises(PayloadError):
+        decode_tensor_request(body[:-4], MSGPACK_CONTENT_TYPE)
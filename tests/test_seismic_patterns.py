@@ -0,0 +1,84 @@
+"""
+Tests for the vectorized seismic pattern generator
+"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pd = pytest.importorskip('pandas')
+
+from src.serving.seismic_patterns import (
+    catalog_complete_mask, complete_mask, create_seismic_patterns, patterns_from_catalog
+)
+
+
+def scalar_pattern(magnitude, depth, latitude, longitude):
+    """The original per-cell loop from app.create_seismic_pattern, without its noise"""
+    pattern = np.zeros((24, 32))
+    magnitude_factor = magnitude / 10.0
+    depth_factor = max(0.1, 1.0 - (depth / 700.0))
+    for t in range(24):
+        for f in range(32):
+            base = magnitude_factor * depth_factor
+            time_evolution = np.sin(t * np.pi / 24) * (t / 24)
+            freq_component = np.cos(2 * np.pi * f / 32)
+            pattern[t, f] = base * (0.3 + 0.5 * time_evolution + 0.2 * freq_component)
+    return np.clip(pattern, 0, 1.0)
+
+
+EVENTS = [
+    # magnitude, depth, latitude, longitude
+    (9.1, 30.0, 3.3, 95.9),
+    (6.5, 10.0, -5.0, 100.0),
+    (7.8, 650.0, 2.3, 93.1),
+    (8.2, 800.0, 10.0, 80.0),  # deeper than the depth factor floor
+]
+
+
+def test_vectorized_patterns_match_the_scalar_reference():
+    magnitude, depth, latitude, longitude = map(np.array, zip(*EVENTS))
+
+    patterns = create_seismic_patterns(magnitude, depth, latitude, longitude, noise_scale=0)
+
+    assert patterns.shape == (len(EVENTS), 24, 32)
+    assert patterns.dtype == np.float32
+    for pattern, event in zip(patterns, EVENTS):
+        np.testing.assert_allclose(pattern, scalar_pattern(*event), atol=1e-6)
+
+
+def test_seeded_noise_does_not_depend_on_the_batch():
+    magnitude, depth, latitude, longitude = map(np.array, zip(*EVENTS))
+    ids = ['a', 'b', 'c', 'd']
+
+    batch = create_seismic_patterns(magnitude, depth, latitude, longitude, event_ids=ids)
+    alone = create_seismic_patterns(*EVENTS[2], event_ids=['c'])
+
+    np.testing.assert_array_equal(batch[2], alone[0])
+    assert not np.array_equal(batch[0], create_seismic_patterns(*EVENTS[0], event_ids=['x'])[0])
+
+
+def test_complete_mask_flags_missing_parameters():
+    mask = complete_mask([7.0, None, 6.8, 7.1], [10.0, 10.0, np.nan, 10.0],
+                         [1.0, 1.0, 1.0, 1.0], [2.0, 2.0, 2.0, None])
+
+    assert mask.tolist() == [True, False, False, False]
+
+
+def test_missing_parameters_are_rejected_instead_of_scored():
+    with pytest.raises(ValueError, match='1 of 2 earthquakes'):
+        create_seismic_patterns([7.0, None], [10.0, 10.0], [1.0, 1.0], [2.0, 2.0])
+
+
+def test_catalog_rows_with_missing_values_are_flagged():
+    catalog = pd.DataFrame([
+        {'id': 'ok', 'magnitude': 7.0, 'depth': 10.0, 'latitude': 1.0, 'longitude': 2.0},
+        {'id': 'no_mag', 'magnitude': None, 'depth': 10.0, 'latitude': 1.0, 'longitude': 2.0},
+        {'id': 'no_depth', 'magnitude': 7.2, 'depth': None, 'latitude': 1.0, 'longitude': 2.0},
+    ])
+
+    complete = catalog_complete_mask(catalog)
+
+    assert complete.tolist() == [True, False, False]
+    with pytest.raises(ValueError):
+        patterns_from_catalog(catalog)
+    assert patterns_from_catalog(catalog[complete]).shape == (1, 24, 32)
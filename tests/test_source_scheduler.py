@@ -0,0 +1,185 @@
+"""
+Tests for the per-source refresh schedule and the latest-value store
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('loguru')
+
+from src.data_collection.source_scheduler import LatestValueStore, RefreshPolicy, SourceScheduler
+
+
+class FakeFetch:
+    """Fetch function returning scripted values, optionally blocking until released"""
+
+    def __init__(self, *values, block=False):
+        self.values = list(values)
+        self.calls = 0
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            value = self.values[min(self.calls, len(self.values)) - 1]
+        self.release.wait(5)
+        return value
+
+
+@pytest.fixture
+def schedulers():
+    created = []
+
+    def make(**kwargs):
+        scheduler = SourceScheduler(**kwargs)
+        created.append(scheduler)
+        return scheduler
+
+    yield make
+    for scheduler in created:
+        scheduler.stop()
+
+
+def test_schedule_skips_missed_slots_and_keeps_the_grid(schedulers):
+    scheduler = schedulers()
+    scheduler.register('tides', FakeFetch({}), RefreshPolicy(cadence_seconds=10))
+    source = scheduler._sources['tides']
+
+    # First slot: one cadence after now
+    scheduler._schedule(source, now=100.0)
+    assert source.next_due == 110.0
+
+    # A fetch ran long past the 110, 120 and 130 slots: they are skipped, not replayed
+    scheduler._schedule(source, now=135.0)
+    assert source.next_due == 140.0
+
+    # On time: the next slot on the grid
+    scheduler._schedule(source, now=140.0)
+    assert source.next_due == 150.0
+
+
+def test_schedule_leaves_load_once_sources_unscheduled(schedulers):
+    scheduler = schedulers()
+    scheduler.register('grid', FakeFetch({}), RefreshPolicy(cadence_seconds=None))
+    source = scheduler._sources['grid']
+
+    scheduler._schedule(source, now=100.0)
+
+    assert source.next_due is None
+
+
+def test_reschedule_shortens_the_wait_to_the_new_cadence(schedulers):
+    cadences = {'buoys': 60.0}
+    fetch = FakeFetch({'v': 1})
+    scheduler = schedulers(cadence_fn=cadences.get)
+    scheduler.register('buoys', fetch, RefreshPolicy(cadence_seconds=60))
+
+    scheduler.start()
+    deadline = time.monotonic() + 2
+    while fetch.calls < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert fetch.calls == 1
+    assert scheduler.get_stats()['sources']['buoys']['next_refresh_in_seconds'] > 50
+
+    # Escalation: the next refresh is due one new cadence after the last fetch
+    cadences['buoys'] = 0.2
+    scheduler.reschedule()
+    assert scheduler.get_stats()['sources']['buoys']['next_refresh_in_seconds'] <= 0.2
+
+    deadline = time.monotonic() + 2
+    while fetch.calls < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert fetch.calls >= 2
+
+
+def test_ensure_fresh_joins_a_fetch_in_flight(schedulers):
+    fetch = FakeFetch({'advisories': []}, block=True)
+    scheduler = schedulers()
+    scheduler.register('incois', fetch, RefreshPolicy(cadence_seconds=300, ttl_seconds=600), timeout=5)
+
+    results = []
+    readers = [threading.Thread(target=lambda: results.append(scheduler.ensure_fresh(['incois'])))
+               for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    time.sleep(0.1)
+    assert scheduler.get_stats()['sources']['incois']['refreshing']
+    fetch.release.set()
+    for reader in readers:
+        reader.join()
+
+    assert fetch.calls == 1
+    assert len(results) == 4
+    assert all(result['incois'].value == {'advisories': []} for result in results)
+    # Fresh now: no further fetch
+    scheduler.ensure_fresh(['incois'])
+    assert fetch.calls == 1
+
+
+def test_ensure_fresh_gives_up_at_the_source_timeout(schedulers):
+    fetch = FakeFetch({}, block=True)
+    scheduler = schedulers()
+    scheduler.register('usgs', fetch, RefreshPolicy(cadence_seconds=60), timeout=0.1)
+
+    start = time.monotonic()
+    values = scheduler.ensure_fresh(['usgs'])
+    fetch.release.set()
+
+    assert time.monotonic() - start < 1.0
+    assert values == {'usgs': None}
+
+
+def test_unchanged_refresh_keeps_the_version_and_value(schedulers):
+    first, same, changed = {'stations': [1.0, 2.0]}, {'stations': [1.0, 2.0]}, {'stations': [1.0, 2.5]}
+    scheduler = schedulers(store=LatestValueStore())
+    scheduler.register('tides', FakeFetch(first, same, changed), RefreshPolicy(cadence_seconds=60))
+
+    scheduler.refresh('tides')
+    entry = scheduler.store.get('tides')
+    assert entry.version == 1
+
+    scheduler.refresh('tides')
+    renewed = scheduler.store.get('tides')
+    assert renewed.version == 1
+    assert renewed.value is first
+    assert renewed is not entry  # the age is renewed
+
+    scheduler.refresh('tides')
+    assert scheduler.store.get('tides').version == 2
+    assert scheduler.store.describe(['tides'])['tides']['version'] == 2
+
+
+def test_store_compares_frames_by_content():
+    pd = pytest.importorskip('pandas')
+    store = LatestValueStore()
+
+    assert store.put('usgs', pd.DataFrame({'id': ['a'], 'magnitude': [7.0]}))
+    assert not store.put('usgs', pd.DataFrame({'id': ['a'], 'magnitude': [7.0]}))
+    assert store.put('usgs', pd.DataFrame({'id': ['a'], 'magnitude': [7.1]}))
+    assert store.versions(['usgs', 'incois']) == {'usgs': 2, 'incois': 0}
+
+
+def test_failed_refresh_keeps_the_previous_value(schedulers):
+    scheduler = schedulers()
+    fetch = FakeFetch({'v': 1}, RuntimeError('upstream down'))
+
+    def flaky():
+        value = fetch()
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    scheduler.register('noaa', flaky, RefreshPolicy(cadence_seconds=60))
+    scheduler.refresh('noaa')
+    with pytest.raises(RuntimeError):
+        scheduler.refresh('noaa')
+
+    status = scheduler.store.describe(['noaa'])['noaa']
+    assert scheduler.store.get('noaa').value == {'v': 1}
+    assert status['version'] == 1
+    assert status['last_error'] == 'upstream down'
@@ -0,0 +1,129 @@
+"""
+Tests for the chunked /batch-predict stream readers and writers
+"""
+
+import io
+import json
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from src.serving.payloads import PayloadError
+from src.serving.streaming import (
+    END_OF_STREAM_FRAME, encode_frame, encode_ndjson_line, iter_chunks,
+    iter_frame_samples, iter_ndjson_samples
+)
+
+
+class TrickleStream(io.RawIOBase):
+    """Request body delivered a few bytes per read, like a slow chunked upload"""
+
+    def __init__(self, data, chunk=3):
+        self.data = data
+        self.position = 0
+        self.chunk = chunk
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self.chunk, len(self.data) - self.position)
+        buffer[:size] = self.data[self.position:self.position + size]
+        self.position += size
+        return size
+
+
+def samples(count, start=0.0):
+    return (np.arange(count * 24 * 32, dtype=np.float32).reshape(count, 24, 32) + start) / 100.0
+
+
+def ndjson_body(*arrays, field=None):
+    lines = []
+    for array in arrays:
+        record = array.tolist() if field is None else {field: array.tolist()}
+        lines.append(json.dumps(record) + '\n')
+    return ''.join(lines).encode('utf-8')
+
+
+def test_ndjson_lines_split_across_reads():
+    first, second = samples(1)[0], samples(2, start=7.0)
+    body = ndjson_body(first) + b'\n' + ndjson_body(second, field='sample')
+
+    decoded = list(iter_ndjson_samples(io.BufferedReader(TrickleStream(body), buffer_size=16)))
+
+    assert len(decoded) == 2
+    np.testing.assert_allclose(decoded[0], first)
+    np.testing.assert_allclose(decoded[1], second)
+
+
+def test_frames_split_across_reads():
+    first, second = samples(1), samples(3, start=5.0)
+    body = encode_frame(first) + encode_frame(second) + END_OF_STREAM_FRAME
+
+    decoded = list(iter_frame_samples(TrickleStream(body, chunk=5)))
+
+    assert len(decoded) == 2
+    np.testing.assert_array_equal(decoded[0], first)
+    np.testing.assert_array_equal(decoded[1], second)
+
+
+def test_frames_stop_at_end_of_stream_frame_or_eof():
+    frame = encode_frame(samples(1))
+
+    assert len(list(iter_frame_samples(io.BytesIO(frame + END_OF_STREAM_FRAME + frame)))) == 1
+    assert len(list(iter_frame_samples(io.BytesIO(frame)))) == 1
+
+
+def test_iter_chunks_regroups_samples_and_yields_the_trailing_partial_chunk():
+    data = samples(7)
+    # Mixed single samples and small batches, not aligned with the chunk size
+    incoming = [data[0], data[1:4], data[4], data[5:7]]
+
+    chunks = [chunk.copy() for chunk in iter_chunks(iter(incoming), 3, (24, 32))]
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    np.testing.assert_array_equal(np.concatenate(chunks), data)
+
+
+def test_iter_chunks_rejects_wrong_sample_shape():
+    incoming = [samples(2), np.zeros((1, 24, 31), dtype=np.float32)]
+
+    chunks = iter_chunks(iter(incoming), 4, (24, 32))
+
+    with pytest.raises(PayloadError, match='Expected samples of shape'):
+        list(chunks)
+
+
+def test_ndjson_error_mid_stream_after_good_chunks():
+    body = ndjson_body(*samples(4)) + b'{"sample": [1, 2\n' + ndjson_body(*samples(2))
+
+    chunks = iter_chunks(iter_ndjson_samples(io.BytesIO(body)), 2, (24, 32))
+
+    assert len(next(chunks)) == 2
+    assert len(next(chunks)) == 2
+    with pytest.raises(PayloadError, match='line 5'):
+        next(chunks)
+
+
+def test_frame_truncated_mid_stream():
+    body = encode_frame(samples(2)) + encode_frame(samples(2))[:-10]
+
+    decoded = iter_frame_samples(TrickleStream(body, chunk=64))
+
+    assert len(next(decoded)) == 2
+    with pytest.raises(PayloadError, match='middle of a frame'):
+        next(decoded)
+
+
+def test_oversized_frame_is_refused_before_reading_it():
+    body = (2 ** 31).to_bytes(4, 'little') + b'\0' * 16
+
+    with pytest.raises(PayloadError, match='exceeds'):
+        list(iter_frame_samples(io.BytesIO(body)))
+
+
+def test_encode_ndjson_line_is_one_compact_line():
+    line = encode_ndjson_line({'chunk': 0, 'probabilities': [0.5]})
+
+    assert line == b'{"chunk":0,"probabilities":[0.5]}\n'
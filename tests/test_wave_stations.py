@@ -0,0 +1,114 @@
+"""
+Tests for the concurrent /wave-data station fan-out
+
+A stub HTTP client answers each IOC station and DART buoy after a chosen
+delay, so the deadlines and early returns run without the network.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip('numpy')
+pytest.importorskip('loguru')
+wave_stations = pytest.importorskip('src.data_collection.wave_stations')
+
+READINGS = [{'time': '2026-10-18 12:00', 'value': 1.0, 'quality': 'measured'}] * 10
+
+
+class StubHTTPClient:
+    """
+    get_conditional answering per IOC code / DART buoy
+
+    ``plan`` maps a code or buoy id to (delay in seconds, readings or an
+    exception); unlisted sources fail at once.
+    """
+
+    def __init__(self, plan):
+        self.plan = plan
+        self.requested = []
+
+    def _answer(self, url, params):
+        key = params['code'].lower() if params else url.rsplit('/', 1)[-1].split('.')[0]
+        self.requested.append(key)
+        return self.plan.get(key, (0.0, ConnectionError('unreachable')))
+
+    def get_conditional(self, url, parse, params=None, **kwargs):
+        delay, outcome = self._answer(url, params)
+        time.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class AsyncStubHTTPClient(StubHTTPClient):
+    async def get_conditional(self, url, parse, params=None, **kwargs):
+        delay, outcome = self._answer(url, params)
+        await asyncio.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def fetch(plan, **kwargs):
+    client = StubHTTPClient(plan)
+    start = time.monotonic()
+    result = wave_stations.fetch_station_entries(http_client=client, **kwargs)
+    return result, time.monotonic() - start
+
+
+def test_returns_once_ioc_data_arrives_without_waiting_for_dart_backup():
+    # Chennai's IOC answers at once; its DART backup would take far longer
+    result, elapsed = fetch({'ched': (0.0, READINGS), '23401': (3.0, READINGS)},
+                            station_ids=['chennai'], station_timeout=5.0, total_timeout=5.0)
+
+    assert elapsed < 1.5
+    assert result['entries']['chennai']['source'] == 'IOC Sea Level Station'
+    assert result['timed_out'] == []
+
+
+def test_failed_ioc_station_falls_back_to_dart_as_soon_as_it_answers():
+    result, elapsed = fetch({'ched': (0.0, ConnectionError('down')), '23401': (0.2, READINGS)},
+                            station_ids=['chennai'], station_timeout=5.0, total_timeout=5.0)
+
+    assert elapsed < 1.5
+    assert result['entries']['chennai']['source'] == 'NOAA DART Buoy'
+
+
+def test_slow_station_is_simulated_at_its_own_deadline(monkeypatch):
+    okha, mumbai = wave_stations.WAVE_STATIONS['arabian']['stations']
+    monkeypatch.setitem(wave_stations.WAVE_STATIONS['arabian'], 'stations', [{**okha, 'timeout': 0.3}, mumbai])
+
+    result, elapsed = fetch({'okha': (2.0, READINGS), 'bomb': (0.0, READINGS)},
+                            station_ids=['okha', 'mumbai'], station_timeout=5.0, total_timeout=5.0)
+
+    assert 0.3 <= elapsed < 1.5
+    assert result['timed_out'] == ['okha']
+    assert result['entries']['okha']['real_data'] is False
+    assert result['entries']['mumbai']['real_data'] is True
+
+
+def test_fan_out_is_bounded_by_the_global_deadline():
+    plan = {'ched': (2.0, READINGS), 'visa': (2.0, READINGS), '23401': (2.0, READINGS)}
+
+    result, elapsed = fetch(plan, station_ids=['chennai', 'vizag'], station_timeout=5.0, total_timeout=0.3)
+
+    assert elapsed < 1.5
+    assert sorted(result['timed_out']) == ['chennai', 'vizag']
+
+
+def test_async_fan_out_returns_once_ioc_data_arrives():
+    client = AsyncStubHTTPClient({'ched': (0.0, READINGS), 'port': (0.1, READINGS), '23401': (3.0, READINGS)})
+
+    async def run():
+        start = time.monotonic()
+        result = await wave_stations.fetch_station_entries_async(
+            station_ids=['chennai', 'portblair'], station_timeout=5.0, total_timeout=5.0, http_client=client)
+        return result, time.monotonic() - start
+
+    result, elapsed = asyncio.run(run())
+
+    assert elapsed < 1.5
+    assert {entry['source'] for entry in result['entries'].values()} == {'IOC Sea Level Station'}
+    assert result['timed_out'] == []